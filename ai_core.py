@@ -0,0 +1,242 @@
+# Paydo AI PPT 생성 핵심 로직 (KSS 문장 분할 + SBERT 문맥 유사도, Streamlit 없이 import 가능)
+
+import logging
+import re
+import numpy as np
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
+from pptx.dml.color import RGBColor
+from text_width import wrap_paragraphs
+from ppt_core import Slide, add_check_needed_shape, add_end_mark
+from instrumentation import timed
+from topics import section_titles, segment_topics
+
+MODEL_NAME = "jhgan/ko-sbert-nli"
+
+# 불완전 문장 판단 및 병합
+connective_pattern = re.compile(r'^(그리고|하지만|그러나|또한|그래서|즉|또|그러면|그런데)$')
+
+def is_incomplete(sentence):
+    return (
+        sentence.endswith(('은', '는', '이', '가', '을', '를', '에', '으로', '고', '와', '과'))
+        or len(sentence.strip()) < 8
+        or bool(connective_pattern.match(sentence.strip()))
+    )
+
+# 불완전 문장은 다음 문장과 병합
+def merge_incomplete_sentences(sentences):
+    merged_sentences = []
+    buffer = ""
+    for sentence in sentences:
+        if buffer:
+            buffer += " " + sentence
+            if not is_incomplete(sentence):
+                merged_sentences.append(buffer.strip())
+                buffer = ""
+        else:
+            if is_incomplete(sentence):
+                buffer = sentence
+            else:
+                merged_sentences.append(sentence)
+    if buffer:
+        merged_sentences.append(buffer.strip())
+    return merged_sentences
+
+# 대본 전체 문장의 정규화된 임베딩
+# embed(sentences)는 (정규화된 임베딩 배열, 통계 dict)를 반환 (EmbeddingCache.encode 참고)
+def sentence_embeddings(sentences, embed, cache_stats=None):
+    with timed("embed", sentences=len(sentences)):
+        embeddings, stats = embed(sentences)
+    if cache_stats is not None:
+        cache_stats.update(stats)
+    return embeddings
+
+# 인접 문장 간 코사인 유사도 (similarities[k]는 k번째와 k+1번째 문장의 유사도)
+def adjacent_similarities(embeddings):
+    return np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
+
+# 주제별 섹션: 섹션 첫 문장 위치 → 제목 슬라이드 줄 (섹션이 둘 이상일 때만, 첫 섹션 포함)
+@timed("topics")
+def section_title_lines(embeddings, sentences, max_lines_per_slide, max_chars_per_line_ppt):
+    starts = segment_topics(embeddings)
+    if not starts:
+        return {}
+    title_lines = {}
+    for start, title in zip([0, *starts], section_titles(embeddings, sentences, starts)):
+        # 섹션 중심에 가장 가까운 문장을 제목으로, 두 줄이 넘으면 잘라서 말줄임표
+        lines = wrap_paragraphs(title, max_chars_per_line_ppt)
+        limit = min(2, max_lines_per_slide)
+        if len(lines) > limit:
+            lines = lines[:limit - 1] + [lines[limit - 1] + "…"]
+        title_lines[start] = lines
+    return title_lines
+
+# 슬라이드 분할 with 의미 단위 + 문맥 유사도 (sections=True면 주제가 바뀌는 곳마다 제목 슬라이드를 넣음)
+# (문장 분할기와 임베딩 함수는 앱이 프로세스 단위로 만든 것을 넘겨받음)
+def split_text_into_slides_with_similarity(text_paragraphs, max_lines_per_slide, max_chars_per_line_ppt, similarity_threshold=0.85, cache_stats=None, *, sentence_splitter, embed, sections=False):
+    # 모든 문단을 한 번의 kss 호출로 분할 (이전 실행과 같은 문단은 다시 분할하지 않음)
+    with timed("sentence_split"):
+        paragraph_sentences = [
+            merge_incomplete_sentences(sentences)
+            for sentences in sentence_splitter.split(list(text_paragraphs))
+            if sentences
+        ]
+
+    # 기준이 0 이하이고 섹션도 나누지 않으면 임베딩이 필요 없으므로 모델 없이 진행
+    sentences = [sentence for sentences in paragraph_sentences for sentence in sentences]
+    similarities = np.ones(0, dtype=np.float32)
+    title_lines = {}
+    if len(sentences) >= 2 and (similarity_threshold > 0 or sections):
+        embeddings = sentence_embeddings(sentences, embed, cache_stats)
+        if similarity_threshold > 0:
+            similarities = adjacent_similarities(embeddings)
+        if sections:
+            title_lines = section_title_lines(embeddings, sentences, max_lines_per_slide, max_chars_per_line_ppt)
+    return _group_sentences(
+        paragraph_sentences, similarities, max_lines_per_slide, max_chars_per_line_ppt, similarity_threshold, title_lines
+    )
+
+# 문장을 줄 수와 문맥 유사도 기준으로 슬라이드에 묶음
+# (title_lines: 섹션 첫 문장 위치 → 제목 줄. 그 문장 앞에서 슬라이드를 끊고 제목 슬라이드를 넣음)
+@timed("group")
+def _group_sentences(paragraph_sentences, similarities, max_lines_per_slide, max_chars_per_line_ppt, similarity_threshold, title_lines=None):
+    title_lines = title_lines or {}
+    slides = []
+    current_lines = []  # 현재 슬라이드에 쌓인 줄 (여기서 줄바꿈한 그대로 렌더링됨)
+    needs_check = False
+    offset = 0  # 현재 문단 첫 문장의 전체 문장 기준 위치
+
+    for merged_sentences in paragraph_sentences:
+        i = 0
+        while i < len(merged_sentences):
+            sentence = merged_sentences[i]
+            sentence_index = offset + i
+            sentence_lines = wrap_paragraphs(sentence, max_chars_per_line_ppt)
+
+            if sentence_index in title_lines:
+                if current_lines:
+                    slides.append(Slide(current_lines, needs_check))
+                    current_lines = []
+                    needs_check = False
+                slides.append(Slide(title_lines[sentence_index], is_title=True))
+
+            # 짧은 문장은 다음 문장과 합침 (다음 문장이 새 섹션의 시작이면 합치지 않음)
+            if len(sentence_lines) <= 2 and i + 1 < len(merged_sentences) and sentence_index + 1 not in title_lines:
+                next_sentence = merged_sentences[i + 1]
+                merged = sentence + " " + next_sentence
+                merged_lines = wrap_paragraphs(merged, max_chars_per_line_ppt)
+                if len(merged_lines) <= max_lines_per_slide:
+                    sentence = merged
+                    sentence_lines = merged_lines
+                    i += 1
+
+            if len(sentence_lines) > max_lines_per_slide:
+                # 쌓여 있던 슬라이드를 먼저 내보낸 뒤, 긴 문장은 줄 단위로 잘라 '확인 필요'로 표시
+                if current_lines:
+                    slides.append(Slide(current_lines, needs_check))
+                    current_lines = []
+                    needs_check = False
+                for start in range(0, len(sentence_lines), max_lines_per_slide):
+                    slides.append(Slide(sentence_lines[start:start + max_lines_per_slide], True))
+                i += 1
+                continue
+
+            # 앞 문장과 문맥 유사도가 기준보다 낮으면 새 슬라이드에서 시작
+            is_similar = not current_lines or similarity_threshold <= 0 or similarities[sentence_index - 1] >= similarity_threshold
+
+            if len(current_lines) + len(sentence_lines) <= max_lines_per_slide and is_similar:
+                current_lines.extend(sentence_lines)
+            else:
+                slides.append(Slide(current_lines, needs_check))
+                current_lines = list(sentence_lines)
+                needs_check = False
+            i += 1
+        offset += len(merged_sentences)
+
+    if current_lines:
+        slides.append(Slide(current_lines, needs_check))
+
+    return slides
+
+# PPT 생성 함수
+@timed("render")
+def create_ppt(slides, font_size=54, progress=None):
+    """분할된 슬라이드로 PPT를 생성하고, '확인 필요!' 표시 등을 추가합니다.
+    progress가 있으면 슬라이드를 하나 만들 때마다 progress(만든 수, 전체 수)를 호출합니다."""
+
+    prs = Presentation()
+    prs.slide_width = Inches(13.33)
+    prs.slide_height = Inches(7.5)
+    total_slides = len(slides)
+
+    for i, slide_data in enumerate(slides):
+        try:
+            logging.debug(f"슬라이드 {i+1}에 텍스트 추가")
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            if slide_data.is_title:
+                add_section_title_to_slide(slide, slide_data.lines, font_size)
+            else:
+                add_text_to_slide(slide, slide_data.lines, font_size, PP_ALIGN.CENTER)
+            if slide_data.needs_check:
+                add_check_needed_shape(slide)  # 슬라이드 번호 인자 제거
+            if i == total_slides - 1:
+                add_end_mark(slide)
+            if progress is not None:
+                progress(i + 1, total_slides)
+        except Exception:
+            logging.exception(f"오류: 슬라이드 생성 실패 (슬라이드 {i+1})")
+            return None
+
+    return prs
+
+def add_text_to_slide(slide, lines, font_size, alignment):
+    """분할 단계에서 줄바꿈한 줄을 한 문단씩 추가하고, 폰트, 크기, 정렬 등을 설정합니다."""
+
+    try:
+        textbox = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.33), Inches(6.2))
+        text_frame = textbox.text_frame
+        text_frame.clear()
+        text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
+        text_frame.word_wrap = True
+
+        for line in lines:
+            p = text_frame.add_paragraph()
+            p.text = line
+            p.font.size = Pt(font_size)
+            p.font.name = 'Noto Color Emoji'
+            p.font.bold = True
+            p.font.color.rgb = RGBColor(0, 0, 0)
+            p.alignment = alignment
+            p.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
+
+        text_frame.auto_size = None
+        logging.debug("텍스트 추가됨")
+    except Exception as e:
+        logging.error(f"오류: 슬라이드에 텍스트 추가 중 오류 발생: {e}")
+        raise
+
+def add_section_title_to_slide(slide, lines, font_size):
+    """섹션 제목 슬라이드: 배경을 채우고 제목 줄을 가운데에 흰 글씨로 넣습니다."""
+
+    background = slide.background.fill
+    background.solid()
+    background.fore_color.rgb = RGBColor(0x1F, 0x4E, 0x79)
+
+    textbox = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.33), Inches(6.9))
+    text_frame = textbox.text_frame
+    text_frame.clear()
+    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+    text_frame.word_wrap = True
+
+    for i, line in enumerate(lines):
+        p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+        p.text = line
+        p.font.size = Pt(font_size)
+        p.font.name = 'Noto Color Emoji'
+        p.font.bold = True
+        p.font.color.rgb = RGBColor(255, 255, 255)
+        p.alignment = PP_ALIGN.CENTER
+
+    text_frame.auto_size = None
+
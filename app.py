@@ -1,206 +1,106 @@
 import streamlit as st
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
-from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
-import io
-import re
-import textwrap
-import docx
+import hashlib
+import time
 from datetime import datetime
+from io import BytesIO
+from ppt_core import get_packer, split_and_group_text_optimal, IncrementalSplitter, Slide
+from preview import first_difference, numbered_cards_html, slide_cards_html, preview_page_start
+from artifacts import ArtifactStore
+from deck_cache import DeckCache, code_version, deck_key
+from deck_writer import revise_deck, slide_manifest, write_deck
+from readers import READERS, iter_lines, reader_name
+from jobs import JobQueue
+from instrumentation import timed
+from metrics_panel import render_metrics_panel
+
+PARALLEL_RENDER_MIN_SLIDES = 1000  # 이보다 작은 덱은 프로세스 간 전달 비용이 더 커서 한 프로세스에서 렌더링
+
+CODE_VERSION = code_version("ppt_core.py", "deck_writer.py", "readers.py", "text_width.py", "template.pptx")
+
+@st.cache_resource
+def load_deck_cache():
+    return DeckCache()
+
+@st.cache_resource
+def load_job_queue():
+    return JobQueue()
+
+@st.cache_resource
+def load_artifact_store():
+    return ArtifactStore()
+
+deck_cache = load_deck_cache()
+job_queue = load_job_queue()
+artifact_store = load_artifact_store()
+
+# 세션의 덱 결과 (아티팩트 ID, 메타데이터)를 바꾸면서, 이 세션만 쓰던 이전 덱 파일은 바로 지움
+def set_deck_result(result):
+    old = st.session_state.get("deck_result")
+    if old and (result is None or old[0] != result[0]):
+        artifact_store.delete(old[0])
+    st.session_state["deck_result"] = result
+
+# 백그라운드 작업: 추출 → 분할(별도 프로세스) → 렌더링·저장(스트리밍 쓰기). Streamlit API는 호출하지 않음
+# previous가 (이전 PPT 읽기용 파일 객체, 슬라이드 목록 해시 또는 None)이면 바뀐 슬라이드만 새로 만드는 수정본으로 저장
+# 덱은 메모리에 두지 않고 아티팩트 파일로 바로 쓰며, 결과는 (아티팩트 ID, 메타데이터)
+def generate_deck(job, input_bytes, input_source, settings, cache_key, previous=None):
+    if input_source == "text":
+        text = input_bytes.decode("utf-8")
+    else:
+        # 업로드 파일은 형식별 읽기 함수로 문단을 읽어 줄 단위 텍스트로 만듦 (Streamlit Cloud 안정 처리)
+        job.report(stage="extract")
+        with timed("extract", reader=input_source):
+            text = "\n".join(iter_lines(BytesIO(input_bytes), reader=input_source))
+
+    job.report(stage="split")
+    with timed("split", process=True):
+        slides = job_queue.run_in_process(
+            get_packer(settings["packing"]),
+            text,
+            max_lines_per_slide=settings["max_lines_per_slide"],
+            max_chars_per_line_ppt=settings["max_chars_per_line_ppt"],
+        )
 
-# Word 파일에서 텍스트 추출하는 함수
-def extract_text_from_word(file_like_object):
-    """업로드된 파일 객체에서 텍스트를 추출합니다."""
-    doc = docx.Document(file_like_object)
-    return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
-
-# 문장이 차지할 줄 수 계산
-def calculate_text_lines(text, max_chars_per_line):
-    lines = 0
-    paragraphs = text.split('\n')
-    for paragraph in paragraphs:
-        if not paragraph:
-            lines += 1
-        else:
-            lines += len(textwrap.wrap(paragraph, width=max_chars_per_line, break_long_words=True))
-    return lines
-
-# 텍스트를 슬라이드로 분할 및 그룹화
-def split_and_group_text(text, max_lines_per_slide, max_chars_per_line_ppt):
-    slides = []
-    split_flags = []
-    lines = text.strip().split('\n')
-
-    for line in lines:
-        line = line.strip()
-        line_count = calculate_text_lines(line, max_chars_per_line_ppt)
-
-        if not slides:
-            slides.append(line)
-            split_flags.append(False)
-        elif calculate_text_lines(slides[-1] + "\n" + line, max_chars_per_line_ppt) <= max_lines_per_slide:
-            slides[-1] += "\n" + line
-            split_flags[-1] = False
-        else:
-            slides.append(line)
-            split_flags.append(False)
-
-    final_slides = []
-    final_split_flags = []
-    max_chars_per_segment = 60
-
-    for i, slide_text in enumerate(slides):
-        if calculate_text_lines(slide_text, max_chars_per_line_ppt) > max_lines_per_slide:
-            original_sentence = slide_text.replace('\n', ' ')
-            sub_sentences = re.split(r'(?<=[.?!;])\s+', original_sentence.strip())
-            temp_slide_text = ""
-            temp_slide_lines = 0
-            is_forced_split = False
-            for sub_sentence in sub_sentences:
-                sub_sentence = sub_sentence.strip()
-                sub_sentence_lines = calculate_text_lines(sub_sentence, max_chars_per_line_ppt)
-                if temp_slide_lines + sub_sentence_lines <= max_lines_per_slide:
-                    if temp_slide_text:
-                        temp_slide_text += " "
-                    temp_slide_text += sub_sentence
-                    temp_slide_lines += sub_sentence_lines
-                else:
-                    final_slides.append(temp_slide_text)
-                    final_split_flags.append(is_forced_split)
-                    temp_slide_text = sub_sentence
-                    temp_slide_lines = sub_sentence_lines
-                    is_forced_split = False
-
-            if temp_slide_text:
-                if calculate_text_lines(temp_slide_text, max_chars_per_line_ppt) > max_lines_per_slide:
-                    words = temp_slide_text.split()
-                    segment = ""
-                    for word in words:
-                        if len(segment.replace(" ", "")) + len(word) + (1 if segment else 0) <= max_chars_per_segment:
-                            if segment:
-                                segment += " "
-                            segment += word
-                        else:
-                            final_slides.append(segment)
-                            final_split_flags.append(True)
-                            segment = word
-                            is_forced_split = True
-                    if segment:
-                        final_slides.append(segment)
-                        final_split_flags.append(True)
-                else:
-                    final_slides.append(temp_slide_text)
-                    final_split_flags.append(False)
-        else:
-            final_slides.append(slide_text)
-            final_split_flags.append(False)
-
-    final_slides = [slide for slide in final_slides if slide.strip()]
-    final_split_flags = final_split_flags[:len(final_slides)]
-
-    return final_slides, final_split_flags
-
-# PPT 생성 함수
-def create_ppt(slide_texts, split_flags, max_chars_per_line_in_ppt=18, font_size=54):
-    prs = Presentation()
-    prs.slide_width = Inches(13.33)
-    prs.slide_height = Inches(7.5)
-    total_slides = len(slide_texts)
-
-    for i, text in enumerate(slide_texts):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-        add_text_to_slide(slide, text, font_size, PP_ALIGN.CENTER)
-        add_slide_number(slide, i + 1, total_slides)
-        if split_flags[i]:
-            add_check_needed_shape(slide)
-        if i == total_slides - 1:
-            add_end_mark(slide)
-
-    return prs
-
-# 슬라이드에 텍스트 추가
-def add_text_to_slide(slide, text, font_size, alignment):
-    textbox = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.33), Inches(6.2))
-    text_frame = textbox.text_frame
-    text_frame.clear()
-    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP  # 상단 정렬 명시적으로 설정
-    text_frame.word_wrap = True
-
-    wrapped_lines = textwrap.wrap(text, width=18, break_long_words=True)  # 긴 단어 분리 활성화
-    text_frame.clear()
-    for line in wrapped_lines:
-        p = text_frame.add_paragraph()
-        p.text = line
-        p.font.size = Pt(font_size)
-        p.font.name = 'Noto Color Emoji'
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(0, 0, 0)
-        p.alignment = alignment
-        p.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
-
-    # 텍스트 박스의 자동 맞춤 기능 제거 (상단 정렬에 영향 줄 수 있음)
-    text_frame.auto_size = None
-    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
-
-# 슬라이드 번호 추가
-def add_slide_number(slide, current, total):
-    footer_box = slide.shapes.add_textbox(Inches(11.5), Inches(7.0), Inches(1.5), Inches(0.4))
-    footer_text_frame = footer_box.text_frame
-    footer_text_frame.clear()
-    p = footer_text_frame.paragraphs[0]
-    p.text = f"{current} / {total}"
-    p.font.size = Pt(18)
-    p.font.name = '맑은 고딕'
-    p.font.color.rgb = RGBColor(128, 128, 128)
-    p.alignment = PP_ALIGN.RIGHT
-
-# '끝' 모양 추가
-def add_end_mark(slide):
-    end_shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(10),
-        Inches(6),
-        Inches(2),
-        Inches(1)
-    )
-    end_shape.fill.solid()
-    end_shape.fill.fore_color.rgb = RGBColor(255, 0, 0)
-    end_shape.line.color.rgb = RGBColor(0, 0, 0)
-
-    end_text_frame = end_shape.text_frame
-    end_text_frame.clear()
-    p = end_text_frame.paragraphs[0]
-    p.text = "끝"
-    p.font.size = Pt(36)
-    p.font.color.rgb = RGBColor(255, 255, 255)
-    end_text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-    p.alignment = PP_ALIGN.CENTER
-
-# '확인 필요!' 모양 추가
-def add_check_needed_shape(slide):
-    check_shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0.5),
-        Inches(0.3),
-        Inches(2),
-        Inches(0.5)
-    )
-    check_shape.fill.solid()
-    check_shape.fill.fore_color.rgb = RGBColor(255, 255, 0)
-    check_shape.line.color.rgb = RGBColor(0, 0, 0)
-
-    check_text_frame = check_shape.text_frame
-    check_text_frame.clear()
-    p = check_text_frame.paragraphs[0]
-    p.text = "확인 필요!"
-    p.font.size = Pt(18)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 0, 0)
-    text_frame = check_shape.text_frame
-    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-    p.alignment = PP_ALIGN.CENTER
+    # 덱 객체 전체를 만들지 않고 슬라이드를 하나씩 .pptx(ZIP)에 바로 씀 (create_ppt + save와 같은 결과)
+    # 큰 덱은 슬라이드 XML 생성을 분할용 프로세스 풀에 나눠 맡김
+    job.report(0, len(slides), stage="render")
+    if previous is None:
+        executor = job_queue.process_pool() if len(slides) >= PARALLEL_RENDER_MIN_SLIDES else None
+        artifact_id = artifact_store.write(
+            lambda f: write_deck(slides, f, font_size=settings["font_size"], progress=job.report, executor=executor)
+        )
+        changed = None
+    else:
+        previous_file, manifest = previous
+        with previous_file:
+            changed = []
+            artifact_id = artifact_store.write(lambda f: changed.extend(revise_deck(
+                previous_file, slides, f, font_size=settings["font_size"], manifest=manifest, progress=job.report
+            )))
+    meta = {
+        "slide_count": len(slides),
+        "split_slide_numbers": [i + 1 for i, slide in enumerate(slides) if slide.needs_check],
+        "manifest": slide_manifest(slides, settings["font_size"]),  # 다음 수정본에서 이 덱과 비교할 때 사용
+    }
+    if changed is not None:
+        meta["changed_slides"] = [[i + 1, list(slides[i].lines), slides[i].needs_check] for i in changed]
+    deck_cache.put_file(cache_key, artifact_store.path(artifact_id), meta)
+    return artifact_id, meta
+
+JOB_STAGES = {"": "대기 중", "extract": "파일 읽는 중", "split": "슬라이드 분할 중", "render": "슬라이드 생성 중"}
+
+# 진행 중인 작업은 이 부분만 주기적으로 다시 그려 진행률을 갱신하고, 끝나면 전체 화면을 다시 실행
+@st.fragment(run_every=0.5)
+def show_job_progress(job_id):
+    job = job_queue.get(job_id)
+    if job is None or job.finished:
+        st.rerun()
+    label = JOB_STAGES.get(job.stage, job.stage)
+    if job.stage == "render":
+        label += f" ({job.done}/{job.total})"
+    elif job.status == "queued":
+        label += f" (앞에 {job_queue.stats()['queued'] - 1}개 작업 대기)"
+    st.progress(job.fraction, text=f"⏳ {label}")
 
 # Streamlit UI
 st.set_page_config(page_title="Paydo", layout="centered")
@@ -221,96 +121,209 @@ with st.sidebar:
         "🅰️ 폰트 크기:", min_value=10, max_value=60, value=54, key="font_size_slider"
     )
     st.caption("PPT 텍스트의 폰트 크기를 설정합니다.")
+    packing_input = st.radio(
+        "🧩 슬라이드 나누기 방식:", ["greedy", "optimal"], key="packing_radio", horizontal=True,
+        format_func={"greedy": "순서대로 채우기", "optimal": "최적 배치"}.get,
+    )
+    st.caption("최적 배치는 거의 빈 슬라이드와 문장 중간 분할이 줄어들도록 슬라이드 경계를 고릅니다.")
 
 # 메인 화면 디자인 개선
 with st.container():
     st.markdown("### 📝 촬영 대본 입력")
     st.markdown(
         """
-    Word 파일(.docx)을 업로드하거나, 텍스트를 직접 입력하세요.
+    대본 파일(Word, 텍스트, 마크다운, 자막, 한글)을 업로드하거나, 텍스트를 직접 입력하세요.
     """
     )
-    with st.form(key="input_form"):  # 입력 영역을 form으로 묶음
-        col1, col2 = st.columns(2)  # 2개의 컬럼으로 나눔
-        with col1:
-            uploaded_file = st.file_uploader(
-                "Word 파일 업로드",
-                type=["docx"],
-                help="docx 형식의 파일만 지원됩니다. **업로드 오류 발생 시 파일명은 영어와 숫자, 특수문자(-,_)로 수정해서 업로드 해주세요.**"
-            )
-        with col2:
-            text_input = st.text_area(
-                "텍스트 직접 입력",
-                height=200,
-                placeholder="여기에 텍스트를 입력하세요...",
-                help="텍스트를 직접 입력할 수 있습니다.",
-            )
-        submit_button = st.form_submit_button("🚀 PPT 만들기")
+    # 입력할 때마다 미리보기가 갱신되도록 form으로 묶지 않음
+    col1, col2 = st.columns(2)  # 2개의 컬럼으로 나눔
+    with col1:
+        uploaded_file = st.file_uploader(
+            "대본 파일 업로드",
+            type=list(READERS),
+            help=f"{', '.join(READERS)} 형식을 지원합니다. **업로드 오류 발생 시 파일명은 영어와 숫자, 특수문자(-,_)로 수정해서 업로드 해주세요.**"
+        )
+        reader_input = st.selectbox(
+            "파일 형식",
+            ["auto", *READERS],
+            format_func=lambda name: "자동 (확장자로 판단)" if name == "auto" else name,
+            help="확장자와 실제 형식이 다를 때(예: 자막을 .txt로 저장한 경우) 읽는 방식을 직접 고릅니다.",
+        )
+    with col2:
+        text_input = st.text_area(
+            "텍스트 직접 입력",
+            height=200,
+            placeholder="여기에 텍스트를 입력하세요...",
+            help="텍스트를 직접 입력할 수 있습니다.",
+        )
+    revise_input = st.checkbox(
+        "🔁 수정본: 이전 PPT에서 바뀐 슬라이드만 새로 만들기",
+        key="revise_checkbox",
+        help="바뀌지 않은 슬라이드는 이전 PPT의 것을 그대로 쓰고(번호만 고침), 새로 만든 슬라이드를 따로 보여 줍니다.",
+    )
+    previous_file = st.file_uploader(
+        "이전 PPT (올리지 않으면 이 화면에서 마지막으로 만든 PPT와 비교)", type=["pptx"], key="previous_upload"
+    ) if revise_input else None
+    submit_button = st.button("🚀 PPT 만들기")
+
+# 직접 입력한 텍스트의 슬라이드 미리보기 (바뀐 줄 주변만 다시 분할)
+# (최적 배치는 경계가 문서 전체에 걸쳐 정해지므로 매번 전체를 다시 분할하고 이전 결과와 비교)
+if uploaded_file is None and text_input.strip():
+    preview_settings = (max_lines_per_slide_input, max_chars_per_line_ppt_input)
+    start = time.perf_counter()
+    if packing_input == "optimal":
+        previous_slides = st.session_state.get("preview_optimal_slides")
+        preview_slides = split_and_group_text_optimal(text_input, *preview_settings)
+        first_changed = first_difference(previous_slides, preview_slides) if previous_slides is not None else 0
+        st.session_state["preview_optimal_slides"] = preview_slides
+    else:
+        if st.session_state.get("preview_settings") != preview_settings:
+            st.session_state["preview_settings"] = preview_settings
+            st.session_state["preview_splitter"] = IncrementalSplitter(*preview_settings)
+        splitter = st.session_state["preview_splitter"]
+        preview_slides = splitter.update(text_input)
+        first_changed = splitter.first_changed_slide
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    with st.expander(f"👀 슬라이드 미리보기 ({len(preview_slides)}장)", expanded=True):
+        changed = f"{first_changed + 1}번 슬라이드부터 갱신" if first_changed < len(preview_slides) else "변경 없음"
+        st.caption(f"{changed} · 분할 {elapsed_ms:.1f} ms")
+        page_start = preview_page_start(first_changed, len(preview_slides))
+        st.markdown(
+            slide_cards_html(preview_slides, page_start, highlight_from=first_changed), unsafe_allow_html=True
+        )
 
 if submit_button:
-    from io import BytesIO
-
-    text = ""
-
     if uploaded_file is not None:
-        try:
-            file_bytes = BytesIO(uploaded_file.read())  # Streamlit Cloud 안정 처리
-            text = extract_text_from_word(file_bytes)
-        except Exception as e:
-            st.error(f"""
-            📄 워드 파일을 읽는 중 오류가 발생했습니다.
-            **오류 메시지:** {e}
-
-            **해결 방법:**
-            * **파일명에 한글, 특수문자(하이픈(-), 언더바(_) 제외)가 포함되어 있지 않은지 확인해주세요.**
-                Streamlit Cloud 환경에서는 파일명에 유니코드 문자가 포함될 경우 업로드에 문제가 발생할 수 있습니다.
-                파일명을 영어와 숫자, 하이픈(-), 언더바(_)로만 구성하여 다시 시도해주세요 (예: `script_20240520.docx`).
-            * 파일이 손상되었을 수도 있으니, 다른 워드 파일로도 시도해보세요.
-            """)
+        input_bytes = uploaded_file.read()
+        input_source = reader_name(uploaded_file.name) if reader_input == "auto" else reader_input
+        if input_source is None:
+            st.error(f"'{uploaded_file.name}'의 형식을 알 수 없습니다. 파일 형식을 직접 선택하세요.")
             st.stop()
     elif text_input.strip():
-        text = text_input
+        input_bytes = text_input.encode("utf-8")
+        input_source = "text"
     else:
-        st.error("Word 파일을 업로드하거나 텍스트를 입력하세요.")
+        st.error("대본 파일을 업로드하거나 텍스트를 입력하세요.")
         st.stop()
 
     # PPT 파일명 설정
     now = datetime.now()
     date_string = now.strftime("%y%m%d")
-    ppt_filename = f"[촬영 대본] paydo_script_{date_string}.pptx"
-
-    # PPT 생성
-    with st.spinner("PPT 생성 중..."):
-        slide_texts, split_flags = split_and_group_text(
-            text,
-            max_lines_per_slide=max_lines_per_slide_input,
-            max_chars_per_line_ppt=max_chars_per_line_ppt_input,
-        )
-        ppt = create_ppt(
-            slide_texts,
-            split_flags,
-            max_chars_per_line_in_ppt=max_chars_per_line_ppt_input,
-            font_size=font_size_input,
+    st.session_state["ppt_filename"] = f"[촬영 대본] paydo_script_{date_string}.pptx"
+
+    # 수정본의 기준: 올린 이전 PPT, 없으면 이 화면에서 마지막으로 만든 PPT (그 덱의 슬라이드 해시도 함께)
+    # (파일은 여기서 열어 작업에 넘기므로, 작업이 시작되기 전에 이전 덱 파일을 지워도 끝까지 읽을 수 있음)
+    previous = None
+    if revise_input:
+        if previous_file is not None:
+            previous = (BytesIO(previous_file.getvalue()), None)
+        elif st.session_state.get("deck_result"):
+            previous_id, previous_meta = st.session_state["deck_result"]
+            try:
+                previous = (artifact_store.open(previous_id), previous_meta.get("manifest"))
+            except FileNotFoundError:
+                st.info("이전 PPT의 보관 기간이 지나 전체를 새로 만듭니다.")
+        else:
+            st.info("비교할 이전 PPT가 없어 전체를 새로 만듭니다.")
+
+    # 같은 입력 + 같은 설정 + 같은 코드(+ 같은 이전 PPT)면 저장된 PPT를 그대로 사용하고, 아니면 작업 큐에 제출
+    settings = {
+        "source": input_source,
+        "max_lines_per_slide": max_lines_per_slide_input,
+        "max_chars_per_line_ppt": max_chars_per_line_ppt_input,
+        "font_size": font_size_input,
+        "packing": packing_input,
+    }
+    if previous is not None:
+        settings["revise_of"] = hashlib.file_digest(previous[0], "sha1").hexdigest()
+        previous[0].seek(0)
+    cache_key = deck_key(input_bytes, settings, CODE_VERSION)
+    cached = deck_cache.open(cache_key)
+    if cached is not None:
+        cached_file, cached_meta = cached
+        with cached_file:
+            cached = (artifact_store.copy(cached_file), cached_meta)
+        if previous is not None:
+            previous[0].close()
+    set_deck_result(cached)
+    st.session_state["deck_job_id"] = None
+    if cached is None:
+        st.session_state["deck_job_id"] = job_queue.submit(
+            generate_deck, input_bytes, input_source, settings, cache_key, previous
         )
 
-    if ppt:
-        ppt_io = io.BytesIO()
-        ppt.save(ppt_io)
-        ppt_io.seek(0)
+deck_job = job_queue.get(st.session_state.get("deck_job_id"))
+if deck_job is not None:
+    if not deck_job.finished:
+        show_job_progress(deck_job.id)
+    elif deck_job.status == "done":
+        set_deck_result(deck_job.result)
+        st.session_state["deck_job_id"] = None
+    else:
+        st.session_state["deck_job_id"] = None
+        if deck_job.stage == "extract":
+            st.error(f"""
+            📄 업로드한 파일을 읽는 중 오류가 발생했습니다.
+            **오류 메시지:** {deck_job.error}
 
-        st.success("PPT 생성 완료! 아래 버튼을 눌러 다운로드하세요.")
-        st.download_button(
-            label="📥 PPT 다운로드",
-            data=ppt_io,
-            file_name=ppt_filename,
-            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            key="download_button"
-        )
+            **해결 방법:**
+            * **파일명에 한글, 특수문자(하이픈(-), 언더바(_) 제외)가 포함되어 있지 않은지 확인해주세요.**
+                Streamlit Cloud 환경에서는 파일명에 유니코드 문자가 포함될 경우 업로드에 문제가 발생할 수 있습니다.
+                파일명을 영어와 숫자, 하이픈(-), 언더바(_)로만 구성하여 다시 시도해주세요 (예: `script_20240520.docx`).
+            * 파일이 손상되었거나 선택한 파일 형식과 다를 수 있으니, 파일 형식을 확인하거나 다른 파일로도 시도해보세요.
+            """)
+        else:
+            st.error(f"❌ PPT 생성에 실패했습니다. ({deck_job.error})")
+
+if st.session_state.get("deck_result") and not artifact_store.exists(st.session_state["deck_result"][0]):
+    st.session_state["deck_result"] = None
+    st.warning("⌛ 생성한 PPT의 보관 기간이 지났습니다. 다시 생성해주세요.")
+
+if st.session_state.get("deck_result"):
+    artifact_id, meta = st.session_state["deck_result"]
+
+    st.success("PPT 생성 완료! 아래 버튼을 눌러 다운로드하세요.")
+    # 덱 바이트는 세션에 두지 않고, 버튼을 누를 때만 보관소 파일을 열어 내려보냄
+    st.download_button(
+        label="📥 PPT 다운로드",
+        data=lambda: artifact_store.open(artifact_id),
+        file_name=st.session_state["ppt_filename"],
+        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        key="download_button"
+    )
 
-        if any(split_flags):
-            split_slide_numbers = [i + 1 for i, flag in enumerate(split_flags) if flag]
-            st.warning(
-                f"❗️ 일부 슬라이드({split_slide_numbers})는 한 문장이 너무 길어 분할되었습니다. PPT를 확인하여 가독성을 검토해주세요."
+    changed_slides = meta.get("changed_slides")
+    if changed_slides is not None:
+        if changed_slides:
+            st.info(
+                f"🔁 이전 PPT와 비교해 {len(changed_slides)}장을 새로 만들었습니다 "
+                f"({[number for number, _, _ in changed_slides]}). 나머지 슬라이드는 이전 PPT와 같습니다."
             )
-    else:
-        st.error("❌ PPT 생성에 실패했습니다.")
+            with st.expander("🔍 새로 만든 슬라이드 보기"):
+                st.markdown(
+                    numbered_cards_html(
+                        [(number, Slide(lines, needs_check)) for number, lines, needs_check in changed_slides],
+                        meta["slide_count"],
+                    ),
+                    unsafe_allow_html=True,
+                )
+        else:
+            st.info("🔁 이전 PPT와 슬라이드 내용이 같습니다.")
+
+    split_slide_numbers = meta["split_slide_numbers"]
+    if split_slide_numbers:
+        st.warning(
+            f"❗️ 일부 슬라이드({split_slide_numbers})는 한 문장이 너무 길어 분할되었습니다. PPT를 확인하여 가독성을 검토해주세요."
+        )
+
+job_stats = job_queue.stats()
+st.sidebar.caption(f"💾 결과 캐시: 적중 {deck_cache.hits}회 / 미스 {deck_cache.misses}회")
+artifact_stats = artifact_store.stats()
+st.sidebar.caption(
+    f"📦 다운로드 보관소: {artifact_stats['count']}개, {artifact_stats['bytes'] / (1024 * 1024):.1f}MB "
+    f"/ {artifact_store.max_bytes / (1024 * 1024):.0f}MB"
+)
+st.sidebar.caption(
+    f"⏳ 작업 큐: 실행 중 {job_stats['running']}/{job_stats['max_workers']}, 대기 {job_stats['queued']}"
+)
+render_metrics_panel()
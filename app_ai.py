@@ -1,289 +1,288 @@
 # Paydo AI PPT 생성기 with KoSimCSE + KSS 의미 단위 분할 적용
 
 import streamlit as st
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
-from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
-import io
-import re
-import textwrap
-import docx
+import gc
+import time
 from io import BytesIO
-from sentence_transformers import SentenceTransformer, util
-import kss
+from concurrent.futures import ThreadPoolExecutor
+import ai_core
+from ai_core import create_ppt
+from artifacts import ArtifactStore
+from embedding_cache import EmbeddingCache
+from encoders import DEFAULT_BACKEND as ENCODER_BACKEND, encoder_name, load_encoder
+from sentence_split import SentenceSplitter, warm_up as warm_up_sentence_split
+from deck_cache import DeckCache, code_version, deck_key
+from preview import first_difference, preview_page_start, slide_cards_html
+from jobs import JobQueue
+from instrumentation import timed
+from metrics_panel import render_metrics_panel
+from readers import READERS, iter_paragraphs, reader_name
 
 # Streamlit 세팅
 st.set_page_config(page_title="Paydo AI PPT", layout="centered")
 st.title("🎬 AI PPT 생성기 (KoSimCSE + 의미 단위 분할)")
 
+CODE_VERSION = code_version("ai_core.py", "ppt_core.py", "readers.py", "text_width.py", "sentence_split.py", "topics.py", "encoders.py")
+
+# torch/onnxruntime을 끌어오는 무거운 import는 첫 사용 시점까지 미룸
+# (백엔드는 PAYDO_ENCODER_BACKEND로 선택: torch, onnx, onnx-int8)
+def _load_model():
+    return load_encoder(ENCODER_BACKEND)
+
+def _warm_up():
+    warm_up_sentence_split()
+    return _load_model()
+
 @st.cache_resource
+def start_model_warm_up():
+    """프로세스당 한 번, UI를 막지 않도록 백그라운드 스레드에서 KSS와 모델을 미리 불러옵니다."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-warm-up").submit(_warm_up)
+
 def load_model():
-    return SentenceTransformer("jhgan/ko-sbert-nli")
+    # 워밍업이 끝나지 않았으면 여기서만 기다림
+    try:
+        return start_model_warm_up().result()
+    except Exception:
+        start_model_warm_up.clear()  # 다음 실행에서 다시 불러오도록 실패한 결과는 버림
+        raise
+
+@st.cache_resource
+def load_embedding_cache():
+    return EmbeddingCache(encoder_name(ENCODER_BACKEND))
 
-model = load_model()
+@st.cache_resource
+def load_deck_cache():
+    return DeckCache()
+
+@st.cache_resource
+def load_job_queue():
+    return JobQueue()
 
-# Word 파일 텍스트 추출
-def extract_text_from_word(uploaded_file):
+@st.cache_resource
+def load_artifact_store():
+    return ArtifactStore()
+
+start_model_warm_up()
+embedding_cache = load_embedding_cache()
+deck_cache = load_deck_cache()
+job_queue = load_job_queue()
+artifact_store = load_artifact_store()
+
+# 세션의 덱 결과 (아티팩트 ID, 메타데이터, 캐시 통계)를 바꾸면서, 이 세션만 쓰던 이전 덱 파일은 바로 지움
+def set_deck_result(result):
+    old = st.session_state.get("deck_result")
+    if old and (result is None or old[0] != result[0]):
+        artifact_store.delete(old[0])
+    st.session_state["deck_result"] = result
+
+# 업로드한 대본 파일에서 비어 있지 않은 문단 추출 (형식별 읽기 함수 사용)
+def extract_paragraphs(input_bytes, reader):
     try:
-        file_bytes = BytesIO(uploaded_file.read())
-        doc = docx.Document(file_bytes)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        with timed("extract", reader=reader):
+            paragraphs = [p for p in iter_paragraphs(BytesIO(input_bytes), reader=reader) if p.strip()]
         if not paragraphs:
-            raise ValueError("Word 파일이 비어 있습니다.")  # 파일이 비어있는 경우 예외 발생
+            raise ValueError("파일이 비어 있습니다.")  # 파일이 비어있는 경우 예외 발생
         return paragraphs
     except Exception as e:
-        st.error(f"Word 파일 처리 오류: {e}")
+        st.error(f"파일 처리 오류: {e}")
         return None
 
-# 텍스트 줄 수 계산
-def calculate_text_lines(text, max_chars_per_line):
-    lines = 0
-    paragraphs = text.split('\n')
-    for paragraph in paragraphs:
-        if not paragraph:
-            lines += 1
-        else:
-            lines += len(textwrap.wrap(paragraph, width=max_chars_per_line, break_long_words=True))
-    return lines
-
-# 의미 단위 기준 문장 분할 (KSS 사용)
-def smart_sentence_split(text):
-    return kss.split_sentences(text)
-
-# 불완전 문장 판단 및 병합
-connective_pattern = re.compile(r'^(그리고|하지만|그러나|또한|그래서|즉|또|그러면|그런데)$')
-
-def is_incomplete(sentence):
-    return (
-        sentence.endswith(('은', '는', '이', '가', '을', '를', '에', '으로', '고', '와', '과'))
-        or len(sentence.strip()) < 8
-        or bool(connective_pattern.match(sentence.strip()))
-    )
+@st.cache_resource
+def load_sentence_splitter():
+    return SentenceSplitter()
 
-# 슬라이드 분할 with 의미 단위 + 문맥 유사도
-def split_text_into_slides_with_similarity(text_paragraphs, max_lines_per_slide, max_chars_per_line_ppt, similarity_threshold=0.85):
-    slides, split_flags = [], []
-    slide_number = 1
-    current_text = ""
-    current_lines = 0
-    needs_check = False
-
-    for paragraph in text_paragraphs:
-        sentences = smart_sentence_split(paragraph)
-        if not sentences:
-            continue
-
-        merged_sentences = []
-        buffer = ""
-        for sentence in sentences:
-            if buffer:
-                buffer += " " + sentence
-                if not is_incomplete(sentence):
-                    merged_sentences.append(buffer.strip())
-                    buffer = ""
-            else:
-                if is_incomplete(sentence):
-                    buffer = sentence
-                else:
-                    merged_sentences.append(sentence)
-        if buffer:
-            merged_sentences.append(buffer.strip())
-
-        embeddings = model.encode(merged_sentences)
-
-        i = 0
-        while i < len(merged_sentences):
-            sentence = merged_sentences[i]
-            sentence_lines = calculate_text_lines(sentence, max_chars_per_line_ppt)
-
-            if sentence_lines <= 2 and i + 1 < len(merged_sentences):
-                next_sentence = merged_sentences[i + 1]
-                merged = sentence + " " + next_sentence
-                merged_lines = calculate_text_lines(merged, max_chars_per_line_ppt)
-                if merged_lines <= max_lines_per_slide:
-                    sentence = merged
-                    sentence_lines = merged_lines
-                    i += 1
-
-            if sentence_lines > max_lines_per_slide:
-                wrapped_lines = textwrap.wrap(sentence, width=max_chars_per_line_ppt, break_long_words=True)
-                temp_text = ""
-                temp_lines = 0
-                for line in wrapped_lines:
-                    line_lines = calculate_text_lines(line, max_chars_per_line_ppt)
-                    if temp_lines + line_lines <= max_lines_per_slide:
-                        temp_text += line + "\n"
-                        temp_lines += line_lines
-                    else:
-                        slides.append(temp_text.strip())
-                        split_flags.append(True)
-                        slide_number += 1
-                        temp_text = line + "\n"
-                        temp_lines = line_lines
-                if temp_text:
-                    slides.append(temp_text.strip())
-                    split_flags.append(True)
-                    slide_number += 1
-                current_text = ""
-                current_lines = 0
-                i += 1
-                continue
-
-            if current_lines + sentence_lines <= max_lines_per_slide:
-                current_text += sentence + "\n"
-                current_lines += sentence_lines
-            else:
-                slides.append(current_text.strip())
-                split_flags.append(needs_check)
-                slide_number += 1
-                current_text = sentence + "\n"
-                current_lines = sentence_lines
-                needs_check = False
-            i += 1
-
-    if current_text:
-        slides.append(current_text.strip())
-        split_flags.append(needs_check)
-
-    return slides, split_flags
-
-# [create_ppt, add_text_to_slide, add_check_needed_shape, add_end_mark 함수는 이전 정의대로 유지]
-def create_ppt(slide_texts, split_flags, max_chars_per_line_in_ppt=18, font_size=54):
-    """슬라이드 텍스트를 기반으로 PPT를 생성하고, '확인 필요!' 표시 등을 추가합니다."""
-
-    prs = Presentation()
-    prs.slide_width = Inches(13.33)
-    prs.slide_height = Inches(7.5)
-    total_slides = len(slide_texts)
-
-    for i, text in enumerate(slide_texts):
-        try:
-            logging.debug(f"슬라이드 {i+1}에 텍스트 추가")
-            slide = prs.slides.add_slide(prs.slide_layouts[6])
-            add_text_to_slide(slide, text, font_size, PP_ALIGN.CENTER, max_chars_per_line_in_ppt)
-            if split_flags[i]:
-                add_check_needed_shape(slide)  # 슬라이드 번호 인자 제거
-            if i == total_slides - 1:
-                add_end_mark(slide)
-        except Exception as e:
-            st.error(f"오류: 슬라이드 생성 실패 (슬라이드 {i+1}): {e}")
-            return None
-
-    return prs
-
-def add_text_to_slide(slide, text, font_size, alignment, max_chars_per_line):
-    """슬라이드에 텍스트를 추가하고, 폰트, 크기, 정렬 등을 설정합니다."""
+sentence_splitter = load_sentence_splitter()
 
-    try:
-        textbox = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.33), Inches(6.2))
-        text_frame = textbox.text_frame
-        text_frame.clear()
-        text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
-        text_frame.word_wrap = True
-
-        wrapped_lines = textwrap.wrap(text, width=max_chars_per_line, break_long_words=True)
-        for line in wrapped_lines:
-            p = text_frame.add_paragraph()
-            p.text = line
-            p.font.size = Pt(font_size)
-            p.font.name = 'Noto Color Emoji'
-            p.font.bold = True
-            p.font.color.rgb = RGBColor(0, 0, 0)
-            p.alignment = alignment
-            p.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
-
-        text_frame.auto_size = None
-        logging.debug(f"텍스트 추가됨")
-    except Exception as e:
-        st.error(f"오류: 슬라이드에 텍스트 추가 중 오류 발생: {e}")
-        raise
+# 대본 전체 문장을 한 번의 배치 호출로 인코딩 (캐시에 없는 문장만)
+def encode_sentences(sentences):
+    return load_model().encode(sentences, batch_size=64, convert_to_numpy=True, normalize_embeddings=True)
 
-def add_end_mark(slide):
-    """마지막 슬라이드에 '끝' 표시를 추가합니다."""
+def embed_sentences(sentences):
+    return embedding_cache.encode(sentences, encode_sentences)
 
-    end_shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(10),
-        Inches(6),
-        Inches(2),
-        Inches(1)
+# 슬라이드 분할 with 의미 단위 + 문맥 유사도 (이 프로세스의 KSS 메모와 임베딩 캐시 사용)
+def split_text_into_slides_with_similarity(text_paragraphs, max_lines_per_slide, max_chars_per_line_ppt, similarity_threshold=0.85, cache_stats=None, sections=False):
+    return ai_core.split_text_into_slides_with_similarity(
+        text_paragraphs, max_lines_per_slide, max_chars_per_line_ppt, similarity_threshold, cache_stats,
+        sentence_splitter=sentence_splitter, embed=embed_sentences, sections=sections,
     )
-    end_shape.fill.solid()
-    end_shape.fill.fore_color.rgb = RGBColor(255, 0, 0)
-    end_shape.line.color.rgb = RGBColor(0, 0, 0)
-
-    end_text_frame = end_shape.text_frame
-    end_text_frame.clear()
-    p = end_text_frame.paragraphs[0]
-    p.text = "끝"
-    p.font.size = Pt(36)
-    p.font.color.rgb = RGBColor(255, 255, 255)
-    end_text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-    p.alignment = PP_ALIGN.CENTER
-
-def add_check_needed_shape(slide):
-    """확인 필요한 슬라이드에 '확인 필요!' 상자를 추가합니다."""
-
-    check_shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE,
-        Inches(0.5),
-        Inches(0.3),
-        Inches(2.5),
-        Inches(0.5)
+
+# 백그라운드 작업: 의미 단위 분할 → 렌더링 → 저장. Streamlit API는 호출하지 않음
+# (분할은 모델 추론이 대부분이라 프로세스로 보내지 않고 스레드에서 실행)
+# 덱은 메모리에 두지 않고 아티팩트 파일로 바로 저장하며, 결과는 (아티팩트 ID, 메타데이터, 캐시 통계)
+def generate_deck(job, paragraphs, settings, cache_key):
+    cache_stats = {}
+    job.report(stage="split")
+    slides = split_text_into_slides_with_similarity(
+        paragraphs, settings["max_lines"], settings["max_chars"], settings["similarity_threshold"], cache_stats,
+        settings["sections"],
     )
-    check_shape.fill.solid()
-    check_shape.fill.fore_color.rgb = RGBColor(255, 255, 0)
-    check_shape.line.color.rgb = RGBColor(0, 0, 0)
-
-    check_text_frame = check_shape.text_frame
-    check_text_frame.clear()
-    p = check_text_frame.paragraphs[0]
-    p.text = "확인 필요!"
-    p.font.size = Pt(18)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 0, 0)
-    text_frame = check_shape.text_frame
-    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-    p.alignment = PP_ALIGN.CENTER
+
+    job.report(0, len(slides), stage="render")
+    ppt = create_ppt(slides, settings["font_size"], progress=job.report)
+    if ppt is None:
+        raise RuntimeError("슬라이드 생성 실패")
+
+    job.report(stage="save")
+    with timed("save", slides=len(slides)):
+        artifact_id = artifact_store.write(ppt.save)
+    # python-pptx 객체 그래프는 서로 참조하고 있어 참조가 사라져도 바로 풀리지 않으므로 저장 직후 회수
+    del ppt
+    gc.collect()
+    meta = {
+        "slide_count": len(slides),
+        "flagged": [i + 1 for i, slide in enumerate(slides) if slide.needs_check],
+        "sections": sum(slide.is_title for slide in slides),
+    }
+    deck_cache.put_file(cache_key, artifact_store.path(artifact_id), meta)
+    return artifact_id, meta, cache_stats
+
+JOB_STAGES = {"": "대기 중", "split": "문장 분할 및 문맥 분석 중", "render": "슬라이드 생성 중", "save": "파일 저장 중"}
+
+# 진행 중인 작업은 이 부분만 주기적으로 다시 그려 진행률을 갱신하고, 끝나면 전체 화면을 다시 실행
+@st.fragment(run_every=0.5)
+def show_job_progress(job_id):
+    job = job_queue.get(job_id)
+    if job is None or job.finished:
+        st.rerun()
+    label = JOB_STAGES.get(job.stage, job.stage)
+    if job.stage == "render":
+        label += f" ({job.done}/{job.total})"
+    elif job.status == "queued":
+        label += f" (앞에 {job_queue.stats()['queued'] - 1}개 작업 대기)"
+    st.progress(job.fraction, text=f"⏳ {label}")
 
 # UI 입력
-uploaded_file = st.file_uploader("📄 Word 파일 업로드", type=["docx"])
+uploaded_file = st.file_uploader("📄 대본 파일 업로드", type=list(READERS))
+reader_input = st.selectbox(
+    "파일 형식", ["auto", *READERS], format_func=lambda name: "자동 (확장자로 판단)" if name == "auto" else name,
+)
 text_input = st.text_area("또는 텍스트 직접 입력:", height=300)
 
 max_lines = st.slider("슬라이드당 최대 줄 수", 1, 10, 4)
 max_chars = st.slider("한 줄당 최대 글자 수", 10, 100, 18)
 font_size = st.slider("폰트 크기", 10, 60, 54)
-sim_threshold = st.slider("문맥 유사도 기준", 0.0, 1.0, 0.85, step=0.05)
+sim_threshold = st.slider(
+    "문맥 유사도 기준", 0.0, 1.0, 0.85, step=0.05,
+    help="0으로 두면 문맥 유사도를 쓰지 않아 AI 모델 로딩을 기다리지 않습니다.",
+)
+sections = st.checkbox(
+    "🗂 주제별 섹션 나누기 (제목 슬라이드 추가)", value=False,
+    help="대본 전체에서 주제가 바뀌는 곳을 찾아 섹션마다 제목 슬라이드를 넣습니다. AI 모델이 필요합니다.",
+)
+
+# 직접 입력한 텍스트의 슬라이드 미리보기
+# (문단별 KSS 메모와 임베딩 캐시 덕분에 다시 분할해도 바뀐 문단만 새로 계산됨)
+live_preview = st.checkbox("👀 입력하면서 슬라이드 미리보기", value=False)
+if live_preview and not uploaded_file and text_input.strip():
+    if (sim_threshold > 0 or sections) and not start_model_warm_up().done():
+        st.caption("AI 모델을 불러오는 중입니다. 잠시 후 다시 입력하면 미리보기가 표시됩니다.")
+    else:
+        start = time.perf_counter()
+        preview_slides = split_text_into_slides_with_similarity(
+            [p.strip() for p in text_input.split("\n\n") if p.strip()], max_lines, max_chars, sim_threshold,
+            sections=sections,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        previous = st.session_state.get("preview_slides")
+        first_changed = first_difference(previous, preview_slides) if previous is not None else 0
+        st.session_state["preview_slides"] = preview_slides
+        with st.expander(f"미리보기 ({len(preview_slides)}장)", expanded=True):
+            changed = f"{first_changed + 1}번 슬라이드부터 갱신" if first_changed < len(preview_slides) else "변경 없음"
+            st.caption(f"{changed} · 분할 {elapsed_ms:.1f} ms")
+            page_start = preview_page_start(first_changed, len(preview_slides))
+            st.markdown(
+                slide_cards_html(preview_slides, page_start, highlight_from=first_changed), unsafe_allow_html=True
+            )
 
 if st.button("🚀 PPT 생성"):
     paragraphs = []
     if uploaded_file:
-        paragraphs = extract_text_from_word(uploaded_file)
+        input_bytes = uploaded_file.read()
+        input_source = reader_name(uploaded_file.name) if reader_input == "auto" else reader_input
+        if input_source is None:
+            st.warning(f"'{uploaded_file.name}'의 형식을 알 수 없습니다. 파일 형식을 직접 선택하세요.")
+            st.stop()
     elif text_input.strip():
-        paragraphs = [p.strip() for p in text_input.split("\n\n") if p.strip()]
+        input_bytes = text_input.encode("utf-8")
+        input_source = "text"
     else:
-        st.warning("Word 파일을 업로드하거나 텍스트를 입력하세요.")
+        st.warning("대본 파일을 업로드하거나 텍스트를 입력하세요.")
         st.stop()
 
-    if not paragraphs:
-        st.error("유효한 텍스트가 없습니다.")
-        st.stop()
+    # 같은 입력 + 같은 설정 + 같은 코드면 저장된 PPT를 그대로 사용하고, 아니면 작업 큐에 제출
+    settings = {
+        "source": input_source,
+        "model": encoder_name(ENCODER_BACKEND),
+        "max_lines": max_lines,
+        "max_chars": max_chars,
+        "font_size": font_size,
+        "similarity_threshold": sim_threshold,
+        "sections": sections,
+    }
+    cache_key = deck_key(input_bytes, settings, CODE_VERSION)
+    cached = deck_cache.open(cache_key)
+    if cached is not None:
+        cached_file, cached_meta = cached
+        with cached_file:
+            cached = (artifact_store.copy(cached_file), cached_meta, {})
+    set_deck_result(cached)
+    st.session_state["deck_job_id"] = None
+
+    if cached is None:
+        if input_source == "text":
+            paragraphs = [p.strip() for p in text_input.split("\n\n") if p.strip()]
+        else:
+            paragraphs = extract_paragraphs(input_bytes, input_source)
+
+        if not paragraphs:
+            st.error("유효한 텍스트가 없습니다.")
+            st.stop()
+
+        st.session_state["deck_job_id"] = job_queue.submit(generate_deck, paragraphs, settings, cache_key)
 
-    with st.spinner("PPT 생성 중..."):
-        slides, flags = split_text_into_slides_with_similarity(
-            paragraphs, max_lines, max_chars, sim_threshold
+deck_job = job_queue.get(st.session_state.get("deck_job_id"))
+if deck_job is not None:
+    if not deck_job.finished:
+        show_job_progress(deck_job.id)
+    else:
+        st.session_state["deck_job_id"] = None
+        if deck_job.status == "done":
+            set_deck_result(deck_job.result)
+        else:
+            st.error(f"❌ PPT 생성에 실패했습니다. ({deck_job.error})")
+
+if st.session_state.get("deck_result") and not artifact_store.exists(st.session_state["deck_result"][0]):
+    st.session_state["deck_result"] = None
+    st.warning("⌛ 생성한 PPT의 보관 기간이 지났습니다. 다시 생성하세요.")
+
+if st.session_state.get("deck_result"):
+    artifact_id, meta, cache_stats = st.session_state["deck_result"]
+    # 덱 바이트는 세션에 두지 않고, 버튼을 누를 때만 보관소 파일을 열어 내려보냄
+    st.download_button("📥 PPT 다운로드", lambda: artifact_store.open(artifact_id), "paydo_script_ai.pptx",
+                       mime="application/vnd.openxmlformats-officedocument.presentationml.presentation")
+    st.success(f"총 {meta['slide_count']}개의 슬라이드가 생성되었습니다.")
+    if meta.get("sections"):
+        st.caption(f"🗂 주제별 섹션 {meta['sections']}개 (섹션마다 제목 슬라이드 포함)")
+    if cache_stats:
+        total = cache_stats["hits"] + cache_stats["misses"]
+        st.caption(
+            f"🧠 임베딩 캐시: 적중률 {cache_stats['hits'] / total:.0%} "
+            f"({cache_stats['hits']}/{total}문장), 새로 인코딩 {cache_stats['encoded']}문장 "
+            f"{cache_stats['encode_seconds']:.2f}초, 절약 약 {cache_stats['saved_seconds']:.2f}초"
         )
-        ppt = create_ppt(slides, flags, max_chars, font_size)
-
-        if ppt:
-            ppt_io = io.BytesIO()
-            ppt.save(ppt_io)
-            ppt_io.seek(0)
-            st.download_button("📥 PPT 다운로드", ppt_io, "paydo_script_ai.pptx",
-                               mime="application/vnd.openxmlformats-officedocument.presentationml.presentation")
-            st.success(f"총 {len(slides)}개의 슬라이드가 생성되었습니다.")
-            if any(flags):
-                flagged = [i+1 for i, f in enumerate(flags) if f]
-                st.warning(f"⚠️ 확인이 필요한 슬라이드: {flagged}")
\ No newline at end of file
+    if meta["flagged"]:
+        st.warning(f"⚠️ 확인이 필요한 슬라이드: {meta['flagged']}")
+
+job_stats = job_queue.stats()
+st.sidebar.caption(f"🧠 인코더: {ENCODER_BACKEND}")
+st.sidebar.caption(f"💾 결과 캐시: 적중 {deck_cache.hits}회 / 미스 {deck_cache.misses}회")
+artifact_stats = artifact_store.stats()
+st.sidebar.caption(
+    f"📦 다운로드 보관소: {artifact_stats['count']}개, {artifact_stats['bytes'] / (1024 * 1024):.1f}MB "
+    f"/ {artifact_store.max_bytes / (1024 * 1024):.0f}MB"
+)
+st.sidebar.caption(
+    f"⏳ 작업 큐: 실행 중 {job_stats['running']}/{job_stats['max_workers']}, 대기 {job_stats['queued']}"
+)
+render_metrics_panel()
@@ -0,0 +1,153 @@
+# 생성된 PPT 임시 보관소
+#
+# 세션마다 덱 바이트(io.BytesIO)를 들고 있으면 동시 사용자 수 × 덱 크기만큼 Streamlit 프로세스 메모리가 늘어나므로,
+# 덱은 만들자마자 임시 폴더의 파일로 내려 두고 세션·작업 결과에는 아티팩트 ID만 남깁니다.
+# 다운로드 버튼은 누를 때만 파일을 열어 읽습니다.
+#
+# 마지막으로 쓴 지 ttl초가 지난 파일은 지우고, 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 파일부터 지웁니다.
+# (임시 폴더가 tmpfs면 이 파일들도 메모리를 차지하므로 max_bytes가 곧 전체 메모리 상한입니다.)
+# 여러 앱 프로세스가 같은 폴더를 나눠 쓸 수 있도록 상태는 파일 시스템(mtime, 크기)에만 둡니다.
+#
+# 사용 예:
+#   artifact_id = store.write(prs.save)            # 파일 객체를 받는 저장 함수
+#   st.download_button("다운로드", lambda: store.open(artifact_id), "deck.pptx")
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+
+DEFAULT_ARTIFACT_DIR = os.environ.get("PAYDO_ARTIFACT_DIR", os.path.join(tempfile.gettempdir(), "paydo-artifacts"))
+DEFAULT_TTL = float(os.environ.get("PAYDO_ARTIFACT_TTL", str(60 * 60)))  # 초
+DEFAULT_MAX_BYTES = int(os.environ.get("PAYDO_ARTIFACT_MAX_MB", "512")) * 1024 * 1024
+SWEEP_INTERVAL = 60  # 쓰기가 없어도 열기·확인 때 이 간격(초)마다 오래된 파일을 정리
+
+_id_pattern = re.compile(r"[0-9a-f]{32}")
+
+
+class ArtifactStore:
+    """덱 파일을 임시 폴더에 보관하고 ID로 돌려줍니다. 오래됐거나 용량을 넘친 파일은 자동으로 지웁니다."""
+
+    def __init__(self, directory=DEFAULT_ARTIFACT_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES, suffix=".pptx"):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.expired = 0  # TTL이 지나 지운 파일 수
+        self.evicted = 0  # 용량 상한 때문에 지운 파일 수
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        os.makedirs(directory, exist_ok=True)
+        self.sweep()  # 이전 실행이 남긴 파일 정리
+
+    def path(self, artifact_id):
+        if not _id_pattern.fullmatch(artifact_id or ""):
+            raise ValueError(f"잘못된 아티팩트 ID입니다: {artifact_id!r}")
+        return os.path.join(self.directory, artifact_id + self.suffix)
+
+    def write(self, write_fn):
+        """write_fn(파일 객체)로 새 아티팩트를 쓰고 ID를 반환합니다. 실패하면 쓰다 만 파일은 남기지 않습니다."""
+        artifact_id = uuid.uuid4().hex
+        path = self.path(artifact_id)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                write_fn(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.sweep(keep=artifact_id)
+        return artifact_id
+
+    def copy(self, f):
+        """읽기용 파일 객체의 내용을 새 아티팩트로 복사하고 ID를 반환합니다 (메모리에 다 올리지 않음)."""
+        return self.write(lambda out: shutil.copyfileobj(f, out))
+
+    def open(self, artifact_id):
+        """읽기용 파일 객체. 지워진 아티팩트면 FileNotFoundError. 연 시각을 최근 사용 시각으로 기록합니다."""
+        path = self.path(artifact_id)
+        f = open(path, "rb")
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._maybe_sweep()
+        return f
+
+    def exists(self, artifact_id):
+        self._maybe_sweep()
+        return os.path.exists(self.path(artifact_id))
+
+    def size(self, artifact_id):
+        return os.path.getsize(self.path(artifact_id))
+
+    def delete(self, artifact_id):
+        try:
+            os.remove(self.path(artifact_id))
+        except OSError:
+            pass
+
+    def _maybe_sweep(self):
+        if time.monotonic() - self._last_sweep >= SWEEP_INTERVAL:
+            self.sweep()
+
+    def sweep(self, keep=None):
+        """TTL이 지난 파일을 지우고, 남은 전체 크기가 상한을 넘으면 오래 쓰지 않은 파일부터 지웁니다 (keep은 제외)."""
+        with self._lock:
+            self._last_sweep = time.monotonic()
+            now = time.time()
+            entries = []
+            for name in os.listdir(self.directory):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith(".tmp"):
+                    # 쓰는 중에 프로세스가 죽어 남은 임시 파일
+                    if now - stat.st_mtime > self.ttl:
+                        self._remove(path)
+                    continue
+                if not name.endswith(self.suffix):
+                    continue
+                if now - stat.st_mtime > self.ttl and name != f"{keep}{self.suffix}":
+                    if self._remove(path):
+                        self.expired += 1
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if name == f"{keep}{self.suffix}":
+                    continue
+                if self._remove(os.path.join(self.directory, name)):
+                    self.evicted += 1
+                total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def stats(self):
+        """보관 중인 파일 수·전체 크기와, 지금까지 TTL·용량 때문에 지운 파일 수."""
+        count = total = 0
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                try:
+                    total += os.path.getsize(os.path.join(self.directory, name))
+                    count += 1
+                except OSError:
+                    continue
+        return {"count": count, "bytes": total, "expired": self.expired, "evicted": self.evicted}
@@ -0,0 +1,148 @@
+# Paydo 촬영 대본 일괄 변환 CLI
+#
+# 사용 예:
+#   python batch.py scripts/ -o decks/
+#   python batch.py "scripts/*.docx" -o decks/ --max-lines 4 --workers 8
+#   python batch.py "exports/*.text" -o decks/ --reader txt
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ppt_core import (
+    iter_split_and_group_text,
+    split_and_group_text_optimal,
+    create_ppt,
+    create_ppt_from_template,
+)
+from deck_writer import COMPRESSION, write_deck
+from readers import READERS, iter_lines, reader_name
+
+
+# 입력 경로(폴더 또는 glob 패턴)에서 대본 파일 목록 수집
+# (reader를 지정하지 않으면 읽을 수 있는 확장자만, 지정하면 폴더 안의 모든 파일을 그 형식으로 읽음)
+def collect_input_files(inputs, reader=None):
+    files = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*")
+        for path in sorted(glob.glob(pattern)):
+            # Word 임시 잠금 파일(~$...)은 제외
+            if os.path.isfile(path) and (reader or reader_name(path)) and not os.path.basename(path).startswith("~$"):
+                files.append(path)
+    return list(dict.fromkeys(files))
+
+
+# 입력 파일별 출력 경로: 입력 파일들의 공통 상위 폴더 기준 상대 경로를 output_dir 아래에 그대로 만듦
+# (a/intro.docx → a/intro.pptx, b/intro.txt → b/intro.pptx). 그래도 겹치면(같은 폴더의 intro.docx와 intro.txt)
+# 하나가 다른 하나를 덮어쓰지 않도록 ValueError
+def output_paths(files, output_dir):
+    absolute = [os.path.abspath(path) for path in files]
+    root = os.path.commonpath([os.path.dirname(path) for path in absolute])
+    paths = {}
+    sources = {}
+    for path, absolute_path in zip(files, absolute):
+        relative = os.path.splitext(os.path.relpath(absolute_path, root))[0] + ".pptx"
+        output_path = os.path.join(output_dir, relative)
+        key = os.path.normcase(output_path)
+        if key in sources:
+            raise ValueError(f"{sources[key]}와(과) {path}의 출력 파일이 {output_path}(으)로 같습니다.")
+        sources[key] = path
+        paths[path] = output_path
+    return paths
+
+
+# 파일 하나를 PPT로 변환 (작업 프로세스에서 실행)
+def convert_file(
+    path, output_path, max_lines_per_slide, max_chars_per_line_ppt, font_size, render_mode="shapes", packing="greedy",
+    compression="deflate", reader=None, render_workers=1,
+):
+    start = time.perf_counter()
+    lines = iter_lines(path, reader)
+    if packing == "optimal":
+        # 최적 배치는 경계를 문서 전체에서 고르므로 텍스트를 모두 읽은 뒤 분할
+        slides = split_and_group_text_optimal("\n".join(lines), max_lines_per_slide, max_chars_per_line_ppt)
+    else:
+        # 문서 전체를 올리지 않고 문단을 읽는 대로 슬라이드로 분할
+        slides = list(iter_split_and_group_text(lines, max_lines_per_slide, max_chars_per_line_ppt))
+    if render_mode == "stream":
+        write_deck(slides, output_path, font_size=font_size, compression=compression, workers=render_workers)
+    else:
+        render = create_ppt_from_template if render_mode == "template" else create_ppt
+        render(slides, font_size=font_size).save(output_path)
+    return output_path, len(slides), sum(slide.needs_check for slide in slides), time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="촬영 대본 폴더를 PPT로 일괄 변환합니다.")
+    parser.add_argument("inputs", nargs="+", help=f"대본 파일({', '.join(READERS)})이 있는 폴더 또는 glob 패턴")
+    parser.add_argument("-o", "--output-dir", default="output", help="PPT 저장 폴더 (기본값: output)")
+    parser.add_argument("--max-lines", type=int, default=5, help="슬라이드당 최대 줄 수 (기본값: 5)")
+    parser.add_argument("--max-chars", type=int, default=18, help="한 줄당 최대 글자 수 (기본값: 18)")
+    parser.add_argument("--font-size", type=int, default=54, help="폰트 크기 (기본값: 54)")
+    parser.add_argument(
+        "--render-mode", choices=["shapes", "template", "stream"], default="shapes",
+        help="shapes: 슬라이드마다 도형 생성, template: template.pptx 원형 슬라이드 복제 (더 빠름), "
+             "stream: shapes와 같은 덱을 슬라이드 XML로 바로 저장 (가장 빠르고 메모리 적음)",
+    )
+    parser.add_argument(
+        "--compression", choices=list(COMPRESSION), default="deflate",
+        help="stream 모드의 ZIP 압축 방식 (stored: 압축 안 함, 더 빠르지만 파일이 큼)",
+    )
+    parser.add_argument(
+        "--packing", choices=["greedy", "optimal"], default="greedy",
+        help="greedy: 순서대로 채우기, optimal: 동적 계획법으로 슬라이드 경계 선택 (빈 슬라이드·문장 중간 분할 감소)",
+    )
+    parser.add_argument(
+        "--render-workers", type=int, default=1,
+        help="stream 모드에서 파일 하나의 슬라이드 XML을 나눠 만들 프로세스 수 (파일은 적고 덱이 클 때, 기본값: 1)",
+    )
+    parser.add_argument(
+        "--reader", choices=list(READERS),
+        help="모든 입력 파일을 이 형식으로 읽음 (기본값: 확장자로 판단)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="작업 프로세스 수 (기본값: CPU 코어 수)")
+    args = parser.parse_args(argv)
+
+    files = collect_input_files(args.inputs, args.reader)
+    if not files:
+        print("변환할 대본 파일이 없습니다.", file=sys.stderr)
+        return 1
+    try:
+        outputs = output_paths(files, args.output_dir)
+    except ValueError as e:
+        print(f"출력 파일 이름이 겹칩니다: {e} 입력 파일을 나눠서 변환하세요.", file=sys.stderr)
+        return 1
+    for directory in sorted({os.path.dirname(output_path) for output_path in outputs.values()}):
+        os.makedirs(directory, exist_ok=True)
+
+    failed = 0
+    total_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(files))) as executor:
+        futures = {
+            executor.submit(
+                convert_file, path, outputs[path], args.max_lines, args.max_chars, args.font_size, args.render_mode,
+                args.packing, args.compression, args.reader, args.render_workers,
+            ): path
+            for path in files
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                output_path, slide_count, check_count, elapsed = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[실패] {path}: {e}", file=sys.stderr)
+                continue
+            note = f", 확인 필요 {check_count}장" if check_count else ""
+            print(f"[완료] {path} -> {output_path} ({slide_count}장{note}, {elapsed:.2f}초)")
+
+    print(f"총 {len(files)}개 파일, 실패 {failed}개, {time.perf_counter() - total_start:.2f}초")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1012 @@
+# Paydo 성능 측정 스크립트
+#
+# 사용 예:
+#   python bench.py extract --pages 500
+#   python bench.py render --slides 300
+#   python bench.py encode --sentences 2000
+#   python bench.py backends --backends torch onnx onnx-int8 --threads 1 4
+#   python bench.py startup
+#   python bench.py kss --sentences 10000
+#   python bench.py packing --lines 50000
+#   python bench.py write --slides 500
+#   python bench.py parallel --slides 5000 --workers 1 2 4 8 16
+#   python bench.py readers --paragraphs 50000
+#   python bench.py revise --lines 770
+#   python bench.py topics --sentences 20000
+#   python bench.py soak --sessions 100 --slides 100
+#   python bench.py pipeline --paragraphs 200 --output bench_results/$(git rev-parse --short HEAD).json
+
+import argparse
+import io
+import json
+import multiprocessing
+import platform
+import statistics
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+import docx
+
+from ppt_core import (
+    extract_text_from_word,
+    split_and_group_text,
+    split_and_group_text_optimal,
+    iter_lines_from_word,
+    iter_split_and_group_text,
+    create_ppt,
+    create_ppt_from_template,
+    Slide,
+)
+from text_width import wrap_paragraphs
+from deck_writer import revise_deck, slide_manifest, write_deck
+from readers import iter_paragraphs
+from topics import segment_topics
+
+import ai_core
+from embedding_cache import EmbeddingCache
+
+SAMPLE_SENTENCES = [
+    "안녕하세요, 오늘 촬영할 대본입니다.",
+    "이번 장면에서는 제품의 주요 기능을 천천히 설명해 주세요.",
+    "카메라를 보면서 자연스럽게 웃어 주시면 됩니다!",
+    "Next, show the packaging and read the tagline slowly.",
+    "마지막으로 구독과 좋아요 부탁드린다는 멘트로 마무리합니다.",
+]
+
+
+# 지정한 쪽수 분량의 테스트용 Word 파일 생성 (한 쪽에 약 20문단)
+def make_sample_docx(path, pages):
+    doc = docx.Document()
+    for i in range(pages * 20):
+        doc.add_paragraph(f"{i + 1}. " + " ".join(SAMPLE_SENTENCES[j % len(SAMPLE_SENTENCES)] for j in range(i, i + 3)))
+    doc.save(path)
+
+
+def _run_extract(mode, path, max_lines, max_chars, queue):
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        if mode == "docx":
+            slides = split_and_group_text(extract_text_from_word(f), max_lines, max_chars)
+        else:
+            slides = list(iter_split_and_group_text(iter_lines_from_word(f), max_lines, max_chars))
+    elapsed = time.perf_counter() - start
+    # Linux에서 ru_maxrss 단위는 KB
+    queue.put((len(slides), elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+# 추출 + 분할 단계를 별도 프로세스에서 실행해 최대 메모리를 독립적으로 측정
+def bench_extract(args):
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sample.docx")
+        make_sample_docx(path, args.pages)
+        print(f"{args.pages}쪽 문서 ({os.path.getsize(path) / 1024:.0f} KB)")
+        for mode in ("docx", "stream"):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run_extract, args=(mode, path, args.max_lines, args.max_chars, queue))
+            proc.start()
+            slide_count, elapsed, peak_mb = queue.get()
+            proc.join()
+            print(f"{mode:>8}: {slide_count}장, {elapsed:.2f}초, 최대 RSS {peak_mb:.1f} MB")
+
+
+# 벤치마크용 슬라이드 (열 장마다 '확인 필요' 표시)
+def _make_render_slides(count):
+    return [
+        Slide(wrap_paragraphs(" ".join(SAMPLE_SENTENCES[j % len(SAMPLE_SENTENCES)] for j in range(i, i + 2)), 18), i % 10 == 0)
+        for i in range(count)
+    ]
+
+
+# 슬라이드 렌더링 속도 비교: 도형을 하나씩 만드는 방식 vs 원형 XML 복제 방식
+def bench_render(args):
+    slides = _make_render_slides(args.slides)
+    for mode, render in (("shapes", create_ppt), ("template", create_ppt_from_template)):
+        start = time.perf_counter()
+        render(slides)
+        elapsed = time.perf_counter() - start
+        print(f"{mode:>8}: {args.slides}장, {elapsed:.2f}초, 초당 {args.slides / elapsed:.0f}장")
+
+
+def _write_deck_bytes(mode, slides):
+    out = io.BytesIO()
+    if mode == "python-pptx":
+        create_ppt(slides).save(out)
+    else:
+        write_deck(slides, out, compression=mode.split("-", 1)[1])
+    return out.getvalue()
+
+
+def _run_write(mode, slide_count, queue):
+    slides = _make_render_slides(slide_count)
+    base_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    start = time.perf_counter()
+    size = len(_write_deck_bytes(mode, slides))
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, size, base_mb, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+# 덱 저장 비교: python-pptx 객체 트리 + prs.save() vs 슬라이드 XML을 ZIP에 바로 쓰는 방식 (압축 방식별)
+def bench_write(args):
+    modes = ("python-pptx", "stream-deflate", "stream-stored")
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{args.slides}장")
+    for mode in modes:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_write, args=(mode, args.slides, queue))
+        proc.start()
+        elapsed, size, base_mb, peak_mb = queue.get()
+        proc.join()
+        print(f"  {mode:>14}: {elapsed:.2f}초, {size / 1024:.0f} KB, 최대 RSS {peak_mb:.1f} MB (시작 시 {base_mb:.1f} MB)")
+
+    # python-pptx로 다시 읽어 두 방식의 슬라이드가 같은지 확인
+    from pptx import Presentation
+
+    slides = _make_render_slides(min(args.slides, 50))
+    expected = Presentation(io.BytesIO(_write_deck_bytes("python-pptx", slides)))
+    for mode in modes[1:]:
+        actual = Presentation(io.BytesIO(_write_deck_bytes(mode, slides)))
+        same = len(actual.slides) == len(expected.slides) and all(
+            a._element.xml == b._element.xml and a.slide_layout.name == b.slide_layout.name
+            for a, b in zip(actual.slides, expected.slides)
+        )
+        print(f"  {mode:>14}: python-pptx 결과와 {'동일' if same else '다름!'}")
+
+
+# 병렬 렌더링 속도 곡선: 작업 프로세스 수별 write_deck 시간과 직렬 대비 속도 향상
+# (첫 실행은 풀·작업 프로세스 시작 비용 포함, 두 번째는 앱처럼 풀을 재사용할 때)
+def bench_parallel(args):
+    from concurrent.futures import ProcessPoolExecutor
+
+    slides = _make_render_slides(args.slides)
+    print(f"{args.slides}장, 묶음 {args.chunk_size}장, CPU {os.cpu_count()}개, 압축 {args.compression}")
+    out = io.BytesIO()
+    start = time.perf_counter()
+    write_deck(slides, out, compression=args.compression)
+    serial = time.perf_counter() - start
+    with zipfile.ZipFile(out) as package:
+        expected = {name: package.read(name) for name in package.namelist()}
+    print(f"  {'직렬':>8}: {serial:.2f}초")
+
+    for workers in args.workers:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            timings = []
+            for _ in range(2):
+                out = io.BytesIO()
+                start = time.perf_counter()
+                write_deck(slides, out, compression=args.compression, executor=pool, chunk_size=args.chunk_size)
+                timings.append(time.perf_counter() - start)
+        with zipfile.ZipFile(out) as package:
+            same = package.namelist() == list(expected) and all(package.read(name) == expected[name] for name in expected)
+        cold, warm = timings
+        print(
+            f"  {workers:>4}개 : 첫 실행 {cold:.2f}초, 풀 재사용 {warm:.2f}초, "
+            f"직렬 대비 {serial / warm:.2f}배{'' if same else ' (결과 다름!)'}"
+        )
+
+
+# 문장 임베딩 속도 비교: 문장마다 model.encode 호출 vs 대본 전체 한 번에 배치 호출
+def bench_encode(args):
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(args.model)
+    sentences = [f"{SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)]} ({i + 1})" for i in range(args.sentences)]
+
+    start = time.perf_counter()
+    single = np.stack([model.encode(sentence) for sentence in sentences])
+    single_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = model.encode(sentences, batch_size=64, convert_to_numpy=True)
+    batched_elapsed = time.perf_counter() - start
+
+    print(f"{args.sentences}문장, 최대 오차 {np.abs(single - batched).max():.2e}")
+    print(f"  문장별: {single_elapsed:.2f}초 (초당 {args.sentences / single_elapsed:.0f}문장)")
+    print(f"  배치  : {batched_elapsed:.2f}초 (초당 {args.sentences / batched_elapsed:.0f}문장, {single_elapsed / batched_elapsed:.1f}배)")
+
+
+# 작업 프로세스에서 실행: 백엔드 하나를 불러와 로딩 시간·RSS·인코딩 처리량을 재고 임베딩은 파일로 넘김
+def _run_backend(backend, threads, sentences, embeddings_path, queue):
+    import numpy as np
+    from encoders import load_encoder
+
+    try:
+        base_mb = _proc_status_mb("VmRSS") or 0.0
+        start = time.perf_counter()
+        model = load_encoder(backend, threads=threads)
+        if backend == "torch":
+            import torch
+            torch.set_num_threads(threads)
+        load_seconds = time.perf_counter() - start
+        loaded_mb = (_proc_status_mb("VmRSS") or 0.0) - base_mb
+        model.encode(sentences[:64], batch_size=64, convert_to_numpy=True, normalize_embeddings=True)  # 첫 배치 워밍업
+        start = time.perf_counter()
+        embeddings = model.encode(sentences, batch_size=64, convert_to_numpy=True, normalize_embeddings=True)
+        elapsed = time.perf_counter() - start
+        np.save(embeddings_path, embeddings)
+        queue.put((None, load_seconds, loaded_mb, _peak_rss_mb() - base_mb, elapsed))
+    except Exception as e:
+        queue.put((f"{type(e).__name__}: {e}", 0.0, 0.0, 0.0, 0.0))
+
+
+# 인코더 백엔드 비교: 백엔드·스레드 수마다 새 프로세스에서 로딩 시간, 메모리, 처리량을 재고 torch 결과와의 일치도 확인
+def bench_backends(args):
+    import numpy as np
+    from encoders import cosine_agreement
+
+    rng = random.Random(args.seed)
+    sentences = [
+        f"{rng.choice(KOREAN_SUBJECTS)} {rng.choice(KOREAN_PREDICATES)}{rng.choice(KOREAN_ENDINGS)} ({i + 1})"
+        for i in range(args.sentences)
+    ]
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    print(f"{args.sentences}문장, 배치 64")
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in args.backends:
+            for threads in args.threads:
+                path = os.path.join(tmp, f"{backend}-{threads}.npy")
+                queue = ctx.Queue()
+                proc = ctx.Process(target=_run_backend, args=(backend, threads, sentences, path, queue))
+                proc.start()
+                error, load_seconds, loaded_mb, peak_mb, elapsed = queue.get()
+                proc.join()
+                label = f"{backend} ×{threads}"
+                if error:
+                    print(f"  {label:>14}: 실패 ({error})")
+                    continue
+                results[backend] = np.load(path)
+                print(
+                    f"  {label:>14}: 로딩 {load_seconds:.2f}초 (RSS +{loaded_mb:.0f} MB), "
+                    f"인코딩 {elapsed:.2f}초 (초당 {args.sentences / elapsed:.0f}문장), 최대 RSS +{peak_mb:.0f} MB"
+                )
+
+    reference = results.get("torch")
+    if reference is None:
+        print("torch 결과가 없어 일치도는 확인하지 않음")
+        return
+    adjacent = np.einsum("ij,ij->i", reference[:-1], reference[1:])
+    for backend, embeddings in results.items():
+        if backend == "torch":
+            continue
+        cosines = cosine_agreement(reference, embeddings)
+        candidate_adjacent = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
+        # 문맥 유사도 기준으로 슬라이드를 나누는 결정이 torch와 달라지는 인접 문장 쌍의 비율
+        flips = np.mean((adjacent >= args.similarity_threshold) != (candidate_adjacent >= args.similarity_threshold))
+        print(
+            f"  {backend} vs torch: 코사인 평균 {cosines.mean():.4f}, 최소 {cosines.min():.4f}, "
+            f"인접 유사도 차이 최대 {np.abs(adjacent - candidate_adjacent).max():.4f}, "
+            f"기준 {args.similarity_threshold}에서 분할 결정이 바뀐 비율 {flips:.2%}"
+        )
+
+
+KOREAN_SUBJECTS = ["저희 제품은", "오늘 소개할 기능은", "이 장면에서 진행자는", "고객님들이", "촬영 팀은", "새로운 디자인은"]
+KOREAN_PREDICATES = [
+    "생각보다 훨씬 가볍고 튼튼합니다",
+    "화면을 보면서 천천히 설명합니다",
+    "많은 분들께 사랑받고 있어요",
+    "다음 컷에서 다시 등장합니다",
+    "배터리가 하루 종일 유지됩니다",
+    "정말 편하다고 말씀하셨죠",
+]
+KOREAN_ENDINGS = [".", "!", "?", "", ""]  # 문장 부호가 없는 구어체 문장도 섞음
+
+
+# 현실적인 구어체 한국어 대본 문단 생성 (문단당 3~8문장)
+def make_korean_paragraphs(sentence_count, seed=0):
+    rng = random.Random(seed)
+    paragraphs = []
+    remaining = sentence_count
+    while remaining > 0:
+        size = min(remaining, rng.randint(3, 8))
+        paragraphs.append(" ".join(
+            f"{rng.choice(KOREAN_SUBJECTS)} {rng.choice(KOREAN_PREDICATES)}{rng.choice(KOREAN_ENDINGS)}"
+            for _ in range(size)
+        ))
+        remaining -= size
+    return paragraphs
+
+
+# KSS 문장 분할 비교: 문단별 호출 vs 한 번의 배치 호출 vs 일부 문단만 수정 후 재실행(메모)
+def bench_kss(args):
+    import kss
+    from sentence_split import SentenceSplitter
+
+    paragraphs = make_korean_paragraphs(args.sentences)
+    kss.split_sentences(paragraphs[0])  # 백엔드 초기화 비용은 제외
+
+    start = time.perf_counter()
+    for paragraph in paragraphs:
+        kss.split_sentences(paragraph)
+    per_paragraph = time.perf_counter() - start
+
+    splitter = SentenceSplitter()
+    start = time.perf_counter()
+    splitter.split(paragraphs)
+    batched = time.perf_counter() - start
+
+    edited = list(paragraphs)
+    for i in range(0, len(edited), 100):  # 1% 문단 수정
+        edited[i] += " 수정된 문장입니다."
+    start = time.perf_counter()
+    splitter.split(edited)
+    rerun = time.perf_counter() - start
+
+    print(f"{len(paragraphs)}문단 / 약 {args.sentences}문장")
+    print(f"     문단별: {per_paragraph:.2f}초")
+    print(f"       배치: {batched:.2f}초 ({per_paragraph / batched:.1f}배)")
+    print(f"  1% 수정 후: {rerun:.2f}초 (메모 적중 {splitter.hits}, 미스 {splitter.misses})")
+
+
+STARTUP_MODULES = ["streamlit", "pptx", "docx", "numpy", "kss", "sentence_transformers"]
+
+_IMPORT_TIME_SCRIPT = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+# 첫 화면 렌더링 시간: streamlit은 서버에 이미 올라와 있으므로 import 이후 첫 스크립트 실행만 측정
+_FIRST_RENDER_SCRIPT = """
+import os, time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({path!r}, default_timeout=600)
+start = time.perf_counter()
+app.run()
+print(time.perf_counter() - start, len(app.exception))
+os._exit(0)  # 백그라운드 모델 로딩 스레드를 기다리지 않고 종료
+"""
+
+
+def _time_in_fresh_process(script):
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        return None
+    return result.stdout.split()
+
+
+# 콜드 스타트 측정: 모듈별 import 시간과 앱별 첫 화면 렌더링 시간 (모두 새 프로세스에서)
+def bench_startup(args):
+    print("import 시간")
+    for module in STARTUP_MODULES:
+        output = _time_in_fresh_process(_IMPORT_TIME_SCRIPT.format(module=module))
+        print(f"  {module:>22}: " + (f"{float(output[0]):.2f}초" if output else "설치되지 않음"))
+
+    print("첫 화면 렌더링 시간")
+    for app in ("app.py", "app_ai.py"):
+        output = _time_in_fresh_process(_FIRST_RENDER_SCRIPT.format(path=app))
+        if output is None:
+            print(f"  {app:>22}: 실행 실패")
+        else:
+            errors = f" (예외 {output[1]}개)" if output[1] != "0" else ""
+            print(f"  {app:>22}: {float(output[0]):.2f}초{errors}")
+
+
+ENGLISH_SENTENCES = [
+    "Hold the product up to the camera for three seconds.",
+    "Now switch to the close-up angle and smile",
+    "Thanks for watching, and see you in the next episode!",
+]
+
+
+# 전체 파이프라인 측정용 대본: 한국어/영어 문단 사이에 빈 줄을 두고,
+# long_every 문단마다 문장 부호 없이 아주 긴 한 문장을 넣어 강제 분할 경로도 거치게 함
+# (KSS의 pecab 백엔드는 문장 부호 없는 긴 문단에서 길이보다 훨씬 빠르게 느려지므로 long_words는 적당히)
+def make_script_paragraphs(paragraph_count, seed=0, long_every=20, long_words=20):
+    rng = random.Random(seed)
+    korean = make_korean_paragraphs(paragraph_count * 5, seed)
+    paragraphs = []
+    for i in range(paragraph_count):
+        if long_every and i % long_every == long_every - 1:
+            paragraphs.append(" ".join(rng.choice(KOREAN_SUBJECTS + KOREAN_PREDICATES) for _ in range(long_words)))
+        elif i % 4 == 3:
+            paragraphs.append(" ".join(rng.choice(ENGLISH_SENTENCES) for _ in range(rng.randint(1, 3))))
+        else:
+            paragraphs.append(korean[i % len(korean)])
+    return paragraphs
+
+
+# SBERT 모델이 로컬에 받아져 있으면 실제 모델, 아니면(또는 --encoder stub) 스텁 인코더
+def _bench_encoder(choice):
+    from encoders import stub_encode
+
+    if choice != "stub":
+        try:
+            from huggingface_hub import try_to_load_from_cache
+            from sentence_transformers import SentenceTransformer
+
+            if choice == "sbert" or isinstance(try_to_load_from_cache(ai_core.MODEL_NAME, "modules.json"), str):
+                model = SentenceTransformer(ai_core.MODEL_NAME)
+                return "sbert", lambda sentences: model.encode(
+                    sentences, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+                )
+        except ImportError:
+            if choice == "sbert":
+                raise
+    return "stub", stub_encode
+
+
+class _Timer:
+    """단계별 소요 시간(초)을 누적합니다."""
+
+    def __init__(self):
+        self.seconds = {}
+
+    def add(self, stage, seconds):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def wrap(self, stage, fn):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+        return timed
+
+
+def _save_seconds(prs, timer):
+    start = time.perf_counter()
+    out = io.BytesIO()
+    prs.save(out)
+    timer.add("save", time.perf_counter() - start)
+    return out.getbuffer().nbytes
+
+
+# app.py 경로: Word 추출 → 줄 단위 분할 → 렌더링·저장 (슬라이드를 .pptx에 바로 쓰므로 save 단계가 따로 없음)
+def _run_app_pipeline(docx_bytes, args):
+    timer = _Timer()
+    text = timer.wrap("extract", extract_text_from_word)(io.BytesIO(docx_bytes))
+    slides = timer.wrap("split", split_and_group_text)(text, args.max_lines, args.max_chars)
+    out = io.BytesIO()
+    timer.wrap("render", write_deck)(slides, out, font_size=54)
+    size = out.getbuffer().nbytes
+    return timer.seconds, {"slides": len(slides), "flagged": sum(slide.needs_check for slide in slides), "bytes": size}
+
+
+# Word 파일에서 비어 있지 않은 문단 목록 추출 (app_ai.py는 readers로 읽으므로 벤치의 AI 경로만 사용)
+def extract_paragraphs_from_word(file_like_object):
+    doc = docx.Document(file_like_object)
+    return [p.text for p in doc.paragraphs if p.text.strip()]
+
+
+# app_ai.py 경로: Word 추출 → KSS 문장 분할 → 임베딩 → 유사도 기반 묶기 → 렌더링 → 저장
+# (문장 분할과 임베딩은 split_text_into_slides_with_similarity 안에서 불리므로 감싸서 따로 재고, 나머지를 묶기 시간으로 봄)
+def _run_ai_pipeline(docx_bytes, args, encoder_name, encode_fn, cache_dir):
+    from sentence_split import SentenceSplitter
+
+    timer = _Timer()
+    paragraphs = timer.wrap("extract", extract_paragraphs_from_word)(io.BytesIO(docx_bytes))
+
+    splitter = SentenceSplitter()
+    splitter.split = timer.wrap("sentence_split", splitter.split)
+    embedding_cache = EmbeddingCache(f"bench-{encoder_name}", cache_dir=cache_dir)  # 실행마다 빈 캐시
+    embed = timer.wrap("embed", lambda sentences: embedding_cache.encode(sentences, encode_fn))
+    start = time.perf_counter()
+    slides = ai_core.split_text_into_slides_with_similarity(
+        paragraphs, args.max_lines, args.max_chars, args.similarity_threshold,
+        sentence_splitter=splitter, embed=embed,
+    )
+    timer.add("group", time.perf_counter() - start - timer.seconds["sentence_split"] - timer.seconds.get("embed", 0.0))
+
+    prs = timer.wrap("render", ai_core.create_ppt)(slides, 54)
+    size = _save_seconds(prs, timer)
+    return timer.seconds, {"slides": len(slides), "flagged": sum(slide.needs_check for slide in slides), "bytes": size}
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _summarize(runs):
+    stages = {}
+    for seconds, _ in runs:
+        for stage, value in seconds.items():
+            stages.setdefault(stage, []).append(value)
+    return {
+        "stages": {stage: {"median": statistics.median(values), "min": min(values), "runs": values} for stage, values in stages.items()},
+        "total": statistics.median(sum(seconds.values()) for seconds, _ in runs),
+        **runs[-1][1],
+    }
+
+
+# 전체 파이프라인 단계별 측정: 두 앱의 처리 경로를 같은 합성 대본으로 돌리고 결과를 JSON으로 기록
+def bench_pipeline(args):
+    paragraphs = make_script_paragraphs(args.paragraphs, args.seed, args.long_every, args.long_words)
+    doc = docx.Document()
+    for paragraph in paragraphs:
+        doc.add_paragraph(paragraph)
+    docx_io = io.BytesIO()
+    doc.save(docx_io)
+    docx_bytes = docx_io.getvalue()
+
+    results = {}
+    if "app" in args.apps:
+        results["app"] = _summarize([_run_app_pipeline(docx_bytes, args) for _ in range(args.repeat)])
+    if "app_ai" in args.apps:
+        encoder_name, encode_fn = _bench_encoder(args.encoder)
+        runs = []
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                runs.append(_run_ai_pipeline(docx_bytes, args, encoder_name, encode_fn, cache_dir))
+        results["app_ai"] = dict(_summarize(runs), encoder=encoder_name)
+
+    report = {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "params": {
+            "paragraphs": args.paragraphs, "long_every": args.long_every, "long_words": args.long_words,
+            "seed": args.seed, "repeat": args.repeat, "max_lines": args.max_lines, "max_chars": args.max_chars,
+            "similarity_threshold": args.similarity_threshold,
+        },
+        "results": results,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print(f"{args.paragraphs}문단 ({len(docx_bytes) / 1024:.0f} KB), 단계별 중앙값")
+    for app, result in results.items():
+        encoder = f", 인코더 {result['encoder']}" if "encoder" in result else ""
+        print(f"  {app} ({result['slides']}장, 확인 필요 {result['flagged']}장{encoder})")
+        for stage, timing in result["stages"].items():
+            line = f"    {stage:>14}: {timing['median'] * 1000:9.1f} ms"
+            previous = (baseline or {}).get(app, {}).get("stages", {}).get(stage)
+            if previous and previous["median"] > 0:
+                line += f"  (기준 대비 {timing['median'] / previous['median']:.2f}배)"
+            print(line)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+# 짧은 줄로 나눈 대본 줄 목록 (문단 사이에 빈 줄, long_every 문단마다 문장 부호 없는 긴 문장)
+def make_script_lines(line_count, seed=0, line_chars=30):
+    lines = []
+    for paragraph in make_script_paragraphs(line_count // 3 + 1, seed):
+        current = []
+        for word in paragraph.split():
+            current.append(word)
+            # 긴 문장은 한 줄로 남겨 강제 분할 경로를 타게 함
+            if sum(map(len, current)) > line_chars and len(paragraph) < 200:
+                lines.append(" ".join(current))
+                current = []
+        if current:
+            lines.append(" ".join(current))
+        lines.append("")
+        if len(lines) >= line_count:
+            break
+    return lines[:line_count]
+
+
+# 슬라이드 배치 비교: 줄 단위 그리디 분할 vs 동적 계획법 최적 분할
+def bench_packing(args):
+    text = "\n".join(make_script_lines(args.lines, args.seed))
+    print(f"{args.lines}줄, 슬라이드당 {args.max_lines}줄 / 한 줄 {args.max_chars}자")
+    for mode, split in (("greedy", split_and_group_text), ("optimal", split_and_group_text_optimal)):
+        split(text, args.max_lines, args.max_chars)  # 줄바꿈 메모를 채워 분할 자체만 비교
+        start = time.perf_counter()
+        slides = split(text, args.max_lines, args.max_chars)
+        elapsed = time.perf_counter() - start
+        sparse = sum(1 for slide in slides[:-1] if slide.line_count * 3 <= args.max_lines)
+        overflow = sum(1 for slide in slides if slide.line_count > args.max_lines)
+        fill = sum(min(slide.line_count, args.max_lines) for slide in slides) / (len(slides) * args.max_lines)
+        print(
+            f"  {mode:>8}: {elapsed:.2f}초, {len(slides)}장, 확인 필요 {sum(slide.needs_check for slide in slides)}장, "
+            f"줄 수 초과 {overflow}장, 1/3 이하로 빈 슬라이드 {sparse}장, 평균 채움 {fill:.0%}"
+        )
+
+
+# 덱 ZIP의 항목 이름 → 내용 (두 덱이 같은지 비교용)
+def _deck_members(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {info.filename: zf.read(info) for info in zf.infolist()}
+
+
+# 수정본 만들기: 대본의 한 곳만 고쳤을 때 전체 다시 만들기(create_ppt + save, write_deck)와 revise_deck 비교
+def bench_revise(args):
+    lines = make_script_lines(args.lines, args.seed)
+    old_slides = split_and_group_text("\n".join(lines), args.max_lines, args.max_chars)
+    old_io = io.BytesIO()
+    write_deck(old_slides, old_io)
+    old_bytes = old_io.getvalue()
+    manifest = slide_manifest(old_slides)
+
+    # 대본 가운데쯤의 줄 하나: 글자 하나만 바꾸기(슬라이드 수 유지)와 그 앞에 새 문단 넣기(뒤쪽 번호가 모두 바뀜)
+    middle = next(i for i in range(len(lines) // 2, len(lines)) if len(lines[i]) > 10)
+    typo = list(lines)
+    typo[middle] = typo[middle][:-1] + "!"
+    inserted = list(lines)
+    inserted[middle:middle] = ["새로 추가한 문단입니다. 촬영 직전에 대사를 한 줄 더 넣었어요.", ""]
+
+    print(f"이전 덱 {len(old_slides)}장, {args.repeat}회 중 최솟값")
+    for label, edited in (("글자 수정", typo), ("문단 추가", inserted)):
+        slides = split_and_group_text("\n".join(edited), args.max_lines, args.max_chars)
+
+        def rebuild_python_pptx():
+            out = io.BytesIO()
+            create_ppt(slides, 54).save(out)
+            return out.getvalue(), None
+
+        def rebuild_stream():
+            out = io.BytesIO()
+            write_deck(slides, out)
+            return out.getvalue(), None
+
+        def revise(manifest=None):
+            out = io.BytesIO()
+            changed = revise_deck(io.BytesIO(old_bytes), slides, out, manifest=manifest)
+            return out.getvalue(), changed
+
+        results = {}
+        for mode, run in (
+            ("create_ppt", rebuild_python_pptx), ("write_deck", rebuild_stream),
+            ("revise", lambda: revise(manifest)), ("revise(해석)", revise),
+        ):
+            seconds = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                data, changed = run()
+                seconds.append(time.perf_counter() - start)
+            results[mode] = (min(seconds), data, changed)
+
+        _, reference, _ = results["write_deck"]
+        changed = results["revise"][2]
+        print(f"  {label}: {len(slides)}장, 새로 만든 슬라이드 {[i + 1 for i in changed]}")
+        for mode, (elapsed, data, _) in results.items():
+            same = "" if mode == "create_ppt" or _deck_members(data) == _deck_members(reference) else " (write_deck 결과와 다름!)"
+            speedup = results["create_ppt"][0] / elapsed
+            print(f"    {mode:>11}: {elapsed * 1000:7.1f} ms (create_ppt 대비 {speedup:5.1f}배, write_deck 대비 {results['write_deck'][0] / elapsed:4.1f}배){same}")
+
+
+# 형식별 합성 대본 파일 (txt/md/srt/docx/hwpx). hwp는 만들 수 없으므로 --hwp로 실제 파일을 지정
+def write_sample_script(path, reader, paragraphs):
+    from xml.sax.saxutils import escape
+
+    if reader == "docx":
+        doc = docx.Document()
+        for paragraph in paragraphs:
+            doc.add_paragraph(paragraph)
+        doc.save(path)
+    elif reader == "hwpx":
+        body = "".join(f"<hp:p><hp:run><hp:t>{escape(paragraph)}</hp:t></hp:run></hp:p>" for paragraph in paragraphs)
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+            package.writestr("mimetype", "application/hwp+zip")
+            package.writestr(
+                "Contents/section0.xml",
+                '<?xml version="1.0" encoding="UTF-8"?><hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+                f'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">{body}</hs:sec>',
+            )
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            for i, paragraph in enumerate(paragraphs):
+                if reader == "srt":
+                    start, end = time.gmtime(i * 3), time.gmtime(i * 3 + 2)
+                    f.write(f"{i + 1}\n{time.strftime('%H:%M:%S', start)},000 --> {time.strftime('%H:%M:%S', end)},500\n{paragraph}\n\n")
+                elif reader == "md" and i % 10 == 0:
+                    f.write(f"## {paragraph}\n\n")
+                elif reader == "md" and i % 3 == 0:
+                    f.write(f"- **{paragraph}**\n")
+                else:
+                    f.write(paragraph + "\n")
+
+
+# Linux에서는 최대 RSS(VmHWM)를 현재 값으로 되돌려, import 등 앞선 작업과 무관하게 구간의 최대 메모리를 잼
+def _reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _proc_status_mb(field):
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _peak_rss_mb():
+    peak = _proc_status_mb("VmHWM")
+    return peak if peak is not None else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# mmap으로 읽은 페이지는 RSS에 파일 캐시(회수 가능)로 잡히므로, 힙에 복사된 양은 RssAnon으로 따로 봄
+def _run_reader(path, reader, source_kind, queue):
+    _reset_peak_rss()
+    base_mb = _peak_rss_mb()
+    base_anon_mb = _proc_status_mb("RssAnon") or 0.0
+    start = time.perf_counter()
+    if source_kind == "read":
+        with open(path, "rb") as f:
+            source = io.BytesIO(f.read())
+    else:
+        source = path
+    paragraph_count = chars = 0
+    anon_mb = 0.0
+    for paragraph in iter_paragraphs(source, reader=reader):
+        paragraph_count += 1
+        chars += len(paragraph)
+        if paragraph_count == 1000:
+            anon_mb = (_proc_status_mb("RssAnon") or 0.0) - base_anon_mb  # 읽는 도중의 힙 증가량
+    elapsed = time.perf_counter() - start
+    queue.put((paragraph_count, chars, elapsed, _peak_rss_mb() - base_mb, anon_mb))
+
+
+# 형식별 읽기 처리량: 같은 대본을 형식마다 파일로 만들어 문단을 끝까지 읽는 시간과 최대 메모리 측정
+# (txt/srt는 mmap으로 읽는 경로 입력과, 파일 전체를 read()한 바이트 입력을 비교)
+def bench_readers(args):
+    paragraphs = make_script_paragraphs(args.paragraphs, args.seed)
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = []
+        for reader in args.formats:
+            if reader == "hwp":
+                if args.hwp:
+                    cases.append((reader, args.hwp))
+                else:
+                    print("      hwp: 샘플을 만들 수 없어 건너뜀 (--hwp로 실제 파일 지정)")
+                continue
+            path = os.path.join(tmp, f"sample.{reader}")
+            write_sample_script(path, reader, paragraphs)
+            cases.append((reader, path))
+
+        print(f"{args.paragraphs}문단")
+        for reader, path in cases:
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            for source_kind in ("path", "read") if reader in ("txt", "srt") else ("path",):
+                queue = ctx.Queue()
+                proc = ctx.Process(target=_run_reader, args=(path, reader, source_kind, queue))
+                proc.start()
+                paragraph_count, chars, elapsed, rss_mb, anon_mb = queue.get()
+                proc.join()
+                label = f"{reader} ({'mmap' if source_kind == 'path' and reader in ('txt', 'srt') else source_kind})"
+                print(
+                    f"  {label:>12}: 파일 {size_mb:5.1f} MB, {elapsed:.2f}초, 초당 {chars / elapsed / 1e6:.1f}M자 · "
+                    f"{paragraph_count / elapsed:,.0f}문단 ({paragraph_count}문단), "
+                    f"최대 RSS +{rss_mb:.1f} MB (힙 +{anon_mb:.1f} MB)"
+                )
+
+
+# 주제가 심어진 합성 임베딩: 길이가 제각각인 주제 블록마다 중심 벡터 + 잡음 (모든 문장이 공유하는 방향도 섞음)
+# 반환: (정규화된 float32 임베딩, 실제 주제 경계 목록)
+def make_topic_embeddings(sentence_count, dim=768, mean_length=40, noise=2.5, seed=0):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    lengths = []
+    while sum(lengths) < sentence_count:
+        lengths.append(int(rng.integers(mean_length // 2, mean_length * 3 // 2)))
+    lengths[-1] -= sum(lengths) - sentence_count
+    shared = rng.standard_normal(dim)
+    embeddings = np.concatenate([
+        np.repeat((rng.standard_normal(dim) + 1.5 * shared)[None], length, axis=0) for length in lengths
+    ])
+    embeddings += noise * rng.standard_normal((sentence_count, dim))
+    embeddings = embeddings.astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings, list(np.cumsum(lengths[:-1]))
+
+
+# 찾은 경계와 실제 경계를 tolerance 문장 오차까지 같은 것으로 보고 (재현율, 정밀도)
+def _boundary_scores(found, truth, tolerance=2):
+    recall = sum(any(abs(t - f) <= tolerance for f in found) for t in truth) / max(len(truth), 1)
+    precision = sum(any(abs(t - f) <= tolerance for t in truth) for f in found) / max(len(found), 1)
+    return recall, precision
+
+
+# 주제 분할: 블록 유사도만 쓸 때와 LSH 이웃 응집도를 더할 때의 시간·최대 메모리·경계 정확도
+# (모든 문장 쌍 유사도 행렬을 만들었다면 필요했을 메모리와 비교)
+def bench_topics(args):
+    embeddings, truth = make_topic_embeddings(args.sentences, args.dim, noise=args.noise, seed=args.seed)
+    matrix_mb = args.sentences ** 2 * 4 / (1024 * 1024)
+    print(
+        f"{args.sentences}문장 × {args.dim}차원, 실제 경계 {len(truth)}개 "
+        f"(임베딩 {embeddings.nbytes / (1024 * 1024):.1f} MB, n² 유사도 행렬이라면 {matrix_mb:,.0f} MB)"
+    )
+    for label, cohesion_weight in (("block", 0.0), ("block+lsh", 1.0)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        found = segment_topics(embeddings, cohesion_weight=cohesion_weight)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        recall, precision = _boundary_scores(found, truth)
+        print(
+            f"  {label:>10}: {elapsed:.2f}초, 최대 추가 메모리 {peak / (1024 * 1024):.1f} MB, "
+            f"경계 {len(found)}개, 재현율 {recall:.2f}, 정밀도 {precision:.2f}"
+        )
+
+
+# 세션 sessions개를 차례로 열어 각자 app_ai.generate_deck과 같은 렌더링·저장을 하고, 결과를 세션 상태처럼 끝까지 들고 있음
+#   bytes    : 이전 방식. 세션이 BytesIO로 저장한 덱 바이트를 들고, 덱 객체는 자동 GC에 맡김
+#   artifacts: 덱을 ArtifactStore 파일로 저장하고 세션은 ID만 들며, 저장 직후 덱 객체를 회수
+def _run_soak(mode, sessions, slide_count, artifact_dir, queue):
+    import gc
+    from artifacts import ArtifactStore
+
+    try:
+        store = ArtifactStore(artifact_dir) if mode == "artifacts" else None
+        base_slides = _make_render_slides(slide_count)
+        session_states = []
+        rss = []
+        gc_seconds = 0.0
+        start = time.perf_counter()
+        for number in range(sessions):
+            # 세션마다 내용이 다른 덱 (같은 바이트를 나눠 쓰지 않도록)
+            slides = [Slide([f"{number + 1}번 세션", *slide.lines], slide.needs_check) for slide in base_slides]
+            ppt = ai_core.create_ppt(slides, 54)
+            if mode == "bytes":
+                ppt_io = io.BytesIO()
+                ppt.save(ppt_io)
+                result = ppt_io.getvalue()
+            else:
+                result = store.write(ppt.save)
+                del ppt
+                gc_start = time.perf_counter()
+                gc.collect()
+                gc_seconds += time.perf_counter() - gc_start
+            session_states.append({"deck_result": (result, {"slide_count": len(slides)}, {})})
+            rss.append(_proc_status_mb("VmRSS") or 0.0)
+        elapsed = time.perf_counter() - start
+        queue.put((None, rss, _peak_rss_mb(), gc_seconds / sessions, elapsed, store.stats() if store else None))
+    except Exception as e:
+        queue.put((f"{type(e).__name__}: {e}", [], 0.0, 0.0, 0.0, None))
+
+
+# 장시간 메모리 측정: 동시에 열린 세션 수가 늘어날 때의 RSS 변화를 방식별로 새 프로세스에서 잼
+# (후반 절반 세션 동안의 세션당 RSS 증가가 0에 가까우면 세션 수와 무관하게 메모리가 일정한 정상 상태)
+def bench_soak(args):
+    ctx = multiprocessing.get_context("spawn")
+    checkpoints = sorted({1, 10, args.sessions // 4, args.sessions // 2, args.sessions} - {0})
+    print(f"세션 {args.sessions}개, 덱당 {args.slides}장 (create_ppt, 모든 세션이 결과를 들고 있음)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run_soak, args=(mode, args.sessions, args.slides, tmp, queue))
+            proc.start()
+            error, rss, peak_mb, gc_seconds, elapsed, store_stats = queue.get()
+            proc.join()
+            if error:
+                print(f"  {mode:>9}: 실패 ({error})")
+                continue
+            half = args.sessions // 2
+            slope = (rss[-1] - rss[half - 1]) / (args.sessions - half) if half else 0.0
+            timeline = " → ".join(f"{n}: {rss[n - 1]:.0f}" for n in checkpoints)
+            print(f"  {mode:>9}: RSS MB ({timeline}), 최대 {peak_mb:.0f} MB, 후반 세션당 {slope:+.2f} MB, {elapsed:.1f}초")
+            if store_stats is not None:
+                print(
+                    f"             gc.collect 평균 {gc_seconds * 1000:.1f} ms, "
+                    f"보관소 파일 {store_stats['count']}개 {store_stats['bytes'] / (1024 * 1024):.1f} MB"
+                )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Paydo 파이프라인 단계별 성능을 측정합니다.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    extract_parser = subparsers.add_parser("extract", help="Word 추출 + 분할: python-docx 방식과 스트리밍 방식 비교")
+    extract_parser.add_argument("--pages", type=int, default=500)
+    extract_parser.add_argument("--max-lines", type=int, default=5)
+    extract_parser.add_argument("--max-chars", type=int, default=18)
+    extract_parser.set_defaults(func=bench_extract)
+
+    render_parser = subparsers.add_parser("render", help="PPT 렌더링: create_ppt와 create_ppt_from_template 비교")
+    render_parser.add_argument("--slides", type=int, default=300)
+    render_parser.set_defaults(func=bench_render)
+
+    write_parser = subparsers.add_parser("write", help="덱 저장: create_ppt + prs.save()와 스트리밍 ZIP 쓰기(deflate/stored) 비교")
+    write_parser.add_argument("--slides", type=int, default=500)
+    write_parser.set_defaults(func=bench_write)
+
+    parallel_parser = subparsers.add_parser("parallel", help="병렬 렌더링: 작업 프로세스 수별 write_deck 속도 곡선")
+    parallel_parser.add_argument("--slides", type=int, default=5000)
+    parallel_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parallel_parser.add_argument("--chunk-size", type=int, default=200)
+    parallel_parser.add_argument("--compression", choices=["deflate", "stored"], default="deflate")
+    parallel_parser.set_defaults(func=bench_parallel)
+
+    encode_parser = subparsers.add_parser("encode", help="SBERT 임베딩: 문장별 호출과 배치 호출 비교")
+    encode_parser.add_argument("--sentences", type=int, default=2000)
+    encode_parser.add_argument("--model", default="jhgan/ko-sbert-nli")
+    encode_parser.set_defaults(func=bench_encode)
+
+    backends_parser = subparsers.add_parser("backends", help="인코더 백엔드(torch/onnx/onnx-int8)별 로딩·메모리·처리량과 torch 대비 일치도")
+    backends_parser.add_argument("--sentences", type=int, default=2000)
+    backends_parser.add_argument("--backends", nargs="+", choices=["torch", "onnx", "onnx-int8"], default=["torch", "onnx", "onnx-int8"])
+    backends_parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    backends_parser.add_argument("--similarity-threshold", type=float, default=0.85)
+    backends_parser.add_argument("--seed", type=int, default=0)
+    backends_parser.set_defaults(func=bench_backends)
+
+    startup_parser = subparsers.add_parser("startup", help="콜드 스타트: 모듈 import 시간과 앱 첫 화면 렌더링 시간")
+    startup_parser.set_defaults(func=bench_startup)
+
+    kss_parser = subparsers.add_parser("kss", help="KSS 문장 분할: 문단별 호출, 배치 호출, 메모 재실행 비교")
+    kss_parser.add_argument("--sentences", type=int, default=10000)
+    kss_parser.set_defaults(func=bench_kss)
+
+    packing_parser = subparsers.add_parser("packing", help="슬라이드 배치: 그리디 분할과 최적(DP) 분할 비교")
+    packing_parser.add_argument("--lines", type=int, default=50000)
+    packing_parser.add_argument("--max-lines", type=int, default=5)
+    packing_parser.add_argument("--max-chars", type=int, default=18)
+    packing_parser.add_argument("--seed", type=int, default=0)
+    packing_parser.set_defaults(func=bench_packing)
+
+    revise_parser = subparsers.add_parser("revise", help="수정본: 한 곳만 고친 대본으로 전체 다시 만들기와 revise_deck 비교")
+    revise_parser.add_argument("--lines", type=int, default=770, help="합성 대본 줄 수 (기본값은 약 400장)")
+    revise_parser.add_argument("--max-lines", type=int, default=5)
+    revise_parser.add_argument("--max-chars", type=int, default=18)
+    revise_parser.add_argument("--repeat", type=int, default=5)
+    revise_parser.add_argument("--seed", type=int, default=0)
+    revise_parser.set_defaults(func=bench_revise)
+
+    readers_parser = subparsers.add_parser("readers", help="형식별 대본 읽기 처리량 (txt/srt는 mmap과 read() 비교)")
+    readers_parser.add_argument("--paragraphs", type=int, default=50000)
+    readers_parser.add_argument("--seed", type=int, default=0)
+    readers_parser.add_argument("--formats", nargs="+", choices=["txt", "md", "srt", "docx", "hwpx", "hwp"],
+                                default=["txt", "md", "srt", "docx", "hwpx", "hwp"])
+    readers_parser.add_argument("--hwp", help="hwp 읽기 측정에 쓸 실제 .hwp 파일 (olefile 필요)")
+    readers_parser.set_defaults(func=bench_readers)
+
+    topics_parser = subparsers.add_parser("topics", help="주제 분할: 블록 유사도와 LSH 이웃 응집도의 시간·메모리·정확도")
+    topics_parser.add_argument("--sentences", type=int, default=20000)
+    topics_parser.add_argument("--dim", type=int, default=768)
+    topics_parser.add_argument("--noise", type=float, default=2.5, help="클수록 같은 주제 문장끼리도 덜 비슷함")
+    topics_parser.add_argument("--seed", type=int, default=0)
+    topics_parser.set_defaults(func=bench_topics)
+
+    soak_parser = subparsers.add_parser("soak", help="세션 수가 늘어날 때의 RSS: 세션마다 덱 바이트 보관과 아티팩트 파일 보관 비교")
+    soak_parser.add_argument("--sessions", type=int, default=100)
+    soak_parser.add_argument("--slides", type=int, default=100, help="세션마다 만드는 덱의 슬라이드 수")
+    soak_parser.add_argument("--modes", nargs="+", choices=["bytes", "artifacts"], default=["bytes", "artifacts"])
+    soak_parser.set_defaults(func=bench_soak)
+
+    pipeline_parser = subparsers.add_parser("pipeline", help="두 앱의 추출·분할·임베딩·렌더링·저장 단계별 시간을 JSON으로 기록")
+    pipeline_parser.add_argument("--paragraphs", type=int, default=200, help="합성 대본 문단 수")
+    pipeline_parser.add_argument("--long-every", type=int, default=20, help="이 문단 수마다 강제 분할되는 긴 문장 하나 (0이면 없음)")
+    pipeline_parser.add_argument("--long-words", type=int, default=20, help="긴 문장의 어절 수")
+    pipeline_parser.add_argument("--seed", type=int, default=0)
+    pipeline_parser.add_argument("--repeat", type=int, default=3)
+    pipeline_parser.add_argument("--max-lines", type=int, default=5)
+    pipeline_parser.add_argument("--max-chars", type=int, default=18)
+    pipeline_parser.add_argument("--similarity-threshold", type=float, default=0.85)
+    pipeline_parser.add_argument("--apps", nargs="+", choices=["app", "app_ai"], default=["app", "app_ai"])
+    pipeline_parser.add_argument("--encoder", choices=["auto", "sbert", "stub"], default="auto",
+                                 help="auto: SBERT 모델이 로컬에 있으면 사용, 없으면 스텁 인코더")
+    pipeline_parser.add_argument("--output", help="결과 JSON 경로")
+    pipeline_parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    pipeline_parser.set_defaults(func=bench_pipeline)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
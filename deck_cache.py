@@ -0,0 +1,115 @@
+# 생성된 PPT 결과 캐시 (내용 주소 기반)
+#
+# 입력 바이트 + 설정값 + 코드 버전의 해시를 키로 .pptx 바이트를 디스크에 저장합니다.
+# 전체 크기가 상한을 넘으면 가장 오래 쓰지 않은(mtime 기준) 덱부터 지웁니다.
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from embedding_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def code_version(*file_names):
+    """출력 결과에 영향을 주는 소스 파일들의 해시. 코드가 바뀌면 이전 캐시는 자연히 쓰이지 않습니다."""
+    digest = hashlib.sha256()
+    for file_name in file_names:
+        with open(os.path.join(_APP_DIR, file_name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def deck_key(input_bytes, settings, version):
+    digest = hashlib.sha256(input_bytes)
+    digest.update(json.dumps(settings, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    digest.update(version.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DeckCache:
+    """같은 입력과 설정으로 만든 PPT를 다시 만들지 않고 저장된 파일로 돌려줍니다."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = os.path.join(cache_dir, "decks")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".pptx", base + ".json"
+
+    def get(self, key):
+        """(pptx 바이트, 메타데이터 dict)를 반환하고, 없으면 None."""
+        found = self.open(key)
+        if found is None:
+            return None
+        f, meta = found
+        with f:
+            return f.read(), meta
+
+    def open(self, key):
+        """(읽기용 pptx 파일 객체, 메타데이터 dict)를 반환하고, 없으면 None. 덱 바이트를 메모리에 올리지 않습니다."""
+        pptx_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            os.utime(pptx_path)  # 최근 사용 시각 갱신 (LRU)
+            f = open(pptx_path, "rb")
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return f, meta
+
+    def put(self, key, data, meta):
+        self._put(key, meta, lambda f: f.write(data))
+
+    def put_file(self, key, path, meta):
+        """이미 파일로 저장한 덱을 메모리에 다 올리지 않고 복사해 넣습니다."""
+        with open(path, "rb") as f:
+            self._put(key, meta, lambda out: shutil.copyfileobj(f, out))
+
+    def _put(self, key, meta, write_pptx):
+        pptx_path, meta_path = self._paths(key)
+        # 다른 세션이 읽는 도중에 반쯤 쓴 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체
+        for path, write, mode in (
+            (meta_path, lambda f: f.write(json.dumps(meta, ensure_ascii=False)), "w"),
+            (pptx_path, write_pptx, "wb"),
+        ):
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, mode, **({"encoding": "utf-8"} if mode == "w" else {})) as f:
+                write(f)
+            os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                if name.endswith(".pptx"):
+                    try:
+                        stat = os.stat(os.path.join(self.directory, name))
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, name[:-len(".pptx")]))
+            total = sum(size for _, size, _ in entries)
+            for _, size, key in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
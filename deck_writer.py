@@ -0,0 +1,398 @@
+# PPTX 직접 쓰기 (스트리밍 저장)
+#
+# create_ppt + prs.save()는 덱 전체의 python-pptx 객체 트리를 메모리에 만든 뒤 한꺼번에 직렬화합니다.
+# write_deck은 빈 덱(슬라이드 마스터·레이아웃 등)을 한 번만 만들어 두고, 슬라이드는 하나씩 XML로 만들어
+# 곧바로 zipfile.ZipFile에 써 넣습니다. 슬라이드 내용은 create_ppt와 같은 도형·서식(원형 XML 복제)입니다.
+# 큰 덱은 슬라이드 XML 생성을 여러 프로세스에 나누고, 압축 파일 조립(관계·콘텐츠 형식·슬라이드 목록)은 이 프로세스에서 합니다.
+#
+# 사용 예:
+#   with open("out.pptx", "wb") as f:
+#       write_deck(slides, f, compression="stored")
+#   write_deck(slides, "big.pptx", workers=8)  # 슬라이드 XML을 8개 프로세스에서 나눠 만듦
+#   changed = revise_deck("old.pptx", new_slides, "new.pptx")  # 바뀐 슬라이드만 새로 만듦
+#
+# 수정본(revise_deck)은 이전 덱과 새 슬라이드 목록을 슬라이드 내용 해시 순서열로 비교(difflib)해,
+# 추가·수정된 슬라이드만 새로 찍고 나머지는 이전 슬라이드 XML을 그대로 씁니다. 번호("3 / 400")가 바뀐 슬라이드는
+# 번호 글자만 고치고, 번호도 같은 슬라이드와 슬라이드 외 부분은 압축된 데이터를 풀지 않고 그대로 옮깁니다.
+
+import hashlib
+import io
+import multiprocessing
+import posixpath
+import struct
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from difflib import SequenceMatcher
+from itertools import chain, repeat
+
+from lxml import etree
+from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml.ns import qn
+from pptx.util import Inches
+
+from instrumentation import timed
+from ppt_core import _build_slide_prototype, _stamp_slide
+
+DEFAULT_CHUNK_SIZE = 200  # 병렬 렌더링 시 작업 프로세스에 한 번에 넘기는 슬라이드 수
+
+# stored: 압축하지 않음 (가장 빠름, 파일이 큼), deflate: prs.save()와 같은 방식
+COMPRESSION = {"stored": zipfile.ZIP_STORED, "deflate": zipfile.ZIP_DEFLATED}
+
+_PRESENTATION_MEMBER = "ppt/presentation.xml"
+_PRESENTATION_RELS_MEMBER = "ppt/_rels/presentation.xml.rels"
+_CHECK_TEXT = "확인 필요!"  # add_check_needed_shape의 글자 (이전 슬라이드 XML에서 표시 여부를 읽을 때 사용)
+
+_CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+# 원형 도형과 그 도형을 찍어 낼 빈 슬라이드 하나를 만듦
+def _build_slide_template(font_size, template_path):
+    prs = Presentation(template_path)
+    prs.slide_width = Inches(13.33)
+    prs.slide_height = Inches(7.5)
+    prototype = _build_slide_prototype(prs, font_size)
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return prs, prototype, slide
+
+
+# 슬라이드 하나만 있는 빈 덱을 저장해 두고, 그 슬라이드를 틀로 삼아 나머지 부분은 그대로 복사
+def _build_skeleton(font_size, template_path):
+    prs, prototype, slide = _build_slide_template(font_size, template_path)
+
+    skeleton_io = io.BytesIO()
+    prs.save(skeleton_io)
+    return {
+        "zip": zipfile.ZipFile(skeleton_io),
+        "prototype": prototype,
+        "slide": slide._element,
+        "slide_rels": slide.part.rels.xml,
+        "slide_member": slide.part.partname.membername,
+        "slide_rels_member": slide.part.partname.rels_uri.membername,
+        "presentation_member": prs.part.partname.membername,
+        "presentation_rels_member": prs.part.partname.rels_uri.membername,
+    }
+
+
+def _slide_partname(number):
+    return f"/ppt/slides/slide{number}.xml"
+
+
+# [Content_Types].xml: 기존 슬라이드 항목을 슬라이드 수만큼의 항목으로 교체
+def _content_types_xml(blob, total):
+    types = etree.fromstring(blob)
+    overrides = []
+    for override in types.findall(f"{{{_CT_NS}}}Override"):
+        types.remove(override)
+        if override.get("ContentType") != CT.PML_SLIDE:
+            overrides.append(override)
+    for number in range(1, total + 1):
+        overrides.append(etree.Element(f"{{{_CT_NS}}}Override", PartName=_slide_partname(number), ContentType=CT.PML_SLIDE))
+    # python-pptx와 같이 PartName 순으로 정렬
+    types.extend(sorted(overrides, key=lambda override: override.get("PartName")))
+    return serialize_part_xml(types)
+
+
+# presentation.xml.rels: 기존 슬라이드 관계를 빼고 python-pptx처럼 비어 있는 가장 작은 rId부터 부여
+def _presentation_rels_xml(blob, total):
+    rels = etree.fromstring(blob)
+    used = set()
+    for rel in rels.findall(f"{{{_RELS_NS}}}Relationship"):
+        if rel.get("Type") == RT.SLIDE:
+            rels.remove(rel)
+        else:
+            used.add(rel.get("Id"))
+
+    rids = []
+    candidate = 1
+    for number in range(1, total + 1):
+        while f"rId{candidate}" in used:
+            candidate += 1
+        rid = f"rId{candidate}"
+        used.add(rid)
+        rids.append(rid)
+        etree.SubElement(rels, f"{{{_RELS_NS}}}Relationship", Id=rid, Type=RT.SLIDE, Target=f"slides/slide{number}.xml")
+    return serialize_part_xml(rels), rids
+
+
+# presentation.xml: 슬라이드 목록(sldIdLst)을 새 관계 ID로 다시 작성
+def _presentation_xml(blob, rids):
+    presentation = etree.fromstring(blob)
+    slide_ids = presentation.find(qn("p:sldIdLst"))
+    for slide_id in list(slide_ids):
+        slide_ids.remove(slide_id)
+    for i, rid in enumerate(rids):
+        etree.SubElement(slide_ids, qn("p:sldId"), {"id": str(256 + i), qn("r:id"): rid})
+    return serialize_part_xml(presentation)
+
+
+# 틀 슬라이드에 도형을 찍어 슬라이드 XML을 차례로 만듦 (번호·끝 표시는 덱 전체 기준 위치 start + i로 정함)
+def _iter_slide_xml(prototype, sld, slides, start, total):
+    sp_tree = sld.find(qn("p:cSld")).find(qn("p:spTree"))
+    for i, slide_data in enumerate(slides, start):
+        for shape in list(sp_tree.iterchildren(qn("p:sp"))):
+            sp_tree.remove(shape)
+        _stamp_slide(sp_tree, prototype, slide_data, i + 1, total, i == total - 1)
+        yield serialize_part_xml(sld)
+
+
+_templates = {}  # 프로세스별 (글꼴 크기, 템플릿) → (원형 도형, 틀 슬라이드, 슬라이드 관계 XML)
+
+
+# 원형 도형과 틀 슬라이드를 프로세스마다 한 번만 만듦 (틀 슬라이드는 찍을 때마다 바뀌므로 여러 스레드에서 쓸 때는 복사해서 사용)
+def _cached_template(font_size, template_path):
+    key = (font_size, template_path)
+    if key not in _templates:
+        _, prototype, slide = _build_slide_template(font_size, template_path)
+        _templates[key] = (prototype, slide._element, slide.part.rels.xml)
+    return _templates[key]
+
+
+# 작업 프로세스에서 실행: 슬라이드 묶음 하나의 XML 목록
+def _render_chunk(slides, start, total, font_size, template_path):
+    prototype, sld, _ = _cached_template(font_size, template_path)
+    return list(_iter_slide_xml(prototype, sld, slides, start, total))
+
+
+# 슬라이드 XML을 하나씩(또는 작업 프로세스가 만든 묶음 순서대로) 받아 바로 압축 파일에 쓰기
+def _write_slides(zf, skeleton, slides, progress, executor, chunk_size, font_size, template_path):
+    total = len(slides)
+    if executor is None:
+        blobs = _iter_slide_xml(skeleton["prototype"], skeleton["slide"], slides, 0, total)
+    else:
+        starts = range(0, total, chunk_size)
+        chunks = executor.map(
+            _render_chunk, [slides[start:start + chunk_size] for start in starts], starts,
+            repeat(total), repeat(font_size), repeat(template_path),
+        )
+        blobs = chain.from_iterable(chunks)
+
+    for number, blob in enumerate(blobs, 1):
+        zf.writestr(_slide_partname(number)[1:], blob)
+        zf.writestr(f"ppt/slides/_rels/slide{number}.xml.rels", skeleton["slide_rels"])
+        if progress is not None:
+            progress(number, total)
+
+
+@timed("render", renderer="stream")
+def write_deck(
+    slides, file, font_size=54, compression="deflate", compresslevel=None, template_path=None, progress=None,
+    workers=1, executor=None, chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """slides를 .pptx로 file(경로 또는 쓰기용 바이너리 스트림)에 바로 씁니다. create_ppt(...).save(file)와 같은 덱이 됩니다.
+
+    workers가 2 이상이거나 executor(프로세스 풀)를 주면 슬라이드를 chunk_size장씩 나눠 작업 프로세스에서 XML로 만들고,
+    이 프로세스는 받은 순서대로 압축 파일에 씁니다.
+    """
+    if executor is None and workers > 1 and len(slides) > chunk_size:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            _write_deck(slides, file, font_size, compression, compresslevel, template_path, progress, pool, chunk_size)
+    else:
+        _write_deck(slides, file, font_size, compression, compresslevel, template_path, progress, executor, chunk_size)
+
+
+def _write_deck(slides, file, font_size, compression, compresslevel, template_path, progress, executor, chunk_size):
+    skeleton = _build_skeleton(font_size, template_path)
+    source = skeleton["zip"]
+    total = len(slides)
+    presentation_rels, rids = _presentation_rels_xml(source.read(skeleton["presentation_rels_member"]), total)
+
+    with zipfile.ZipFile(file, "w", compression=COMPRESSION[compression], compresslevel=compresslevel, strict_timestamps=False) as zf:
+        # prs.save()와 같은 순서로 쓰고, 틀 슬라이드 자리에 실제 슬라이드들을 넣음
+        for member in source.namelist():
+            if member == skeleton["slide_member"]:
+                _write_slides(zf, skeleton, slides, progress, executor, chunk_size, font_size, template_path)
+            elif member == skeleton["slide_rels_member"]:
+                continue
+            elif member == "[Content_Types].xml":
+                zf.writestr(member, _content_types_xml(source.read(member), total))
+            elif member == skeleton["presentation_rels_member"]:
+                zf.writestr(member, presentation_rels)
+            elif member == skeleton["presentation_member"]:
+                zf.writestr(member, _presentation_xml(source.read(member), rids))
+            else:
+                zf.writestr(member, source.read(member))
+
+
+# 슬라이드 하나의 내용 해시: 줄, '확인 필요' 표시, 글꼴 크기가 같으면 같은 슬라이드 XML이 됨 (번호·끝 표시는 위치로 정해짐)
+def _slide_digest(lines, needs_check, font_size):
+    key = "\0".join([str(font_size), "1" if needs_check else "0", *lines])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def slide_manifest(slides, font_size=54):
+    """슬라이드마다의 내용 해시 목록. 덱과 함께 보관했다가 revise_deck(manifest=...)에 넘기면 이전 덱을 해석하지 않습니다."""
+    return [_slide_digest(slide.lines, slide.needs_check, font_size) for slide in slides]
+
+
+def _shape_text(shape):
+    return "".join(t.text or "" for t in shape.iter(qn("a:t")))
+
+
+# 이 모듈(또는 create_ppt)이 만든 슬라이드 XML에서 내용 해시를 복원. 다른 구조의 슬라이드면 None (항상 새로 만듦)
+def _slide_digest_from_xml(blob):
+    sp_tree = etree.fromstring(blob).find(qn("p:cSld")).find(qn("p:spTree"))
+    shapes = sp_tree.findall(qn("p:sp"))
+    text_body = shapes[0].find(qn("p:txBody")) if len(shapes) >= 2 else None
+    font = text_body.find(".//" + qn("a:defRPr")) if text_body is not None else None
+    if font is None or font.get("sz") is None:
+        return None
+    # 본문 상자의 첫 문단은 text_frame.clear()가 남긴 빈 문단
+    lines = [_shape_text(paragraph) for paragraph in text_body.findall(qn("a:p"))[1:]]
+    needs_check = any(_shape_text(shape) == _CHECK_TEXT for shape in shapes[2:])
+    return _slide_digest(lines, needs_check, int(font.get("sz")) // 100)
+
+
+# presentation.xml의 슬라이드 목록 순서대로 슬라이드 파트 이름
+def _slide_members(source):
+    presentation = etree.fromstring(source.read(_PRESENTATION_MEMBER))
+    targets = {
+        rel.get("Id"): rel.get("Target")
+        for rel in etree.fromstring(source.read(_PRESENTATION_RELS_MEMBER)).findall(f"{{{_RELS_NS}}}Relationship")
+        if rel.get("Type") == RT.SLIDE
+    }
+    slide_ids = presentation.find(qn("p:sldIdLst"))
+    return [
+        posixpath.normpath(posixpath.join("ppt", targets[slide_id.get(qn("r:id"))])).lstrip("/")
+        for slide_id in (slide_ids if slide_ids is not None else [])
+    ]
+
+
+def _rels_member(member):
+    directory, name = posixpath.split(member)
+    return posixpath.join(directory, "_rels", name + ".rels")
+
+
+# 새 슬라이드마다 내용이 같은 이전 슬라이드 위치 (없으면 None). 해시 순서열의 최장 일치 블록으로 맞춤
+def _match_slides(old_digests, new_digests):
+    matches = [None] * len(new_digests)
+    for old_start, new_start, size in SequenceMatcher(None, old_digests, new_digests, autojunk=False).get_matching_blocks():
+        matches[new_start:new_start + size] = range(old_start, old_start + size)
+    return matches
+
+
+# 슬라이드 번호 상자의 글자만 바꿈. 번호 상자는 본문 상자 뒤에 있으므로 마지막으로 나오는 같은 글자를 고침
+def _renumber(blob, old_number, new_number):
+    head, found, tail = blob.rpartition(f"<a:t>{old_number}</a:t>".encode("utf-8"))
+    return head + f"<a:t>{new_number}</a:t>".encode("utf-8") + tail if found else None
+
+
+# 압축된 데이터를 풀지 않고 그대로 옮겨 씀
+# (zipfile에는 이런 공개 API가 없어, ZipFile.writestr가 항목을 쓴 뒤 하는 것처럼 내부 목록과 위치를 갱신)
+def _copy_compressed(source, zf, info, name):
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+    data = source.fp.read(info.compress_size)
+
+    copied = zipfile.ZipInfo(name, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.flag_bits = info.flag_bits & ~0x08  # 크기와 CRC를 헤더에 바로 적으므로 데이터 서술자는 쓰지 않음
+    copied.external_attr = info.external_attr
+    copied.CRC, copied.compress_size, copied.file_size = info.CRC, info.compress_size, info.file_size
+    copied.header_offset = zf.fp.tell()
+    zf.fp.write(copied.FileHeader())
+    zf.fp.write(data)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(copied)
+    zf.NameToInfo[name] = copied
+    zf._didModify = True
+
+
+def _write_revised_slides(zf, source, old_members, matches, slides, font_size, template_path, progress):
+    prototype, template_sld, slide_rels = _cached_template(font_size, template_path)
+    sld = deepcopy(template_sld)  # 여러 작업 스레드가 같은 틀 슬라이드를 동시에 고치지 않도록
+    rels_crc = zipfile.crc32(slide_rels)
+    old_total, total = len(old_members), len(slides)
+    # 레이아웃 하나만 가리키는 관계 파트(모든 슬라이드가 같음)를 이전 덱에서 찾아 두고 압축된 그대로 재사용
+    old_rels = [source.NameToInfo.get(_rels_member(member)) for member in old_members]
+    reusable_rels = [info is not None and info.CRC == rels_crc and info.file_size == len(slide_rels) for info in old_rels]
+    rels_info = next((info for info, reusable in zip(old_rels, reusable_rels) if reusable), None)
+    restamped = []
+
+    for i, slide_data in enumerate(slides):
+        number = i + 1
+        member = _slide_partname(number)[1:]
+        old = matches[i]
+        blob = None
+        # 레이아웃 외의 관계(그림 등)가 없는 슬라이드만 재사용하고, 끝 표시 여부가 바뀌는 슬라이드는 새로 찍음
+        if old is not None and (old == old_total - 1) == (i == total - 1) and reusable_rels[old]:
+            if old == i and old_total == total:
+                _copy_compressed(source, zf, source.getinfo(old_members[old]), member)
+                blob = b""
+            else:
+                blob = _renumber(source.read(old_members[old]), f"{old + 1} / {old_total}", f"{number} / {total}")
+        if blob is None:
+            blob = next(_iter_slide_xml(prototype, sld, [slide_data], i, total))
+            restamped.append(i)
+        if blob:
+            zf.writestr(member, blob)
+        rels_member = f"ppt/slides/_rels/slide{number}.xml.rels"
+        if rels_info is not None:
+            _copy_compressed(source, zf, rels_info, rels_member)
+        else:
+            zf.writestr(rels_member, slide_rels)
+        if progress is not None:
+            progress(number, total)
+    return restamped
+
+
+@timed("render", renderer="revise")
+def revise_deck(
+    previous, slides, file, font_size=54, manifest=None, template_path=None, progress=None,
+    compression="deflate", compresslevel=None,
+):
+    """이전 덱 previous(경로 또는 바이너리 스트림)를 바탕으로 slides 덱을 file에 쓰고, 새로 만든 슬라이드 위치 목록(0부터)을 반환합니다.
+
+    새로 만든 슬라이드는 원형에서 XML을 다시 찍은 슬라이드 전부입니다: 추가·수정된 슬라이드와, 내용은 같아도 끝 표시가
+    붙거나 떨어진 슬라이드, 레이아웃 외의 관계가 있거나 번호를 고칠 수 없어 재사용하지 못한 슬라이드.
+    번호 글자만 고친 슬라이드는 들어가지 않습니다.
+
+    추가·수정된 슬라이드만 새로 만들고, 나머지 슬라이드와 슬라이드 마스터·테마 등은 이전 덱의 것을 그대로 씁니다
+    (새 슬라이드를 써 넣을 때만 compression을 적용). 이 모듈로 만든 덱이면 write_deck(slides, file)과 같은 덱이 됩니다.
+    manifest는 이전 덱의 slide_manifest 결과로, 없거나 슬라이드 수가 다르면 이전 슬라이드 XML에서 내용을 읽어 비교합니다.
+    """
+    with zipfile.ZipFile(previous) as source:
+        old_members = _slide_members(source)
+        if manifest is None or len(manifest) != len(old_members):
+            manifest = [_slide_digest_from_xml(source.read(member)) for member in old_members]
+        matches = _match_slides(manifest, slide_manifest(slides, font_size))
+
+        total = len(slides)
+        # 슬라이드 수와 파트 이름이 그대로면 슬라이드 목록·관계·콘텐츠 형식 파트도 그대로 쓸 수 있음
+        same_slide_list = old_members == [_slide_partname(number)[1:] for number in range(1, total + 1)]
+        if not same_slide_list:
+            presentation_rels, rids = _presentation_rels_xml(source.read(_PRESENTATION_RELS_MEMBER), total)
+        skipped = set(old_members) | {_rels_member(member) for member in old_members}
+        restamped = None
+        with zipfile.ZipFile(file, "w", compression=COMPRESSION[compression], compresslevel=compresslevel, strict_timestamps=False) as zf:
+            # 이전 덱의 순서대로 쓰고, 첫 슬라이드 자리에 새 슬라이드들을 넣음
+            # (이전 덱에 슬라이드가 없으면 prs.save()처럼 ppt/ 아래 파트들이 끝난 자리)
+            in_ppt = False
+            for info in source.infolist():
+                member = info.filename
+                if not old_members and restamped is None and in_ppt and not member.startswith("ppt/"):
+                    restamped = _write_revised_slides(zf, source, old_members, matches, slides, font_size, template_path, progress)
+                in_ppt = member.startswith("ppt/")
+                if member in skipped:
+                    if restamped is None:
+                        restamped = _write_revised_slides(
+                            zf, source, old_members, matches, slides, font_size, template_path, progress
+                        )
+                elif same_slide_list:
+                    _copy_compressed(source, zf, info, member)
+                elif member == "[Content_Types].xml":
+                    zf.writestr(member, _content_types_xml(source.read(member), total))
+                elif member == _PRESENTATION_RELS_MEMBER:
+                    zf.writestr(member, presentation_rels)
+                elif member == _PRESENTATION_MEMBER:
+                    zf.writestr(member, _presentation_xml(source.read(member), rids))
+                else:
+                    _copy_compressed(source, zf, info, member)
+            if restamped is None:
+                restamped = _write_revised_slides(zf, source, old_members, matches, slides, font_size, template_path, progress)
+    return restamped
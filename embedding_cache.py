@@ -0,0 +1,238 @@
+# 문장 임베딩 디스크 캐시
+#
+# (모델 이름, 정규화한 문장 해시)를 키로 임베딩을 memmap NumPy 배열(vectors.npy)에 저장하고,
+# 키 → 슬롯 위치는 index.json에 LRU 순서로 기록합니다. 용량을 넘으면 가장 오래 쓰지 않은 슬롯을 재사용합니다.
+# 적중만 있었던 호출은 index.json 전체를 다시 쓰지 않고 recent.log에 적중한 키를 덧붙여 두었다가,
+# 다음에 index.json을 쓸 때 합칩니다 (읽을 때는 index.json의 순서 위에 recent.log를 차례로 적용).
+#
+# 같은 폴더를 여러 프로세스(Streamlit 작업자 여럿, server.py 등)가 함께 써도 되도록, 슬롯을 읽고 쓰는 동안은
+# 폴더의 lock 파일로 프로세스 사이 배타 잠금을 잡고, 다른 프로세스가 index.json을 바꿨으면 슬롯 표를 다시 읽습니다.
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_CACHE_DIR = os.environ.get("PAYDO_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "paydo"))
+DEFAULT_CAPACITY = 50_000
+
+_whitespace_pattern = re.compile(r"\s+")
+
+
+# 공백/유니코드 표기만 다른 문장은 같은 키가 되도록 정규화
+def normalize_sentence(sentence):
+    return _whitespace_pattern.sub(" ", unicodedata.normalize("NFC", sentence)).strip()
+
+
+def sentence_key(model_name, sentence):
+    return hashlib.sha1(f"{model_name}\0{normalize_sentence(sentence)}".encode("utf-8")).hexdigest()
+
+
+# 프로세스 사이 배타 잠금 (잠금 파일은 지우지 않고 계속 씀)
+@contextlib.contextmanager
+def _file_lock(path):
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_text(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_text(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class EmbeddingCache:
+    """문장 임베딩을 디스크에 보관해, 같은 문장은 다시 인코딩하지 않도록 합니다."""
+
+    def __init__(self, model_name, cache_dir=DEFAULT_CACHE_DIR, capacity=DEFAULT_CAPACITY):
+        self.model_name = model_name
+        self.capacity = capacity
+        self.directory = os.path.join(cache_dir, "embeddings", re.sub(r"[^\w.-]", "_", model_name))
+        self._index_path = os.path.join(self.directory, "index.json")
+        self._vectors_path = os.path.join(self.directory, "vectors.npy")
+        self._lock_path = os.path.join(self.directory, "lock")
+        self._generation_path = os.path.join(self.directory, "generation")  # index.json을 쓸 때마다 바뀌는 토큰
+        self._recent_path = os.path.join(self.directory, "recent.log")  # index.json 이후 적중한 키 (한 줄에 하나)
+        self._recent_offset = 0  # recent.log에서 이미 적용한 바이트 수
+        self._lock = threading.Lock()
+        self._slots = OrderedDict()  # 키 → 슬롯 (앞쪽이 가장 오래 쓰지 않은 항목)
+        self._vectors = None
+        self._generation = None  # 마지막으로 읽거나 쓴 index.json의 토큰
+        self._avg_encode_seconds = 0.0  # 미스 한 문장당 평균 인코딩 시간 (절약 시간 추정용)
+        os.makedirs(self.directory, exist_ok=True)
+        with self._locked():
+            self._refresh()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock, _file_lock(self._lock_path):
+            yield
+
+    # 마지막으로 본 뒤 index.json이 바뀌었으면 슬롯 표와 벡터 파일을 다시 읽음 (잠금을 잡은 상태에서 호출)
+    def _refresh(self):
+        generation = _read_text(self._generation_path)
+        if generation is not None and generation == self._generation:
+            self._replay_recent()
+            return
+        self._generation = generation
+        self._recent_offset = 0
+        self._vectors = None
+        self._slots = OrderedDict()
+        if not (os.path.exists(self._index_path) and os.path.exists(self._vectors_path)):
+            return
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if index["model"] != self.model_name or index["capacity"] != self.capacity:
+                return
+            vectors = np.load(self._vectors_path, mmap_mode="r+")
+            if len(vectors) != self.capacity:
+                return
+            self._vectors = vectors
+            self._slots = OrderedDict((key, slot) for key, slot in index["entries"])
+            self._avg_encode_seconds = index.get("avg_encode_seconds", self._avg_encode_seconds)
+        except (OSError, ValueError, KeyError):
+            # 캐시 파일이 깨졌으면 비운 상태로 다시 시작
+            self._vectors = None
+            self._slots = OrderedDict()
+        self._replay_recent()
+
+    # recent.log에서 아직 적용하지 않은 적중 기록을 LRU 순서에 반영 (잠금을 잡은 상태에서 호출)
+    def _replay_recent(self):
+        try:
+            with open(self._recent_path, "rb") as f:
+                f.seek(self._recent_offset)
+                data = f.read()
+        except OSError:
+            return
+        data = data[:data.rfind(b"\n") + 1]  # 쓰다 만 마지막 줄은 다음에
+        self._recent_offset += len(data)
+        for key in data.decode("ascii", errors="replace").split():
+            if key in self._slots:
+                self._slots.move_to_end(key)
+
+    def _append_recent(self, keys):
+        with open(self._recent_path, "ab") as f:
+            f.write("".join(f"{key}\n" for key in keys).encode("ascii"))
+            self._recent_offset = f.tell()
+
+    def _ensure_vectors(self, dim):
+        if self._vectors is not None and self._vectors.shape[1] == dim:
+            return
+        # 다른 프로세스가 이전 파일을 매핑하고 있을 수 있으므로 그 자리에서 잘라 쓰지 않고 새 파일로 교체
+        tmp_path = f"{self._vectors_path}.{os.getpid()}.tmp"
+        vectors = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(self.capacity, dim))
+        vectors.flush()
+        del vectors
+        os.replace(tmp_path, self._vectors_path)
+        self._vectors = np.load(self._vectors_path, mmap_mode="r+")
+        self._slots = OrderedDict()
+
+    def _allocate_slot(self, key):
+        if len(self._slots) < self.capacity:
+            slot = len(self._slots)
+        else:
+            _, slot = self._slots.popitem(last=False)
+        self._slots[key] = slot
+        return slot
+
+    def encode(self, sentences, encode_fn):
+        """캐시에 없는 문장만 encode_fn으로 한 번에 인코딩하고, (임베딩 배열, 통계 dict)를 반환합니다."""
+        keys = [sentence_key(self.model_name, sentence) for sentence in sentences]
+        found = {}
+        with self._locked():
+            self._refresh()
+            for key in keys:
+                if key in self._slots and key not in found:
+                    found[key] = np.array(self._vectors[self._slots[key]])
+                    self._slots.move_to_end(key)
+            if found:
+                # 적중만 있는 호출에서도 LRU 순서가 다른 프로세스와 다음 실행에 남도록 기록
+                self._append_recent(found)
+                if self._recent_offset > 41 * self.capacity:  # 기록이 슬롯 표보다 커지면 index.json에 합침
+                    self._save_index()
+        hits = sum(1 for key in keys if key in found)
+
+        encoded = {}
+        encode_seconds = 0.0
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if missing:
+            first_sentence = dict(zip(reversed(keys), reversed(sentences)))
+            start = time.perf_counter()
+            new_embeddings = np.asarray(encode_fn([first_sentence[key] for key in missing]), dtype=np.float32)
+            encode_seconds = time.perf_counter() - start
+            encoded = dict(zip(missing, new_embeddings))
+
+            with self._locked():
+                self._refresh()  # 인코딩하는 동안 다른 프로세스가 쓴 슬롯을 덮어쓰지 않도록
+                self._ensure_vectors(new_embeddings.shape[1])
+                for key, embedding in encoded.items():
+                    if key not in self._slots:
+                        self._vectors[self._allocate_slot(key)] = embedding
+                per_sentence = encode_seconds / len(missing)
+                self._avg_encode_seconds = (
+                    per_sentence if not self._avg_encode_seconds else 0.8 * self._avg_encode_seconds + 0.2 * per_sentence
+                )
+                self._save_index()
+
+        vectors = [found[key] if key in found else encoded[key] for key in keys]
+        embeddings = np.stack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+        return embeddings, {
+            "hits": hits,
+            "misses": len(keys) - hits,
+            "encoded": len(missing),
+            "encode_seconds": encode_seconds,
+            "saved_seconds": hits * self._avg_encode_seconds,
+        }
+
+    def _save_index(self):
+        self._vectors.flush()
+        index = {
+            "model": self.model_name,
+            "capacity": self.capacity,
+            "avg_encode_seconds": self._avg_encode_seconds,
+            "entries": list(self._slots.items()),
+        }
+        _write_text(self._index_path, json.dumps(index))
+        _write_text(self._recent_path, "")  # 적중 기록은 방금 쓴 순서에 들어 있음
+        self._recent_offset = 0
+        self._generation = uuid.uuid4().hex
+        _write_text(self._generation_path, self._generation)
+
+    def __len__(self):
+        return len(self._slots)
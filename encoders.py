@@ -0,0 +1,260 @@
+# 문장 인코더 추론 백엔드 (PyTorch / ONNX Runtime / ONNX Runtime + int8 동적 양자화)
+#
+#   torch     : sentence-transformers 원본 모델 (float32, torch를 불러오므로 프로세스당 RSS가 큼)
+#   onnx      : 같은 모델을 ONNX로 내보내 onnxruntime으로 실행 (torch를 import하지 않음)
+#   onnx-int8 : 내보낸 ONNX 모델의 가중치를 int8로 동적 양자화
+#
+# ONNX 백엔드는 배포 전에 `python encoders.py export`로 한 번 내보내 둬야 합니다
+# (torch·sentence-transformers 필요, 모델이 로컬에 없으면 다운로드). 앱은 내보낸 파일
+# (model.onnx / model-int8.onnx, tokenizer.json, encoder.json)만 읽고, 없으면 내보내지 않고 바로 오류를 냅니다.
+#
+# 사용 예:
+#   python encoders.py export --backend onnx-int8          # 내보내기 + torch 백엔드와의 코사인 일치도 확인
+#   PAYDO_ENCODER_BACKEND=onnx-int8 streamlit run app_ai.py
+#   model = load_encoder("onnx-int8"); model.encode(sentences, normalize_embeddings=True)
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+
+import numpy as np
+
+from ai_core import MODEL_NAME
+from embedding_cache import DEFAULT_CACHE_DIR
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+DEFAULT_BACKEND = os.environ.get("PAYDO_ENCODER_BACKEND", "torch")
+DEFAULT_EXPORT_DIR = os.path.join(DEFAULT_CACHE_DIR, "onnx")
+DEFAULT_MIN_COSINE = 0.97  # 내보낸 모델이 통과해야 하는 torch 백엔드와의 최소 코사인 유사도
+
+_ONNX_FILES = {"onnx": "model.onnx", "onnx-int8": "model-int8.onnx"}
+_INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+# 내보내기 직후 일치도 확인에 쓰는 기본 문장 (--input으로 실제 대본 문장을 줄 수 있음)
+CHECK_SENTENCES = [
+    "안녕하세요, 오늘 촬영할 대본입니다.",
+    "이번 장면에서는 제품의 주요 기능을 천천히 설명해 주세요.",
+    "카메라를 보면서 자연스럽게 웃어 주시면 됩니다!",
+    "배터리가 하루 종일 유지됩니다.",
+    "고객님들이 정말 편하다고 말씀하셨죠?",
+    "다음 컷에서 진행자가 다시 등장합니다.",
+    "새로운 디자인은 생각보다 훨씬 가볍고 튼튼합니다.",
+    "마지막으로 구독과 좋아요 부탁드린다는 멘트로 마무리합니다.",
+    "Next, show the packaging and read the tagline slowly.",
+    "그리고",
+]
+
+
+# 임베딩 캐시·결과 캐시 키에 쓰는 이름 (torch는 기존 캐시를 그대로 쓰도록 모델 이름만)
+def encoder_name(backend=DEFAULT_BACKEND, model_name=MODEL_NAME):
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+
+def model_directory(model_name=MODEL_NAME, export_dir=DEFAULT_EXPORT_DIR):
+    return os.path.join(export_dir, re.sub(r"[^\w.-]", "_", model_name))
+
+
+# 작업 스레드 수: PAYDO_ONNX_THREADS가 있으면 그 값, 없으면 이 프로세스가 쓸 수 있는 CPU 수
+def default_threads():
+    threads = int(os.environ.get("PAYDO_ONNX_THREADS", "0"))
+    if threads > 0:
+        return threads
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+# 완성된 파일만 보이도록 임시 이름으로 만든 뒤 바꿔 놓음
+def _replace_when_done(path, write):
+    temporary = path + ".tmp"
+    write(temporary)
+    os.replace(temporary, path)
+
+
+def export_onnx(model_name=MODEL_NAME, quantize=False, export_dir=DEFAULT_EXPORT_DIR):
+    """sentence-transformers 모델을 ONNX로 내보내고(이미 있으면 건너뜀), quantize면 int8 모델도 만듭니다. 모델 폴더를 반환."""
+    directory = model_directory(model_name, export_dir)
+    fp32_path = os.path.join(directory, _ONNX_FILES["onnx"])
+    if not os.path.exists(fp32_path):
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(model_name, device="cpu")
+        transformer, pooling = model[0].auto_model, model[1].get_pooling_mode_str()
+        if pooling not in ("mean", "cls"):
+            raise ValueError(f"지원하지 않는 풀링 방식입니다: {pooling}")
+        tokenizer = model.tokenizer
+        os.makedirs(directory, exist_ok=True)
+        tokenizer.save_pretrained(directory)  # tokenizer.json (fast tokenizer) 포함
+        with open(os.path.join(directory, "encoder.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "model": model_name,
+                "pooling": pooling,
+                "max_seq_length": model.max_seq_length,
+                "dimension": model.get_sentence_embedding_dimension(),
+                "pad_token": tokenizer.pad_token,
+                "pad_token_id": tokenizer.pad_token_id,
+            }, f, ensure_ascii=False, indent=2)
+
+        logging.info(f"ONNX 내보내기: {model_name} → {fp32_path}")
+        transformer.config.return_dict = False  # 출력을 (last_hidden_state, pooler_output) 튜플로
+        sample = tokenizer(CHECK_SENTENCES[:2], padding=True, return_tensors="pt")
+        input_names = [name for name in _INPUT_NAMES if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+        with torch.no_grad():
+            _replace_when_done(fp32_path, lambda path: torch.onnx.export(
+                transformer.eval(), tuple(sample[name] for name in input_names), path,
+                input_names=input_names, output_names=["last_hidden_state"], dynamic_axes=dynamic_axes,
+                opset_version=14, do_constant_folding=True,
+            ))
+
+    int8_path = os.path.join(directory, _ONNX_FILES["onnx-int8"])
+    if quantize and not os.path.exists(int8_path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logging.info(f"int8 동적 양자화: {int8_path}")
+        _replace_when_done(int8_path, lambda path: quantize_dynamic(fp32_path, path, weight_type=QuantType.QInt8))
+    return directory
+
+
+class OnnxEncoder:
+    """내보낸 ONNX 모델로 SentenceTransformer.encode와 같은 문장 임베딩을 만듭니다 (torch 없이 onnxruntime과 tokenizers만 사용)."""
+
+    def __init__(self, directory, filename=_ONNX_FILES["onnx"], threads=None):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        with open(os.path.join(directory, "encoder.json"), encoding="utf-8") as f:
+            config = json.load(f)
+        self.pooling = config["pooling"]
+        self.dimension = config["dimension"]
+        self.tokenizer = Tokenizer.from_file(os.path.join(directory, "tokenizer.json"))
+        self.tokenizer.enable_truncation(config["max_seq_length"])
+        self.tokenizer.enable_padding(pad_id=config["pad_token_id"], pad_token=config["pad_token"])
+
+        # 한 번에 한 배치만 돌리므로 연산자 사이 병렬화(inter-op)는 끄고 연산자 안에서만 threads개 스레드 사용
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads or default_threads()
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.threads = options.intra_op_num_threads
+        self.session = ort.InferenceSession(
+            os.path.join(directory, filename), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {node.name for node in self.session.get_inputs()}
+
+    def encode(self, sentences, batch_size=64, convert_to_numpy=True, normalize_embeddings=False, **_):
+        """문장 목록 → (문장 수, 차원) float32 배열. 인자는 SentenceTransformer.encode와 같게 받습니다."""
+        embeddings = np.empty((len(sentences), self.dimension), dtype=np.float32)
+        # 길이가 비슷한 문장끼리 한 배치로 묶어 패딩을 줄임 (결과는 원래 순서로)
+        order = np.argsort([-len(sentence) for sentence in sentences], kind="stable")
+        for start in range(0, len(sentences), batch_size):
+            batch = order[start:start + batch_size]
+            encodings = self.tokenizer.encode_batch([sentences[i] for i in batch])
+            mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+            feeds = {"input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64), "attention_mask": mask}
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+            hidden = self.session.run(["last_hidden_state"], feeds)[0]
+            if self.pooling == "mean":
+                weights = mask[:, :, None].astype(np.float32)
+                embeddings[batch] = (hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-9)
+            else:
+                embeddings[batch] = hidden[:, 0]
+        if normalize_embeddings:
+            embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        return embeddings
+
+
+def load_encoder(backend=DEFAULT_BACKEND, model_name=MODEL_NAME, export_dir=DEFAULT_EXPORT_DIR, threads=None):
+    """backend에 맞는 인코더 (encode(sentences, batch_size=..., normalize_embeddings=...)를 가진 객체).
+
+    ONNX 백엔드는 디스크의 내보낸 파일만 읽습니다. 파일이 없으면 (요청 중에 오래 걸리는 변환을 하지 않도록)
+    FileNotFoundError를 냅니다.
+    """
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model_name)
+    if backend not in _ONNX_FILES:
+        raise ValueError(f"알 수 없는 인코더 백엔드입니다: {backend} (가능한 값: {', '.join(BACKENDS)})")
+    directory = model_directory(model_name, export_dir)
+    missing = [
+        name for name in (_ONNX_FILES[backend], "tokenizer.json", "encoder.json")
+        if not os.path.exists(os.path.join(directory, name))
+    ]
+    if missing:
+        raise FileNotFoundError(
+            f"{backend} 백엔드의 내보낸 모델 파일이 없습니다: {', '.join(missing)} ({directory}). "
+            f"먼저 `python encoders.py export --backend {backend} --model {model_name}`을(를) 실행하세요."
+        )
+    return OnnxEncoder(directory, _ONNX_FILES[backend], threads)
+
+
+# 모델 없이 돌릴 때 쓰는 결정적 임베딩: 문장 해시로 만든 단위 벡터 (같은 문장 → 같은 벡터)
+def stub_encode(sentences, dim=768):
+    vectors = np.empty((len(sentences), dim), dtype=np.float32)
+    for i, sentence in enumerate(sentences):
+        seed = int.from_bytes(hashlib.sha1(sentence.encode("utf-8")).digest()[:8], "little")
+        vectors[i] = np.random.default_rng(seed).standard_normal(dim)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def cosine_agreement(reference, candidate):
+    """두 백엔드가 같은 문장에 대해 만든 임베딩의 문장별 코사인 유사도."""
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    return np.einsum("ij,ij->i", reference, candidate)
+
+
+# 내보낸 백엔드와 torch 백엔드의 임베딩을 비교: (문장별 코사인 유사도, 인접 문장 유사도 차이의 최댓값)
+def check_agreement(backend, sentences, model_name=MODEL_NAME, export_dir=DEFAULT_EXPORT_DIR):
+    reference = load_encoder("torch", model_name).encode(sentences, batch_size=64, normalize_embeddings=True)
+    candidate = load_encoder(backend, model_name, export_dir).encode(sentences, batch_size=64, normalize_embeddings=True)
+    # app_ai는 인접 문장 유사도로 슬라이드를 나누므로 그 값이 얼마나 달라지는지도 확인
+    adjacent = np.einsum("ij,ij->i", reference[:-1], reference[1:]) - np.einsum("ij,ij->i", candidate[:-1], candidate[1:])
+    return cosine_agreement(reference, candidate), float(np.abs(adjacent).max()) if len(adjacent) else 0.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="문장 인코더를 ONNX로 내보내고 torch 백엔드와의 일치도를 확인합니다.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in (("export", "ONNX로 내보내기 (+ 일치도 확인)"), ("check", "내보낸 모델의 일치도만 확인")):
+        command_parser = subparsers.add_parser(command, help=help_text)
+        command_parser.add_argument("--backend", choices=list(_ONNX_FILES), default="onnx-int8")
+        command_parser.add_argument("--model", default=MODEL_NAME)
+        command_parser.add_argument("--export-dir", default=DEFAULT_EXPORT_DIR)
+        command_parser.add_argument("--input", help="일치도 확인에 쓸 문장 파일 (한 줄에 한 문장)")
+        command_parser.add_argument("--min-cosine", type=float, default=DEFAULT_MIN_COSINE)
+        if command == "export":
+            command_parser.add_argument("--no-check", action="store_true", help="일치도 확인을 건너뜀")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "export":
+        print(f"내보낸 폴더: {export_onnx(args.model, args.backend == 'onnx-int8', args.export_dir)}")
+        if args.no_check:
+            return 0
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            sentences = [line.strip() for line in f if line.strip()]
+    else:
+        sentences = CHECK_SENTENCES
+    cosines, adjacent_error = check_agreement(args.backend, sentences, args.model, args.export_dir)
+    print(
+        f"{args.backend} vs torch ({len(sentences)}문장): 코사인 평균 {cosines.mean():.4f}, 최소 {cosines.min():.4f}, "
+        f"인접 문장 유사도 차이 최대 {adjacent_error:.4f}"
+    )
+    if cosines.min() < args.min_cosine:
+        print(f"❌ 최소 코사인 유사도가 기준({args.min_cosine})보다 낮습니다.")
+        return 1
+    print("✅ 기준 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
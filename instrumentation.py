@@ -0,0 +1,158 @@
+# 단계별 소요 시간 계측 (구조화 로그 + 프로세스 내 p50/p95 집계)
+#
+# 사용 예:
+#   @timed("split")
+#   def split_and_group_text(...): ...
+#
+#   with timed("save", slides=len(slides)):
+#       prs.save(out)
+#
+# 꺼져 있을 때(기본값)는 플래그 하나만 확인하고 바로 원래 함수를 실행합니다.
+# PAYDO_METRICS=1 환경 변수나 set_enabled(True)로 켜면 단계마다 JSON 한 줄을 "paydo.metrics" 로거로 남기고,
+# 최근 측정값을 단계별로 보관해 summary()/histogram()으로 조회할 수 있습니다.
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+DEFAULT_WINDOW = 1000  # 단계별로 보관하는 최근 측정값 수
+
+logger = logging.getLogger("paydo.metrics")
+
+_enabled = False
+_lock = threading.Lock()
+_samples = {}  # 단계 이름 → 최근 소요 시간(초) deque
+_counts = {}  # 단계 이름 → 전체 측정 횟수
+
+
+def set_enabled(enabled=True):
+    global _enabled
+    if enabled and not logger.handlers:
+        # 한 줄에 JSON 하나만 남도록 메시지만 출력
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    _enabled = enabled
+
+
+def is_enabled():
+    return _enabled
+
+
+def record(stage, seconds, **fields):
+    with _lock:
+        samples = _samples.get(stage)
+        if samples is None:
+            samples = _samples[stage] = deque(maxlen=DEFAULT_WINDOW)
+        samples.append(seconds)
+        _counts[stage] = _counts.get(stage, 0) + 1
+    event = {"event": "stage", "stage": stage, "ms": round(seconds * 1000, 3), "ts": round(time.time(), 3), "pid": os.getpid()}
+    logger.info(json.dumps(dict(event, **fields), ensure_ascii=False))
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, stage, fields):
+        self.stage = stage
+        self.fields = fields
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        fields = dict(self.fields, error=exc_type.__name__) if exc_type is not None else self.fields
+        record(self.stage, time.perf_counter() - self.start, **fields)
+        return False
+
+
+class timed:
+    """with timed("stage"): ... 또는 @timed("stage")로 소요 시간을 측정합니다. 꺼져 있으면 아무것도 하지 않습니다."""
+
+    def __init__(self, stage, **fields):
+        self.stage = stage
+        self.fields = fields
+        self._timer = None
+
+    def __enter__(self):
+        self._timer = _Timer(self.stage, self.fields) if _enabled else _NULL_TIMER
+        return self._timer.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._timer.__exit__(*exc_info)
+
+    def __call__(self, fn):
+        stage = self.stage
+        fields = self.fields
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Timer(stage, fields):
+                return fn(*args, **kwargs)
+        return wrapper
+
+
+def _percentile(sorted_values, fraction):
+    # 가장 가까운 순위 방식 (numpy 없이)
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summary():
+    """단계별 {count, p50, p95, mean, max} (초 단위, 최근 DEFAULT_WINDOW개 기준)."""
+    with _lock:
+        snapshot = {stage: sorted(samples) for stage, samples in _samples.items()}
+        counts = dict(_counts)
+    return {
+        stage: {
+            "count": counts[stage],
+            "p50": _percentile(values, 0.5),
+            "p95": _percentile(values, 0.95),
+            "mean": sum(values) / len(values),
+            "max": values[-1],
+        }
+        for stage, values in snapshot.items()
+        if values
+    }
+
+
+def histogram(stage, bins=20):
+    """최근 측정값의 히스토그램: (구간 시작 ms, 개수) 목록."""
+    with _lock:
+        values = [seconds * 1000 for seconds in _samples.get(stage, ())]
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    width = (high - low) / bins or 1.0
+    counts = [0] * bins
+    for value in values:
+        counts[min(bins - 1, int((value - low) / width))] += 1
+    return [(low + i * width, count) for i, count in enumerate(counts)]
+
+
+def reset():
+    with _lock:
+        _samples.clear()
+        _counts.clear()
+
+
+if os.environ.get("PAYDO_METRICS", "").lower() in ("1", "true", "yes"):
+    set_enabled(True)
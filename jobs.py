@@ -0,0 +1,126 @@
+# 백그라운드 PPT 생성 작업 큐
+#
+# Streamlit 스크립트 스레드를 막지 않도록 덱 생성을 제한된 크기의 작업자 풀에서 실행하고,
+# 세션은 작업 ID만 들고 있다가 진행 상황(렌더링한 슬라이드 수 / 전체)을 조회합니다.
+# 렌더링·저장은 스레드에서, CPU를 오래 쓰는 분할은 run_in_process로 별도 프로세스에서 실행할 수 있습니다.
+# 큰 덱의 슬라이드 XML 생성처럼 여러 조각으로 나눌 수 있는 일은 process_pool()을 직접 넘겨 나눠 실행합니다.
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("PAYDO_JOB_WORKERS", "2"))
+DEFAULT_MAX_PROCESSES = int(os.environ.get("PAYDO_SPLIT_PROCESSES", str(min(2, os.cpu_count() or 1))))
+DEFAULT_MAX_FINISHED = 100  # 결과를 들고 있는 완료 작업 수 상한
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    """작업 하나의 상태. 작업 함수는 report()로 진행 상황을 알립니다."""
+
+    def __init__(self, job_id):
+        self.id = job_id
+        self.status = QUEUED
+        self.stage = ""
+        self.done = 0
+        self.total = 0
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    @property
+    def fraction(self):
+        return self.done / self.total if self.total else 0.0
+
+    def report(self, done=None, total=None, stage=None):
+        if done is not None:
+            self.done = done
+        if total is not None:
+            self.total = total
+        if stage is not None:
+            self.stage = stage
+
+    def __repr__(self):
+        return f"Job({self.id!r}, {self.status}, {self.stage!r}, {self.done}/{self.total})"
+
+
+class JobQueue:
+    """동시에 max_workers개까지만 실행하고, 나머지는 대기열에 쌓아 두는 작업 큐."""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, max_processes=DEFAULT_MAX_PROCESSES, max_finished=DEFAULT_MAX_FINISHED):
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self.max_finished = max_finished
+        self._threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deck-job")
+        self._processes = None  # 처음 필요할 때 생성
+        self._jobs = OrderedDict()  # 작업 ID → Job (제출 순서)
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """fn(job, *args, **kwargs)를 백그라운드에서 실행하고 작업 ID를 반환합니다. 반환값은 job.result가 됩니다."""
+        job = Job(uuid.uuid4().hex)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._threads.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.status = DONE
+        except Exception as e:
+            job.error = e
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def process_pool(self):
+        """CPU를 오래 쓰는 일을 나눠 맡길 프로세스 풀 (처음 호출할 때 생성)."""
+        with self._lock:
+            if self._processes is None:
+                # 스레드가 여럿 도는 프로세스에서 fork하지 않도록 spawn 사용
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self.max_processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._processes
+
+    def run_in_process(self, fn, *args, **kwargs):
+        """작업 함수 안에서 호출: CPU를 오래 쓰는 fn을 프로세스 풀에서 실행하고 결과를 기다립니다."""
+        return self.process_pool().submit(fn, *args, **kwargs).result()
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def stats(self):
+        """서버 크기 산정용 지표: 대기 중인 작업 수(queue depth), 실행 중인 작업 수, 동시 실행 상한."""
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {
+            "queued": statuses.count(QUEUED),
+            "running": statuses.count(RUNNING),
+            "max_workers": self.max_workers,
+            "finished": statuses.count(DONE) + statuses.count(FAILED),
+        }
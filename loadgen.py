@@ -0,0 +1,181 @@
+# server.py 부하 생성기: 동시 요청 수별 처리량·지연 시간과 마이크로 배치 효율 측정
+#
+# concurrency개의 클라이언트가 각자 응답을 받자마자 다음 요청을 보내는 방식(closed loop)으로 총 requests개를 보냅니다.
+# 기본값은 요청마다 문장이 모두 다른 합성 대본이라 결과 캐시·임베딩 캐시에 걸리지 않고 매번 모델을 거칩니다.
+#
+# 사용 예:
+#   python server.py --backend stub &              # 모델 없이 서비스 자체만 측정할 때
+#   python loadgen.py --concurrency 1 4 8 --requests 64
+#   python loadgen.py --input 대본.docx --concurrency 8 --repeat   # 같은 파일 반복 (캐시 적중 경로)
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from bench import KOREAN_PREDICATES, KOREAN_SUBJECTS
+
+DEFAULT_URL = "http://127.0.0.1:8600"
+
+
+# 요청 번호가 들어간 문장으로 대본을 만들어, 다른 요청과 겹치는 문장이 없게 함 (문단당 3~8문장)
+def make_script(index, sentence_count, seed=0):
+    rng = random.Random(seed * 1_000_003 + index)
+    paragraphs = []
+    number = 0
+    while number < sentence_count:
+        size = min(sentence_count - number, rng.randint(3, 8))
+        paragraphs.append(" ".join(
+            f"{index}번 대본의 {number + k + 1}번째 장면에서 {rng.choice(KOREAN_SUBJECTS)} {rng.choice(KOREAN_PREDICATES)}."
+            for k in range(size)
+        ))
+        number += size
+    return "\n\n".join(paragraphs).encode("utf-8")
+
+
+def _get_json(url, timeout=10):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.load(response)
+
+
+# 서버가 모델을 다 불러올 때까지 대기
+def wait_until_ready(base_url, timeout):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if _get_json(f"{base_url}/health").get("status") == "ok":
+                return
+        except (OSError, ValueError):
+            pass
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"{base_url}이(가) {timeout}초 안에 준비되지 않았습니다.")
+        time.sleep(0.5)
+
+
+def _send(url, body, timeout):
+    start = time.perf_counter()
+    request = urllib.request.Request(url, data=body, method="POST", headers={"Content-Type": "application/octet-stream"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            data = response.read()
+            return time.perf_counter() - start, None, len(data), response.headers.get("X-Paydo-Cache")
+    except urllib.error.HTTPError as e:
+        return time.perf_counter() - start, f"HTTP {e.code}: {e.read().decode('utf-8', 'replace')}", 0, None
+    except OSError as e:
+        return time.perf_counter() - start, str(e), 0, None
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+
+# 동시 요청 수 하나에 대해 요청을 모두 보내고 결과를 집계
+def run_load(base_url, bodies, query, concurrency, timeout):
+    url = f"{base_url}/render?{urlencode(query)}"
+    before = _get_json(f"{base_url}/stats")["batcher"]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda body: _send(url, body, timeout), bodies))
+    elapsed = time.perf_counter() - start
+    after = _get_json(f"{base_url}/stats")["batcher"]
+
+    latencies = [seconds for seconds, error, _, _ in results if error is None]
+    errors = [error for _, error, _, _ in results if error is not None]
+    batches = after["batches"] - before["batches"]
+    return {
+        "concurrency": concurrency,
+        "requests": len(bodies),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) if latencies else None,
+        "p95": _percentile(latencies, 0.95) if latencies else None,
+        "p99": _percentile(latencies, 0.99) if latencies else None,
+        "max": max(latencies) if latencies else None,
+        "cache_hits": sum(1 for *_, cache in results if cache == "hit"),
+        "batches": batches,
+        "requests_per_batch": (after["requests"] - before["requests"]) / batches if batches else 0.0,
+        "sentences_per_batch": (after["encoded"] - before["encoded"]) / batches if batches else 0.0,
+        "encode_seconds": after["encode_seconds"] - before["encode_seconds"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="server.py에 동시 요청을 보내 처리량과 지연 시간을 측정합니다.")
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8], help="동시 클라이언트 수 (여러 개면 차례로 측정)")
+    parser.add_argument("--requests", type=int, default=32, help="동시 요청 수 하나당 보낼 요청 수")
+    parser.add_argument("--sentences", type=int, default=60, help="합성 대본 하나의 문장 수")
+    parser.add_argument("--input", help="합성 대본 대신 보낼 대본 파일 (형식은 확장자로 판단)")
+    parser.add_argument("--repeat", action="store_true", help="모든 요청에 같은 대본을 보냄 (결과 캐시 적중 경로)")
+    parser.add_argument("--max-lines", type=int, default=4)
+    parser.add_argument("--max-chars", type=int, default=18)
+    parser.add_argument("--threshold", type=float, default=0.85, help="문맥 유사도 기준 (0이면 모델을 쓰지 않음)")
+    parser.add_argument("--sections", action="store_true")
+    parser.add_argument("--timeout", type=float, default=300, help="요청 하나의 제한 시간 (초)")
+    parser.add_argument("--ready-timeout", type=float, default=300, help="서버 모델 로딩을 기다리는 최대 시간 (초)")
+    parser.add_argument("--seed", type=int, default=None, help="합성 대본 시드 (기본값: 실행마다 새 대본)")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args(argv)
+
+    base_url = args.url.rstrip("/")
+    wait_until_ready(base_url, args.ready_timeout)
+    query = {
+        "max_lines": args.max_lines, "max_chars": args.max_chars,
+        "similarity_threshold": args.threshold, "sections": int(args.sections),
+    }
+    if args.input:
+        query["filename"] = os.path.basename(args.input)
+        with open(args.input, "rb") as f:
+            input_bytes = f.read()
+    else:
+        query["reader"] = "text"
+    # 이전 실행의 캐시에 걸리지 않도록 시드를 지정하지 않으면 실행마다 다른 대본
+    seed = args.seed if args.seed is not None else time.time_ns() % 1_000_000
+
+    results = []
+    for round_number, concurrency in enumerate(args.concurrency):
+        if args.input:
+            bodies = [input_bytes] * args.requests
+        else:
+            first = round_number * args.requests
+            bodies = [
+                make_script(0 if args.repeat else first + i, args.sentences, seed) for i in range(args.requests)
+            ]
+        result = run_load(base_url, bodies, query, concurrency, args.timeout)
+        results.append(result)
+        latency = (
+            f"p50 {result['p50'] * 1000:.0f} ms, p95 {result['p95'] * 1000:.0f} ms, "
+            f"p99 {result['p99'] * 1000:.0f} ms, 최대 {result['max'] * 1000:.0f} ms"
+            if result["p50"] is not None else "성공한 요청 없음"
+        )
+        print(
+            f"동시 {concurrency:>3}: {result['throughput']:.2f} 요청/초 ({result['requests']}개, {result['seconds']:.1f}초), "
+            f"{latency}, 실패 {result['errors']}개, 캐시 적중 {result['cache_hits']}개"
+        )
+        if result["batches"]:
+            print(
+                f"          모델 호출 {result['batches']}회, 호출당 요청 {result['requests_per_batch']:.2f}개 · "
+                f"문장 {result['sentences_per_batch']:.0f}개, 인코딩 {result['encode_seconds']:.2f}초"
+            )
+        if result["first_error"]:
+            print(f"          첫 오류: {result['first_error']}", file=sys.stderr)
+
+    if args.json:
+        stats = _get_json(f"{base_url}/stats")
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"url": base_url, "query": query, "results": results, "server": stats}, f, ensure_ascii=False, indent=2)
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
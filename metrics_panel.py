@@ -0,0 +1,38 @@
+# 관리자용 단계별 소요 시간 패널 (Streamlit 사이드바)
+#
+# 주소에 ?admin=1을 붙여 열면 사이드바에 계측 on/off, 단계별 p50/p95 표와 분포 히스토그램이 표시됩니다.
+
+import streamlit as st
+
+import instrumentation
+
+
+def render_metrics_panel():
+    if st.query_params.get("admin") != "1":
+        return
+    with st.sidebar.expander("📊 단계별 소요 시간", expanded=True):
+        enabled = st.toggle("계측 켜기", value=instrumentation.is_enabled(), key="metrics_enabled")
+        if enabled != instrumentation.is_enabled():
+            instrumentation.set_enabled(enabled)
+
+        stats = instrumentation.summary()
+        if not stats:
+            st.caption("아직 측정값이 없습니다." if enabled else "계측이 꺼져 있습니다.")
+            return
+        st.dataframe(
+            {
+                "단계": list(stats),
+                "횟수": [stat["count"] for stat in stats.values()],
+                "p50 (ms)": [round(stat["p50"] * 1000, 1) for stat in stats.values()],
+                "p95 (ms)": [round(stat["p95"] * 1000, 1) for stat in stats.values()],
+            },
+            hide_index=True,
+        )
+        stage = st.selectbox("분포를 볼 단계", list(stats), key="metrics_stage")
+        buckets = instrumentation.histogram(stage)
+        st.bar_chart(
+            {"ms": [f"{start:.0f}" for start, _ in buckets], "횟수": [count for _, count in buckets]}, x="ms", y="횟수"
+        )
+        if st.button("측정값 초기화", key="metrics_reset"):
+            instrumentation.reset()
+            st.rerun()
@@ -0,0 +1,106 @@
+# 여러 작업의 문장 인코딩 요청을 모아 한 번에 처리하는 마이크로 배처
+#
+# 동시에 도는 작업마다 모델을 따로 부르면 작은 배치의 순전파가 여러 번 일어나 CPU를 비효율적으로 씁니다.
+# MicroBatcher.encode()는 요청을 대기열에 넣고 결과를 기다리기만 하고, 전용 스레드가 첫 요청이 도착한 뒤
+# max_wait초 동안(또는 문장이 max_batch개 찰 때까지) 들어온 요청을 합쳐 모델을 한 번 호출한 다음
+# 결과를 요청별로 나눠 돌려줍니다. 같은 배치 안에서 겹치는 문장은 한 번만 인코딩합니다.
+#
+# 사용 예:
+#   batcher = MicroBatcher(lambda sentences: model.encode(sentences, normalize_embeddings=True))
+#   embeddings = batcher.encode(sentences)  # 여러 스레드에서 동시에 호출 가능
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+DEFAULT_MAX_BATCH = int(os.environ.get("PAYDO_BATCH_SENTENCES", "256"))  # 한 번에 인코딩할 문장 수 상한
+DEFAULT_MAX_WAIT = float(os.environ.get("PAYDO_BATCH_WAIT_MS", "10")) / 1000  # 첫 요청 뒤 다른 요청을 기다리는 시간
+
+
+class MicroBatcher:
+    """encode_fn(문장 목록) → 임베딩 배열 호출을 여러 스레드의 요청에 걸쳐 묶어 실행합니다."""
+
+    def __init__(self, encode_fn, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        self.encode_fn = encode_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0  # 모델 호출 수
+        self.requests = 0  # 처리한 encode() 호출 수
+        self.sentences = 0  # 요청된 문장 수 (중복 포함)
+        self.encoded = 0  # 실제로 인코딩한 문장 수 (배치 안 중복 제외)
+        self.encode_seconds = 0.0
+        self._pending = queue.Queue()  # (문장 목록, Future)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._loop, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def encode(self, sentences):
+        """문장 목록의 임베딩 배열을 반환합니다. 다른 스레드의 요청과 같은 배치로 묶일 수 있습니다."""
+        sentences = list(sentences)
+        if not sentences:
+            return np.zeros((0, 0), dtype=np.float32)
+        future = Future()
+        self._pending.put((sentences, future))
+        return future.result()
+
+    def _collect(self):
+        # 첫 요청은 올 때까지 기다리고, 그 뒤로는 마감 시각까지 또는 배치가 찰 때까지만 더 받음
+        # (마감이 지나도 이미 대기열에 있는 요청은 기다림 없이 함께 묶음)
+        batch = [self._pending.get()]
+        size = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = self._pending.get(timeout=remaining) if remaining > 0 else self._pending.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            # 결과를 기다리는 쪽이 이미 취소한 요청은 건너뜀
+            batch = [(sentences, future) for sentences, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            unique = list(dict.fromkeys(sentence for sentences, _ in batch for sentence in sentences))
+            start = time.perf_counter()
+            try:
+                embeddings = np.asarray(self.encode_fn(unique), dtype=np.float32)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self.batches += 1
+                self.requests += len(batch)
+                self.sentences += sum(len(sentences) for sentences, _ in batch)
+                self.encoded += len(unique)
+                self.encode_seconds += elapsed
+            position = {sentence: i for i, sentence in enumerate(unique)}
+            for sentences, future in batch:
+                future.set_result(embeddings[[position[sentence] for sentence in sentences]])
+
+    def stats(self):
+        """배치 효율 지표: 모델 호출 수, 호출당 평균 요청 수·문장 수, 대기 중인 요청 수."""
+        with self._lock:
+            batches = self.batches
+            return {
+                "batches": batches,
+                "requests": self.requests,
+                "sentences": self.sentences,
+                "encoded": self.encoded,
+                "encode_seconds": round(self.encode_seconds, 3),
+                "requests_per_batch": round(self.requests / batches, 2) if batches else 0.0,
+                "sentences_per_batch": round(self.encoded / batches, 1) if batches else 0.0,
+                "pending": self._pending.qsize(),
+            }
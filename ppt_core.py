@@ -0,0 +1,626 @@
+# Paydo PPT 생성 핵심 로직 (Streamlit 없이 import 가능)
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml.ns import qn
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+import re
+import docx
+from collections import deque
+from bisect import bisect_right
+from xml.etree import ElementTree
+import zipfile
+import os
+from copy import deepcopy
+from functools import lru_cache
+from text_width import count_lines, wrap_paragraphs, wrap_text
+from instrumentation import timed
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "template.pptx")
+
+# Word 파일에서 텍스트 추출하는 함수
+@timed("extract")
+def extract_text_from_word(file_like_object):
+    """업로드된 파일 객체에서 텍스트를 추출합니다."""
+    doc = docx.Document(file_like_object)
+    return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
+
+# Word 파일의 본문 문단을 document.xml에서 바로 하나씩 읽어오는 함수
+def iter_paragraphs_from_word(file_like_object):
+    """문서 전체를 메모리에 올리지 않고 본문 문단 텍스트를 차례로 내보냅니다."""
+    with zipfile.ZipFile(file_like_object) as package:
+        with package.open(_find_main_document_part(package)) as document_xml:
+            body = None
+            depth = 0
+            for event, elem in ElementTree.iterparse(document_xml, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and elem.tag == _W + "body":
+                        body = elem
+                    continue
+                depth -= 1
+                if depth == 2 and body is not None:
+                    # 본문 바로 아래 요소만 처리하고 즉시 버려서 메모리를 일정하게 유지
+                    if elem.tag == _W + "p":
+                        yield _paragraph_text(elem)
+                    body.clear()
+
+# 비어 있지 않은 문단을 줄 단위로 내보냄 (extract_text_from_word(...).split('\n')와 같은 결과)
+def iter_lines_from_word(file_like_object):
+    for paragraph in iter_paragraphs_from_word(file_like_object):
+        if paragraph.strip():
+            yield from paragraph.split('\n')
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+_RUN_TEXT = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+def _find_main_document_part(package):
+    rels = ElementTree.fromstring(package.read("_rels/.rels"))
+    for rel in rels:
+        if rel.get("Type") == _OFFICE_DOCUMENT_REL:
+            return rel.get("Target").lstrip("/")
+    return "word/document.xml"
+
+# python-docx의 Paragraph.text와 같은 규칙으로 문단 텍스트 구성
+def _paragraph_text(p):
+    parts = []
+    for child in p:
+        if child.tag == _W + "r":
+            _append_run_text(child, parts)
+        elif child.tag == _W + "hyperlink":
+            for run in child.iterfind(_W + "r"):
+                _append_run_text(run, parts)
+    return "".join(parts)
+
+def _append_run_text(run, parts):
+    for child in run:
+        if child.tag == _W + "t":
+            parts.append(child.text or "")
+        elif child.tag == _W + "br":
+            if child.get(_W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif child.tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[child.tag])
+
+# 문장이 차지할 줄 수 계산 (글자 수가 아닌 표시 너비 기준)
+def calculate_text_lines(text, max_chars_per_line):
+    return count_lines(text, max_chars_per_line)
+
+# 분할 단계에서 줄바꿈한 결과를 렌더링까지 그대로 넘기는 슬라이드 데이터
+class Slide:
+    __slots__ = ("lines", "line_count", "needs_check", "is_title")
+
+    def __init__(self, lines, needs_check=False, is_title=False):
+        self.lines = tuple(lines)  # PPT에 한 줄씩 그대로 들어갈 줄 목록
+        self.line_count = len(self.lines)
+        self.needs_check = needs_check  # '확인 필요!' 표시 여부
+        self.is_title = is_title  # 주제별 섹션의 제목 슬라이드 여부
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+    def __repr__(self):
+        title = ", is_title=True" if self.is_title else ""
+        return f"Slide({self.lines!r}, needs_check={self.needs_check!r}{title})"
+
+# 텍스트를 슬라이드로 분할 및 그룹화
+@timed("split")
+def split_and_group_text(text, max_lines_per_slide, max_chars_per_line_ppt):
+    return list(iter_split_and_group_text(text.split('\n'), max_lines_per_slide, max_chars_per_line_ppt))
+
+# 줄 단위 입력을 받아 완성되는 슬라이드부터 차례로 내보냄
+def iter_split_and_group_text(lines, max_lines_per_slide, max_chars_per_line_ppt):
+    raw_slides = (
+        raw_slide
+        for _, segments, slide_lines in _iter_line_groups(lines, max_lines_per_slide, max_chars_per_line_ppt)
+        for raw_slide in _split_line_group(segments, slide_lines, max_lines_per_slide, max_chars_per_line_ppt)
+    )
+    return _iter_slides(raw_slides, max_chars_per_line_ppt)
+
+# (텍스트, 분할 여부) 목록을 Slide로 변환
+def _iter_slides(raw_slides, max_chars_per_line_ppt):
+    # 빈 슬라이드는 건너뛰되, 분할 여부는 기존처럼 앞에서부터 순서대로 배정
+    pending_flags = deque()
+    for slide_text, split_flag in raw_slides:
+        pending_flags.append(split_flag)
+        if slide_text.strip():
+            # 줄 수를 셀 때와 같은 줄바꿈 결과 (메모되어 있어 다시 계산하지 않음)
+            yield Slide(wrap_paragraphs(slide_text, max_chars_per_line_ppt), pending_flags.popleft())
+
+# 줄을 [줄 목록, 누적 줄 수] 세그먼트로 쌓아 전체 슬라이드를 다시 줄바꿈하지 않음
+# (묶음마다 첫 줄의 위치도 함께 내보내며, 중간부터 다시 시작할 때는 keep_leading_blanks=True)
+def _iter_line_groups(lines, max_lines_per_slide, max_chars_per_line_ppt, first_index=0, keep_leading_blanks=False):
+    segments = None
+    slide_lines = 0
+    blank_indexes = []  # 앞뒤 공백 줄은 버리고, 사이의 공백 줄만 유지
+    for index, line in enumerate(lines, first_index):
+        line = line.strip()
+        if not line:
+            if segments is not None or keep_leading_blanks:
+                blank_indexes.append(index)
+            continue
+        for line_index, line in [(blank_index, "") for blank_index in blank_indexes] + [(index, line)]:
+            line_count = calculate_text_lines(line, max_chars_per_line_ppt)
+            if segments is not None and slide_lines + line_count <= max_lines_per_slide:
+                segments.append(line)
+                slide_lines += line_count
+            else:
+                if segments is not None:
+                    yield group_index, segments, slide_lines
+                group_index = line_index
+                segments = [line]
+                slide_lines = line_count
+        blank_indexes = []
+    if segments is not None:
+        yield group_index, segments, slide_lines
+
+# 미리보기용 증분 분할: 직전 입력의 분할 결과를 기억해, 바뀐 줄 주변의 묶음만 다시 분할
+class IncrementalSplitter:
+    """split_and_group_text와 같은 결과를, 바뀌지 않은 앞뒤 묶음은 재사용하며 계산합니다."""
+
+    def __init__(self, max_lines_per_slide, max_chars_per_line_ppt):
+        self.max_lines_per_slide = max_lines_per_slide
+        self.max_chars_per_line_ppt = max_chars_per_line_ppt
+        self.first_changed_slide = 0  # 직전 결과와 달라졌을 수 있는 첫 슬라이드 위치
+        self._lines = []
+        self._group_starts = []  # 묶음별 첫 줄 위치
+        self._group_slides = []  # 묶음별 (텍스트, 분할 여부) 목록
+        self._slides = []
+
+    def update(self, text):
+        lines = text.split('\n')
+        old_lines = self._lines
+        prefix = 0
+        limit = min(len(lines), len(old_lines))
+        while prefix < limit and lines[prefix] == old_lines[prefix]:
+            prefix += 1
+        if prefix == len(lines) == len(old_lines):
+            self.first_changed_slide = len(self._slides)
+            return self._slides
+        suffix = 0
+        while suffix < limit - prefix and lines[-1 - suffix] == old_lines[-1 - suffix]:
+            suffix += 1
+
+        # 바뀐 줄 앞의 마지막 내용 있는 줄이 속한 묶음부터 다시 분할
+        # (사이의 공백 줄은 뒤에 내용이 올 때에야 묶음에 들어가므로, 그 앞 묶음들만 바뀐 줄과 무관)
+        last_text = prefix - 1
+        while last_text >= 0 and not lines[last_text].strip():
+            last_text -= 1
+        keep = max(bisect_right(self._group_starts, last_text) - 1, 0)
+        restart = self._group_starts[keep] if keep < len(self._group_starts) else 0
+        if keep == 0:
+            restart = 0  # 첫 묶음부터라면 앞쪽 공백 줄 규칙까지 처음과 똑같이 적용
+        group_starts = self._group_starts[:keep]
+        group_slides = self._group_slides[:keep]
+
+        # 바뀐 부분 뒤에서 예전과 같은 위치(줄 수 차이만큼 이동)에 묶음이 시작되면 나머지는 그대로 재사용
+        shift = len(lines) - len(old_lines)
+        old_group_positions = {start: i for i, start in enumerate(self._group_starts)}
+        reusable_from = len(lines) - suffix
+        groups = _iter_line_groups(
+            lines[restart:], self.max_lines_per_slide, self.max_chars_per_line_ppt,
+            first_index=restart, keep_leading_blanks=restart > 0,
+        )
+        for start, segments, slide_lines in groups:
+            old_position = old_group_positions.get(start - shift)
+            if start >= reusable_from and start > prefix and old_position is not None:
+                group_starts.extend(old_start + shift for old_start in self._group_starts[old_position:])
+                group_slides.extend(self._group_slides[old_position:])
+                break
+            group_starts.append(start)
+            group_slides.append(list(_split_line_group(segments, slide_lines, self.max_lines_per_slide, self.max_chars_per_line_ppt)))
+
+        self._lines = lines
+        self._group_starts = group_starts
+        self._group_slides = group_slides
+        self._slides = list(_iter_slides(
+            (raw_slide for raw_slides in group_slides for raw_slide in raw_slides), self.max_chars_per_line_ppt
+        ))
+        self.first_changed_slide = sum(
+            1 for raw_slides in group_slides[:keep] for slide_text, _ in raw_slides if slide_text.strip()
+        )
+        return self._slides
+
+# 줄 수를 넘는 세그먼트는 문장 부호 기준, 그래도 넘치면 단어 묶음 기준으로 분할
+def _split_line_group(segments, slide_lines, max_lines_per_slide, max_chars_per_line_ppt):
+    max_chars_per_segment = 60
+
+    if slide_lines <= max_lines_per_slide:
+        yield "\n".join(segments), False
+        return
+
+    original_sentence = " ".join(segments)
+    sub_sentences = re.split(r'(?<=[.?!;])\s+', original_sentence.strip())
+    temp_segments = []
+    temp_slide_lines = 0
+    is_forced_split = False
+    for sub_sentence in sub_sentences:
+        sub_sentence = sub_sentence.strip()
+        sub_sentence_lines = calculate_text_lines(sub_sentence, max_chars_per_line_ppt)
+        if temp_slide_lines + sub_sentence_lines <= max_lines_per_slide:
+            if sub_sentence or temp_segments:
+                temp_segments.append(sub_sentence)
+            temp_slide_lines += sub_sentence_lines
+        else:
+            yield " ".join(temp_segments), is_forced_split
+            temp_segments = [sub_sentence] if sub_sentence else []
+            temp_slide_lines = sub_sentence_lines
+            is_forced_split = False
+
+    temp_slide_text = " ".join(temp_segments)
+    if not temp_slide_text:
+        return
+    if calculate_text_lines(temp_slide_text, max_chars_per_line_ppt) <= max_lines_per_slide:
+        yield temp_slide_text, False
+        return
+
+    segment_words = []
+    segment_chars = 0  # 공백을 제외한 글자 수
+    for word in temp_slide_text.split():
+        if segment_chars + len(word) + (1 if segment_words else 0) <= max_chars_per_segment:
+            segment_words.append(word)
+            segment_chars += len(word)
+        else:
+            yield " ".join(segment_words), True
+            segment_words = [word]
+            segment_chars = len(word)
+    if segment_words:
+        yield " ".join(segment_words), True
+
+# 최적 분할 모드 (Knuth–Plass 줄바꿈처럼 슬라이드 경계를 동적 계획법으로 선택)
+#
+# 입력 줄을 단위로 쓰고, 한 슬라이드에 들어가지 않는 줄만 문장 → 절 → 줄 묶음 순으로 잘라 단위를 만듭니다.
+# 경계마다 위치에 따른 벌점(빈 줄 < 줄바꿈 < 문장 < 절 < 문장 중간)을 매기고,
+# "슬라이드 수 + 빈 줄이 많은 슬라이드의 들쭉날쭉함 + 경계 벌점"이 최소가 되도록 나눕니다.
+# 단위마다 최소 한 줄이므로 한 슬라이드 후보는 최대 max_lines_per_slide개이고, 전체는 입력 길이에 선형입니다.
+
+PACKING_MODES = ("greedy", "optimal")
+
+_BREAK_PENALTIES = {"paragraph": 0.0, "line": 0.05, "sentence": 0.2, "clause": 0.5, "chunk": 1.0}
+_RAGGED_WEIGHT = 0.5  # 빈 줄 비율의 제곱에 곱하는 가중치 (마지막 슬라이드는 제외)
+
+_clause_pattern = re.compile(r'(?<=[,:])\s+')
+
+
+class _Unit:
+    __slots__ = ("text", "wrapped", "source", "blanks_before", "break_before", "separator")
+
+    def __init__(self, text, wrapped, source, blanks_before, break_before, separator=" "):
+        self.text = text
+        self.wrapped = wrapped  # 표시 너비로 줄바꿈한 줄 (단위마다 최소 한 줄)
+        self.source = source  # 원래 입력 줄 번호 (같은 줄에서 나온 단위는 한 문단으로 이어 붙임)
+        self.blanks_before = blanks_before  # 바로 앞의 공백 줄 수
+        self.break_before = break_before  # 이 단위 앞에서 슬라이드를 나눌 때의 경계 종류
+        self.separator = separator  # 같은 줄의 앞 단위와 이어 붙일 때 사이에 넣을 글자 (단어 중간에서 잘렸으면 "")
+
+
+# 줄바꿈한 각 줄이 공백을 하나로 정리한 원문(normalized)의 어디부터 어디까지인지
+# (wrap_text는 단어 사이를 공백 하나로 잇고 긴 단어는 공백 없이 자르므로, 각 줄은 normalized의 연속된 구간)
+def _wrapped_spans(normalized, wrapped):
+    spans = []
+    position = 0
+    for line in wrapped:
+        if normalized.startswith(" ", position):
+            position += 1
+        spans.append((position, position + len(line)))
+        position += len(line)
+    return spans
+
+
+# 한 줄을 (텍스트, 줄바꿈 결과, 경계 종류, 앞 단위와의 구분자) 목록으로:
+# 슬라이드에 들어가면 그대로, 아니면 문장 → 절 → 줄 묶음으로 자름
+def _line_units(line, max_lines_per_slide, max_chars_per_line_ppt):
+    wrapped = wrap_text(line, max_chars_per_line_ppt)
+    if len(wrapped) <= max_lines_per_slide:
+        return [(line, wrapped, "line", " ")]
+    units = []
+    for sentence_index, sentence in enumerate(re.split(r'(?<=[.?!;])\s+', line)):
+        for clause_index, clause in enumerate(_clause_pattern.split(sentence)):
+            kind = "clause" if clause_index else ("sentence" if sentence_index else "line")
+            wrapped = wrap_text(clause, max_chars_per_line_ppt)
+            # 묶음 텍스트는 원문 구간을 그대로 잘라 씀 (줄을 공백으로 이으면 잘린 긴 단어 중간에 공백이 생김)
+            normalized = " ".join(clause.split())
+            spans = _wrapped_spans(normalized, wrapped)
+            for start in range(0, len(wrapped), max_lines_per_slide):
+                chunk = wrapped[start:start + max_lines_per_slide]
+                begin, end = spans[start][0], spans[start + len(chunk) - 1][1]
+                separator = "" if begin and normalized[begin - 1] != " " else " "
+                units.append((normalized[begin:end], chunk, kind if start == 0 else "chunk", separator))
+    return units
+
+
+def _pack_units(lines, max_lines_per_slide, max_chars_per_line_ppt):
+    units = []
+    blanks = 0
+    for source, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            if units:
+                blanks += 1
+            continue
+        for i, (text, wrapped, kind, separator) in enumerate(_line_units(line, max_lines_per_slide, max_chars_per_line_ppt)):
+            if i == 0 and blanks:
+                kind = "paragraph"
+            units.append(_Unit(text, wrapped, source, blanks if i == 0 else 0, kind, separator))
+        blanks = 0
+    return units
+
+
+# best[m] = units[:m]을 나누는 최소 비용. 슬라이드 units[k:m]의 줄 수는 누적 합으로 O(1)에 계산
+def _optimal_breaks(units, max_lines_per_slide):
+    n = len(units)
+    # used[m] = units[:m]의 줄 수 + 단위 사이 공백 줄 수 (첫 단위 앞 공백은 제외)
+    used = [0] * (n + 1)
+    leading_blanks = [0] * (n + 1)
+    end_penalties = [0.0] * (n + 1)
+    for m, unit in enumerate(units):
+        used[m + 1] = used[m] + len(unit.wrapped) + (unit.blanks_before if m else 0)
+        leading_blanks[m] = unit.blanks_before if m else 0
+        end_penalties[m] = _BREAK_PENALTIES[unit.break_before]
+    end_penalties[n] = 0.0
+    ragged = [_RAGGED_WEIGHT * ((max_lines_per_slide - lines) / max_lines_per_slide) ** 2 for lines in range(max_lines_per_slide + 1)]
+
+    best = [0.0] + [float("inf")] * n
+    previous = [0] * (n + 1)
+    for m in range(1, n + 1):
+        end_penalty = end_penalties[m]
+        used_m = used[m]
+        best_cost = float("inf")
+        best_k = m - 1
+        k = m - 1
+        while k >= 0:
+            # 슬라이드 첫 단위 앞의 공백 줄은 경계에서 버려지므로 세지 않음
+            slide_lines = used_m - used[k] - leading_blanks[k]
+            if slide_lines > max_lines_per_slide:
+                break
+            # 마지막 슬라이드는 Knuth–Plass의 문단 마지막 줄처럼 빈 줄 벌점 없음
+            cost = best[k] + 1.0 + (ragged[slide_lines] if m < n else 0.0)
+            if cost < best_cost:
+                best_cost = cost
+                best_k = k
+            k -= 1
+        best[m] = best_cost + end_penalty
+        previous[m] = best_k
+
+    breaks = []
+    m = n
+    while m > 0:
+        breaks.append((previous[m], m))
+        m = previous[m]
+    return breaks[::-1]
+
+
+# 슬라이드 안에서 같은 입력 줄의 단위는 한 문단으로 다시 줄바꿈하고, 단위 사이 공백 줄은 그대로 둠
+def _units_to_lines(units, max_chars_per_line_ppt):
+    lines = []
+    start = 0
+    for end in range(1, len(units) + 1):
+        if end < len(units) and units[end].source == units[start].source:
+            continue
+        if start:
+            lines.extend([""] * units[start].blanks_before)
+        if end - start == 1:
+            lines.extend(units[start].wrapped)
+        else:
+            text = units[start].text + "".join(unit.separator + unit.text for unit in units[start + 1:end])
+            lines.extend(wrap_text(text, max_chars_per_line_ppt))
+        start = end
+    return lines
+
+
+# 텍스트를 최적 분할 모드로 슬라이드에 배치 (split_and_group_text와 같은 인자와 반환값)
+# 문장 중간(줄 묶음 경계)에서 잘린 슬라이드만 '확인 필요'로 표시
+@timed("split", packing="optimal")
+def split_and_group_text_optimal(text, max_lines_per_slide, max_chars_per_line_ppt):
+    units = _pack_units(text.split('\n'), max_lines_per_slide, max_chars_per_line_ppt)
+    slides = []
+    for start, end in _optimal_breaks(units, max_lines_per_slide):
+        cut = units[start].break_before == "chunk" or (end < len(units) and units[end].break_before == "chunk")
+        slides.append(Slide(_units_to_lines(units[start:end], max_chars_per_line_ppt), cut))
+    return slides
+
+
+# 분할 모드 이름 → 분할 함수
+def get_packer(packing):
+    return split_and_group_text_optimal if packing == "optimal" else split_and_group_text
+
+# PPT 생성 함수
+# progress가 있으면 슬라이드를 하나 만들 때마다 progress(만든 수, 전체 수)를 호출
+@timed("render")
+def create_ppt(slides, font_size=54, progress=None):
+    prs = Presentation()
+    prs.slide_width = Inches(13.33)
+    prs.slide_height = Inches(7.5)
+    total_slides = len(slides)
+
+    for i, slide_data in enumerate(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        add_text_to_slide(slide, slide_data.lines, font_size, PP_ALIGN.CENTER)
+        add_slide_number(slide, i + 1, total_slides)
+        if slide_data.needs_check:
+            add_check_needed_shape(slide)
+        if i == total_slides - 1:
+            add_end_mark(slide)
+        if progress is not None:
+            progress(i + 1, total_slides)
+
+    return prs
+
+# template.pptx 기반 고속 PPT 생성 함수
+@timed("render", renderer="template")
+def create_ppt_from_template(slides, font_size=54, template_path=TEMPLATE_PATH, progress=None):
+    """서식이 적용된 원형 슬라이드를 한 번만 만들고, 슬라이드마다 원형 XML을 복제해 텍스트와 번호만 바꿉니다."""
+    prs = Presentation(template_path)
+    prs.slide_width = Inches(13.33)
+    prs.slide_height = Inches(7.5)
+    prototype = _build_slide_prototype(prs, font_size)
+    layout = prs.slide_layouts[6]
+    total_slides = len(slides)
+
+    for i, slide_data in enumerate(slides):
+        slide = prs.slides.add_slide(layout)
+        _stamp_slide(slide.shapes._spTree, prototype, slide_data, i + 1, total_slides, i == total_slides - 1)
+        if progress is not None:
+            progress(i + 1, total_slides)
+
+    return prs
+
+# 템플릿의 예시 슬라이드에 기존 함수로 도형을 한 번 그려 원형으로 떼어낸 뒤, 예시 슬라이드는 덱에서 제거
+def _build_slide_prototype(prs, font_size):
+    slide = prs.slides[0] if len(prs.slides) else prs.slides.add_slide(prs.slide_layouts[6])
+    sp_tree = slide.shapes._spTree
+    for shape in list(sp_tree.iterchildren(qn("p:sp"))):
+        sp_tree.remove(shape)
+
+    add_text_to_slide(slide, ["_"], font_size, PP_ALIGN.CENTER)
+    add_slide_number(slide, 0, 0)
+    add_check_needed_shape(slide)
+    add_end_mark(slide)
+    # '확인 필요!'·'끝'은 글꼴을 테마에 맡기므로, 템플릿의 테마 글꼴이 기본 덱과 다르면(template.pptx는 맑은 고딕)
+    # create_ppt와 같게 보이도록 기본 덱의 테마 글꼴을 박아 둠
+    default_font = _default_theme_font()
+    if _theme_font(prs) != default_font:
+        for shape in list(slide.shapes)[-2:]:
+            shape.text_frame.paragraphs[0].font.name = default_font
+    text_shape, number_shape, check_shape, end_shape = sp_tree.iterchildren(qn("p:sp"))
+
+    # 본문 상자에서 서식이 적용된 줄 문단을 떼어 두고, 슬라이드마다 줄 수만큼 복제
+    text_body = text_shape.find(qn("p:txBody"))
+    line_paragraph = text_body.findall(qn("a:p"))[-1]
+    text_body.remove(line_paragraph)
+
+    slide_ids = prs.slides._sldIdLst
+    prs.part.drop_rel(slide_ids[0].rId)
+    slide_ids.remove(slide_ids[0])
+
+    return {
+        "text": text_shape,
+        "line": line_paragraph,
+        "number": number_shape,
+        "check": check_shape,
+        "end": end_shape,
+    }
+
+# 덱 테마의 본문(minor) 라틴 글꼴 이름
+def _theme_font(prs):
+    theme = prs.slide_masters[0].part.part_related_by(RT.THEME)
+    latin = ElementTree.fromstring(theme.blob).find(f".//{qn('a:minorFont')}/{qn('a:latin')}")
+    return latin.get("typeface") if latin is not None else None
+
+@lru_cache(maxsize=None)
+def _default_theme_font():
+    return _theme_font(Presentation())
+
+def _stamp_slide(sp_tree, prototype, slide_data, current, total, is_last):
+    text_shape = deepcopy(prototype["text"])
+    text_body = text_shape.find(qn("p:txBody"))
+    for line in slide_data.lines:
+        paragraph = deepcopy(prototype["line"])
+        run = paragraph.find(qn("a:r"))
+        if line:
+            run.text = line
+        else:
+            paragraph.remove(run)  # python-pptx도 빈 줄에는 run을 만들지 않음
+        text_body.append(paragraph)
+
+    number_shape = deepcopy(prototype["number"])
+    number_shape.find(".//" + qn("a:r")).text = f"{current} / {total}"
+
+    shapes = [text_shape, number_shape]
+    if slide_data.needs_check:
+        shapes.append(deepcopy(prototype["check"]))
+    if is_last:
+        shapes.append(deepcopy(prototype["end"]))
+
+    # python-pptx가 도형을 추가할 때와 같은 id/이름 부여
+    for shape_id, shape in enumerate(shapes, start=2):
+        c_nv_pr = shape.find(qn("p:nvSpPr")).find(qn("p:cNvPr"))
+        c_nv_pr.set("id", str(shape_id))
+        c_nv_pr.set("name", f"{c_nv_pr.get('name').rsplit(' ', 1)[0]} {shape_id - 1}")
+        sp_tree.append(shape)
+
+# 슬라이드에 텍스트 추가 (분할 단계에서 줄바꿈한 줄을 한 문단씩)
+def add_text_to_slide(slide, lines, font_size, alignment):
+    textbox = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.33), Inches(6.2))
+    text_frame = textbox.text_frame
+    text_frame.clear()
+    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP  # 상단 정렬 명시적으로 설정
+    text_frame.word_wrap = True
+
+    text_frame.clear()
+    for line in lines:
+        p = text_frame.add_paragraph()
+        p.text = line
+        p.font.size = Pt(font_size)
+        p.font.name = 'Noto Color Emoji'
+        p.font.bold = True
+        p.font.color.rgb = RGBColor(0, 0, 0)
+        p.alignment = alignment
+        p.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
+
+    # 텍스트 박스의 자동 맞춤 기능 제거 (상단 정렬에 영향 줄 수 있음)
+    text_frame.auto_size = None
+    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
+
+# 슬라이드 번호 추가
+def add_slide_number(slide, current, total):
+    footer_box = slide.shapes.add_textbox(Inches(11.5), Inches(7.0), Inches(1.5), Inches(0.4))
+    footer_text_frame = footer_box.text_frame
+    footer_text_frame.clear()
+    p = footer_text_frame.paragraphs[0]
+    p.text = f"{current} / {total}"
+    p.font.size = Pt(18)
+    p.font.name = '맑은 고딕'
+    p.font.color.rgb = RGBColor(128, 128, 128)
+    p.alignment = PP_ALIGN.RIGHT
+
+# '끝' 모양 추가
+def add_end_mark(slide):
+    end_shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE,
+        Inches(10),
+        Inches(6),
+        Inches(2),
+        Inches(1)
+    )
+    end_shape.fill.solid()
+    end_shape.fill.fore_color.rgb = RGBColor(255, 0, 0)
+    end_shape.line.color.rgb = RGBColor(0, 0, 0)
+
+    end_text_frame = end_shape.text_frame
+    end_text_frame.clear()
+    p = end_text_frame.paragraphs[0]
+    p.text = "끝"
+    p.font.size = Pt(36)
+    p.font.color.rgb = RGBColor(255, 255, 255)
+    end_text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+    p.alignment = PP_ALIGN.CENTER
+
+# '확인 필요!' 모양 추가
+def add_check_needed_shape(slide):
+    check_shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE,
+        Inches(0.5),
+        Inches(0.3),
+        Inches(2),
+        Inches(0.5)
+    )
+    check_shape.fill.solid()
+    check_shape.fill.fore_color.rgb = RGBColor(255, 255, 0)
+    check_shape.line.color.rgb = RGBColor(0, 0, 0)
+
+    check_text_frame = check_shape.text_frame
+    check_text_frame.clear()
+    p = check_text_frame.paragraphs[0]
+    p.text = "확인 필요!"
+    p.font.size = Pt(18)
+    p.font.bold = True
+    p.font.color.rgb = RGBColor(0, 0, 0)
+    text_frame = check_shape.text_frame
+    text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+    p.alignment = PP_ALIGN.CENTER
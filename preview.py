@@ -0,0 +1,56 @@
+# 슬라이드 미리보기 카드 (HTML)
+#
+# PPT를 만들지 않고 분할 결과만 빠르게 보여 주기 위한 것으로, Streamlit 없이도 import할 수 있습니다.
+
+import html
+
+PREVIEW_PAGE_SIZE = 12
+
+_CARD_STYLE = (
+    "display:flex;flex-direction:column;justify-content:center;aspect-ratio:16/9;padding:8px;"
+    "border:1px solid #ccc;border-radius:6px;background:#fff;color:#000;text-align:center;position:relative;"
+)
+_CHECK_STYLE = "position:absolute;top:4px;left:6px;padding:0 4px;background:#ff0;font-size:11px;font-weight:bold;"
+_NUMBER_STYLE = "position:absolute;bottom:4px;right:6px;font-size:11px;color:#666;"
+_TITLE_STYLE = "background:#1f4e79;color:#fff;"
+
+
+def first_difference(old_slides, new_slides):
+    """두 슬라이드 목록에서 처음으로 내용이나 '확인 필요'·제목 슬라이드 표시가 달라지는 위치."""
+    for i, (old, new) in enumerate(zip(old_slides, new_slides)):
+        if old.lines != new.lines or old.needs_check != new.needs_check or old.is_title != new.is_title:
+            return i
+    return min(len(old_slides), len(new_slides))
+
+
+def preview_page_start(first_changed, total, page_size=PREVIEW_PAGE_SIZE):
+    """바뀐 슬라이드가 보이도록 미리보기 페이지의 시작 위치를 정합니다."""
+    return max(0, min(first_changed, total - page_size))
+
+
+def slide_cards_html(slides, start=0, page_size=PREVIEW_PAGE_SIZE, highlight_from=None):
+    """slides[start:start + page_size]를 16:9 카드로 그린 HTML. highlight_from 이후 카드는 테두리를 강조합니다."""
+    cards = [
+        _card_html(slide, i + 1, len(slides), highlight_from is not None and i >= highlight_from)
+        for i, slide in enumerate(slides[start:start + page_size], start)
+    ]
+    return _grid_html(cards)
+
+
+def numbered_cards_html(numbered_slides, total):
+    """(슬라이드 번호, 슬라이드) 목록을 강조한 카드로 그린 HTML. 수정본에서 새로 만든 슬라이드만 모아 보여 줄 때 씁니다."""
+    return _grid_html([_card_html(slide, number, total, True) for number, slide in numbered_slides])
+
+
+def _card_html(slide, number, total, highlighted):
+    style = _CARD_STYLE + (_TITLE_STYLE if slide.is_title else "") + ("border-color:#f63366;" if highlighted else "")
+    body = "<br>".join(html.escape(line) if line else "&nbsp;" for line in slide.lines)
+    check = f'<span style="{_CHECK_STYLE}">확인 필요!</span>' if slide.needs_check else ""
+    return (
+        f'<div style="{style}">{check}<div style="font-size:14px;line-height:1.4;">{body}</div>'
+        f'<span style="{_NUMBER_STYLE}">{number} / {total}</span></div>'
+    )
+
+
+def _grid_html(cards):
+    return '<div style="display:grid;grid-template-columns:repeat(3,1fr);gap:8px;">' + "".join(cards) + "</div>"
@@ -0,0 +1,314 @@
+# 대본 파일 형식별 읽기 함수 등록부
+#
+# 모든 읽기 함수는 파일 경로 또는 바이너리 파일 객체를 받아 문단 텍스트를 하나씩 내보냅니다.
+# (iter_paragraphs_from_word와 같은 모양: 빈 문단도 그대로, 문단 안 줄바꿈은 "\n")
+# app.py 쪽 분할은 iter_lines(...)를, app_ai.py 쪽 분할은 비어 있지 않은 문단 목록을 사용합니다.
+#
+# 사용 예:
+#   for line in iter_lines("script.srt"):
+#       ...
+#   paragraphs = [p for p in iter_paragraphs(uploaded_file, reader="txt") if p.strip()]
+
+import codecs
+import mmap
+import os
+import re
+import zipfile
+import zlib
+from contextlib import contextmanager
+from xml.etree import ElementTree
+
+from ppt_core import iter_paragraphs_from_word
+
+READERS = {}  # 확장자(점 없이 소문자) → 읽기 함수
+
+_ENCODING_PROBE_BYTES = 1 << 20  # 인코딩 판별에 쓰는 앞부분 크기
+
+
+def register_reader(*extensions):
+    def decorator(fn):
+        for extension in extensions:
+            READERS[extension] = fn
+        return fn
+    return decorator
+
+
+def reader_name(filename):
+    """파일 이름의 확장자로 고른 읽기 함수 이름 (지원하지 않으면 None)."""
+    extension = os.path.splitext(filename)[1].lower().lstrip(".")
+    return extension if extension in READERS else None
+
+
+def get_reader(reader=None, filename=None):
+    """reader 이름을 주면 그 읽기 함수를, 아니면 filename의 확장자로 고릅니다."""
+    name = reader or reader_name(filename or "")
+    if name not in READERS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {reader or filename} (지원 형식: {', '.join(READERS)})")
+    return READERS[name]
+
+
+def iter_paragraphs(source, reader=None, filename=None):
+    """source(경로 또는 바이너리 파일 객체)의 문단을 차례로 내보냅니다. 경로면 filename을 생략할 수 있습니다."""
+    if filename is None and isinstance(source, (str, os.PathLike)):
+        filename = os.fspath(source)
+    elif filename is None:
+        filename = getattr(source, "name", None)
+    return get_reader(reader, filename)(source)
+
+
+# 비어 있지 않은 문단을 줄 단위로 내보냄 (iter_lines_from_word와 같은 규칙)
+def iter_lines(source, reader=None, filename=None):
+    for paragraph in iter_paragraphs(source, reader, filename):
+        if paragraph.strip():
+            yield from paragraph.split("\n")
+
+
+# 경로는 mmap으로 열어 파일 전체를 read()로 복사하지 않고, 이미 메모리에 있는 업로드 파일은 그대로 사용
+@contextmanager
+def _open_buffer(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f, _mmap_file(f) as buffer:
+            yield buffer
+    elif hasattr(source, "getvalue"):
+        yield source.getvalue()
+    else:
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            yield source.read()
+        else:
+            with _mmap_file(source) as buffer:
+                yield buffer
+
+
+@contextmanager
+def _mmap_file(f):
+    if os.fstat(f.fileno()).st_size == 0:
+        yield b""  # 빈 파일은 mmap할 수 없음
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if hasattr(buffer, "madvise"):
+            buffer.madvise(mmap.MADV_SEQUENTIAL)  # 앞에서부터 한 번만 읽으므로 미리 읽고, 지난 페이지는 먼저 회수
+        yield buffer
+
+
+# BOM이 없으면 앞부분을 UTF-8로 읽어 보고, 실패하면 한글 Windows 기본값(CP949)으로 판단
+def _detect_encoding(buffer):
+    head = buffer[:_ENCODING_PROBE_BYTES]
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)  # 잘린 마지막 글자는 허용
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8"
+
+
+# 버퍼에서 한 줄씩 잘라 디코딩 (줄 끝의 \r\n, \n 제거)
+def _iter_text_lines(buffer):
+    encoding = _detect_encoding(buffer)
+    if encoding == "utf-16":
+        # 2바이트 단위라 b"\n"으로 자를 수 없으므로 통째로 디코딩 (드문 형식)
+        yield from bytes(buffer).decode(encoding).splitlines()
+        return
+    start = len(codecs.BOM_UTF8) if encoding == "utf-8-sig" else 0
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield buffer[start:end].rstrip(b"\r").decode(encoding, errors="replace")
+        start = end + 1
+
+
+@register_reader("txt")
+def iter_paragraphs_from_txt(source):
+    """한 줄이 문단 하나 (Word에서 Enter로 나눈 문단과 같음)."""
+    with _open_buffer(source) as buffer:
+        yield from _iter_text_lines(buffer)
+
+
+_MD_FENCE = re.compile(r"^\s*(```|~~~)")
+_MD_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_MD_BLOCK_PREFIX = re.compile(r"^\s*(?:>\s*)*(?:#{1,6}\s+|[-*+]\s+(?:\[[ xX]\]\s+)?|\d+[.)]\s+)?")
+_MD_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_MD_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_MD_EMPHASIS = re.compile(r"(\*\*|\*|~~|`)(?=\S)(.+?)(?<=\S)\1")
+_MD_UNDERSCORE_EMPHASIS = re.compile(r"(?<!\w)(__|_)(?=\S)(.+?)(?<=\S)\1(?!\w)")  # snake_case는 그대로
+_MD_HTML_TAG = re.compile(r"</?[A-Za-z][^>]*>")
+_MD_CLOSING_HASHES = re.compile(r"\s+#+\s*$")  # "## 제목 ##"의 뒤쪽 기호
+_MD_BLOCK_STARTS = frozenset("#>-*+0123456789")
+_MD_INLINE_MARK = re.compile(r"[*_`~\[<]")
+
+
+@register_reader("md", "markdown")
+def iter_paragraphs_from_markdown(source):
+    """제목·목록·인용 기호와 강조·링크 표시를 떼어 낸 본문 줄. 코드 블록 울타리와 구분선은 빈 줄로 바꿉니다."""
+    with _open_buffer(source) as buffer:
+        for line in _iter_text_lines(buffer):
+            if _MD_FENCE.match(line) or _MD_RULE.match(line):
+                yield ""
+                continue
+            # 대부분의 줄은 표시 기호가 없으므로 정규식은 필요한 줄에만 적용
+            first = line.lstrip()[:1]
+            if first == "#":
+                line = _MD_CLOSING_HASHES.sub("", line)
+            if first in _MD_BLOCK_STARTS:
+                line = _MD_BLOCK_PREFIX.sub("", line, count=1)
+            if _MD_INLINE_MARK.search(line):
+                line = _MD_IMAGE.sub(r"\1", line)
+                line = _MD_LINK.sub(r"\1", line)
+                line = _MD_EMPHASIS.sub(r"\2", line)
+                line = _MD_UNDERSCORE_EMPHASIS.sub(r"\2", line)
+                line = _MD_HTML_TAG.sub("", line)
+            yield line.rstrip()
+
+
+_SRT_INDEX = re.compile(r"^\d+$")
+_SRT_TIMING = re.compile(r"^\d{1,2}:\d{2}:\d{2}[,.]\d{1,3}\s*-->")
+_SRT_TAG = re.compile(r"<[^>]*>|\{\\[^}]*\}")  # <i>, <font ...>, {\an8} 같은 서식 표시
+
+
+@register_reader("srt")
+def iter_paragraphs_from_srt(source):
+    """자막 한 구간(cue)이 문단 하나. 번호·시간 줄과 서식 태그는 버리고 구간 안의 줄은 공백으로 잇습니다."""
+    with _open_buffer(source) as buffer:
+        cue_lines = []
+        in_text = False  # 시간 줄 다음부터 빈 줄 전까지가 자막 본문
+        for line in _iter_text_lines(buffer):
+            line = line.strip()
+            if not line:
+                if cue_lines:
+                    yield " ".join(cue_lines)
+                    cue_lines = []
+                in_text = False
+                continue
+            if not in_text:
+                in_text = bool(_SRT_TIMING.match(line))
+                if in_text or _SRT_INDEX.match(line):
+                    continue
+                in_text = True  # 번호·시간 줄이 없는 구간은 본문으로 취급
+            text = _SRT_TAG.sub("", line).strip()
+            if text:
+                cue_lines.append(text)
+        if cue_lines:
+            yield " ".join(cue_lines)
+
+
+register_reader("docx")(iter_paragraphs_from_word)
+
+
+# 한글(HWP 5.0) 문서: OLE 복합 파일 안의 BodyText/Section* 스트림을 구역별로 읽어 본문 문단만 꺼냄
+_HWPTAG_PARA_TEXT = 0x10 + 51
+_HWP_SECTION = re.compile(r"^Section(\d+)$")
+_HWP_CHAR_TEXT = {9: "\t", 10: "\n", 24: "-", 30: " ", 31: " "}
+_HWP_SINGLE_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}  # 나머지 제어 문자는 8글자(16바이트) 차지
+
+
+@register_reader("hwp")
+def iter_paragraphs_from_hwp(source):
+    """본문 바로 아래 문단만 읽습니다 (표·글상자 안의 문단은 Word 읽기와 마찬가지로 제외)."""
+    try:
+        import olefile
+    except ImportError:
+        raise ValueError("HWP 파일을 읽으려면 olefile 패키지가 필요합니다. (pip install olefile)") from None
+
+    with olefile.OleFileIO(source) as ole:
+        header = ole.openstream("FileHeader").read()
+        properties = int.from_bytes(header[36:40], "little")
+        if properties & 0b110:
+            raise ValueError("암호가 걸렸거나 배포용으로 저장된 HWP 파일은 읽을 수 없습니다.")
+        sections = sorted(
+            (int(match.group(1)), entry)
+            for entry in ole.listdir()
+            if len(entry) == 2 and entry[0] == "BodyText" and (match := _HWP_SECTION.match(entry[1]))
+        )
+        for _, entry in sections:
+            data = ole.openstream(entry).read()
+            if properties & 1:
+                data = zlib.decompress(data, -15)
+            yield from _iter_hwp_section_paragraphs(data)
+
+
+# 레코드 헤더(4바이트): 태그 10비트, 수준 10비트, 크기 12비트 (크기가 0xFFF면 뒤의 4바이트가 실제 크기)
+def _iter_hwp_section_paragraphs(data):
+    position = 0
+    while position + 4 <= len(data):
+        header = int.from_bytes(data[position:position + 4], "little")
+        tag, level, size = header & 0x3FF, (header >> 10) & 0x3FF, header >> 20
+        position += 4
+        if size == 0xFFF:
+            size = int.from_bytes(data[position:position + 4], "little")
+            position += 4
+        if tag == _HWPTAG_PARA_TEXT and level == 1:
+            yield _hwp_para_text(data[position:position + size])
+        position += size
+
+
+def _hwp_para_text(record):
+    text = record.decode("utf-16-le", errors="replace")
+    parts = []
+    i = 0
+    while i < len(text):
+        code = ord(text[i])
+        if code >= 32:
+            parts.append(text[i])
+            i += 1
+            continue
+        parts.append(_HWP_CHAR_TEXT.get(code, ""))
+        i += 1 if code in _HWP_SINGLE_CONTROLS else 8
+    return "".join(parts)
+
+
+# 한글 개방형 문서(HWPX): ZIP 안의 Contents/section*.xml을 차례로 스트리밍 파싱
+_HWPX_SECTION = re.compile(r"^Contents/section(\d+)\.xml$")
+_HWPX_RUN_TEXT = {"tab": "\t", "lineBreak": "\n"}
+
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+@register_reader("hwpx")
+def iter_paragraphs_from_hwpx(source):
+    with zipfile.ZipFile(source) as package:
+        sections = sorted(
+            (int(match.group(1)), name) for name in package.namelist() if (match := _HWPX_SECTION.match(name))
+        )
+        for _, name in sections:
+            with package.open(name) as section_xml:
+                yield from _iter_hwpx_section_paragraphs(section_xml)
+
+
+def _iter_hwpx_section_paragraphs(section_xml):
+    root = None
+    depth = 0
+    for event, elem in ElementTree.iterparse(section_xml, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                root = elem
+            continue
+        depth -= 1
+        if depth == 1:
+            # 구역 바로 아래 문단만 처리하고 즉시 버려서 메모리를 일정하게 유지
+            if _local_name(elem.tag) == "p":
+                yield _hwpx_paragraph_text(elem)
+            root.clear()
+
+
+def _hwpx_paragraph_text(p):
+    parts = []
+    for run in p:
+        if _local_name(run.tag) != "run":
+            continue
+        for t in run:
+            if _local_name(t.tag) != "t":
+                continue
+            parts.append(t.text or "")
+            for child in t:
+                parts.append(_HWPX_RUN_TEXT.get(_local_name(child.tag), ""))
+                parts.append(child.tail or "")
+    return "".join(parts)
@@ -0,0 +1,61 @@
+# KSS 문장 분할 (문단 단위 LRU 메모 + 한 번의 배치 호출)
+#
+# kss는 torch 등 무거운 모듈을 끌어오므로 첫 분할 시점에 import합니다.
+
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 20_000
+WARM_UP_TEXT = "미리 한 번 분할해 둡니다. 첫 대본이 기다리지 않도록요."
+
+
+# kss import와 형태소 분석기 사전 로딩을 미리 끝내 둠 (첫 분할 요청의 지연을 줄임, 메모에는 남기지 않음)
+def warm_up():
+    import kss
+
+    kss.split_sentences(WARM_UP_TEXT)
+
+
+class SentenceSplitter:
+    """문단별 kss 분할 결과를 기억해, 바뀐 문단만 한 번의 kss 호출로 분할합니다."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._memo = OrderedDict()  # 문단 텍스트 → 문장 목록 (앞쪽이 가장 오래 쓰지 않은 항목)
+        self._lock = threading.Lock()
+
+    def split(self, paragraphs):
+        """문단 목록을 받아 문단별 문장 목록의 목록을 반환합니다."""
+        with self._lock:
+            found = {}
+            for paragraph in paragraphs:
+                if paragraph in self._memo and paragraph not in found:
+                    found[paragraph] = self._memo[paragraph]
+                    self._memo.move_to_end(paragraph)
+        missing = [paragraph for paragraph in dict.fromkeys(paragraphs) if paragraph not in found]
+        missing_set = set(missing)
+
+        if missing:
+            import kss
+
+            # 리스트로 넘기면 kss가 가능한 경우 여러 프로세스로 나눠 처리함
+            # (문단이 하나면 리스트를 넣어도 평평한 문장 목록을 돌려주므로 따로 처리)
+            if len(missing) == 1:
+                results = [kss.split_sentences(missing[0])]
+            else:
+                results = kss.split_sentences(missing)
+            found.update(zip(missing, results))
+
+            with self._lock:
+                for paragraph, sentences in zip(missing, results):
+                    self._memo[paragraph] = sentences
+                    self._memo.move_to_end(paragraph)
+                while len(self._memo) > self.maxsize:
+                    self._memo.popitem(last=False)
+
+        with self._lock:
+            self.hits += sum(1 for paragraph in paragraphs if paragraph not in missing_set)
+            self.misses += len(missing)
+        return [list(found[paragraph]) for paragraph in paragraphs]
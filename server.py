@@ -0,0 +1,344 @@
+# Paydo AI PPT 렌더링 HTTP 서비스 (Streamlit 없이 app_ai.py와 같은 파이프라인)
+#
+# 문장 인코더는 프로세스에서 한 번만 불러 둔 채로 쓰고, 동시에 도는 작업들의 인코딩 요청은
+# MicroBatcher가 짧은 대기 시간 동안 모아 한 번의 모델 호출로 처리합니다.
+#
+#   POST /render?filename=대본.docx&max_lines=4&max_chars=18&font_size=54&similarity_threshold=0.85&sections=0
+#        본문: 대본 파일 바이트 (reader=text면 UTF-8 텍스트, 문단은 빈 줄로 구분) → 응답: .pptx
+#   GET  /health  모델 준비 여부
+#   GET  /stats   작업 수, 마이크로 배치 효율, 캐시 적중, 단계별 p50/p95 (PAYDO_METRICS=1일 때)
+#
+# 사용 예:
+#   python server.py --port 8600 --jobs 4 --batch-wait-ms 10
+#   curl -s --data-binary @대본.docx "http://127.0.0.1:8600/render?filename=대본.docx" -o 대본.pptx
+#   python loadgen.py --concurrency 8 --requests 64
+
+import argparse
+import gc
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+import ai_core
+import instrumentation
+from ai_core import create_ppt
+from deck_cache import DeckCache, code_version, deck_key
+from embedding_cache import DEFAULT_CACHE_DIR, EmbeddingCache
+from encoders import BACKENDS, DEFAULT_BACKEND, encoder_name, load_encoder, stub_encode
+from instrumentation import timed
+from microbatch import DEFAULT_MAX_BATCH, DEFAULT_MAX_WAIT, MicroBatcher
+from readers import READERS, iter_paragraphs, reader_name
+from sentence_split import SentenceSplitter, warm_up as warm_up_sentence_split
+
+DEFAULT_PORT = 8600
+DEFAULT_MAX_JOBS = int(os.environ.get("PAYDO_JOB_WORKERS", "4"))  # 동시에 분할·렌더링하는 작업 수
+DEFAULT_MAX_WAITING = 64  # 자리가 나기를 기다리는 요청 수 상한 (넘으면 503)
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+# 임베딩·결과 캐시는 app_ai.py와 폴더를 나눠 씀 (두 프로세스가 같은 캐시 슬롯을 서로 덮어쓰지 않도록)
+SERVER_CACHE_DIR = os.environ.get("PAYDO_SERVER_CACHE_DIR", os.path.join(DEFAULT_CACHE_DIR, "server"))
+PPTX_MIME = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+# app_ai.py와 같은 파일 목록 (출력에 영향을 주는 코드가 같음)
+CODE_VERSION = code_version("ai_core.py", "ppt_core.py", "readers.py", "text_width.py", "sentence_split.py", "topics.py", "encoders.py")
+
+# 쿼리 문자열 설정 → (변환 함수, 기본값). 기본값은 app_ai.py 화면의 기본값과 같음
+SETTINGS = {
+    "max_lines": (int, 4),
+    "max_chars": (int, 18),
+    "font_size": (int, 54),
+    "similarity_threshold": (float, 0.85),
+    "sections": (lambda value: value.lower() in ("1", "true", "yes", "on"), False),
+}
+
+logger = logging.getLogger("paydo.server")
+
+
+class RequestError(Exception):
+    """클라이언트 요청이 잘못된 경우 (HTTP 상태 코드와 함께)."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# 쿼리 문자열에서 입력 형식과 app_ai.py와 같은 모양의 설정 dict를 만듦
+def parse_settings(query, model_name):
+    params = {name: values[-1] for name, values in parse_qs(query).items()}
+    source = params.get("reader", "auto")
+    if source == "auto":
+        source = reader_name(params.get("filename", "")) or "text"
+    if source != "text" and source not in READERS:
+        raise RequestError(400, f"알 수 없는 형식입니다: {source} (text, {', '.join(READERS)})")
+    settings = {"source": source, "model": model_name}
+    for name, (convert, default) in SETTINGS.items():
+        try:
+            settings[name] = convert(params[name]) if name in params else default
+        except ValueError:
+            raise RequestError(400, f"{name} 값이 올바르지 않습니다: {params[name]}") from None
+    if not (1 <= settings["max_lines"] <= 10 and 10 <= settings["max_chars"] <= 100 and 10 <= settings["font_size"] <= 60):
+        raise RequestError(400, "max_lines는 1~10, max_chars는 10~100, font_size는 10~60이어야 합니다.")
+    return settings
+
+
+class RenderService:
+    """인코더·문장 분할기·캐시를 프로세스에서 하나씩 들고, 요청마다 대본을 PPT로 만듭니다."""
+
+    def __init__(self, backend=DEFAULT_BACKEND, max_jobs=DEFAULT_MAX_JOBS, max_waiting=DEFAULT_MAX_WAITING,
+                 max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT, cache_dir=SERVER_CACHE_DIR):
+        self.backend = backend
+        self.max_jobs = max_jobs
+        self.max_waiting = max_waiting
+        self.model_name = encoder_name(backend) if backend in BACKENDS else backend
+        self.sentence_splitter = SentenceSplitter()
+        self.embedding_cache = EmbeddingCache(self.model_name, cache_dir)
+        self.deck_cache = DeckCache(cache_dir)
+        self.batcher = MicroBatcher(self._encode_batch, max_batch, max_wait)
+        self.model = None
+        self.load_error = None
+        self.ready = threading.Event()
+        self.load_seconds = None
+        self.completed = 0
+        self.failed = 0
+        self._slots = threading.BoundedSemaphore(max_jobs)
+        self._lock = threading.Lock()
+        self._running = 0
+        self._waiting = 0
+
+    def warm_up(self):
+        """KSS와 모델을 미리 불러와, 첫 요청이 모델 로딩을 기다리지 않게 합니다."""
+        start = time.perf_counter()
+        try:
+            warm_up_sentence_split()
+            if self.backend == "stub":
+                # 모델 없이 서비스 배관(분할·배치·렌더링)만 측정할 때 쓰는 결정적 임베딩
+                self.model = stub_encode
+            else:
+                self.model = load_encoder(self.backend)
+            self.load_seconds = time.perf_counter() - start
+        except Exception as e:
+            logger.exception("모델을 불러오지 못했습니다")
+            self.load_error = e
+        finally:
+            self.ready.set()  # 실패해도 기다리는 요청이 오류를 받도록
+
+    # 마이크로 배치 하나를 인코딩 (전용 스레드에서만 호출)
+    def _encode_batch(self, sentences):
+        if self.backend == "stub":
+            return self.model(sentences)
+        return self.model.encode(sentences, batch_size=64, convert_to_numpy=True, normalize_embeddings=True)
+
+    # 캐시에 없는 문장만 마이크로 배처로 보냄
+    def _embed(self, sentences):
+        return self.embedding_cache.encode(sentences, self.batcher.encode)
+
+    def _paragraphs(self, input_bytes, source):
+        try:
+            if source == "text":
+                paragraphs = [p.strip() for p in input_bytes.decode("utf-8").split("\n\n") if p.strip()]
+            else:
+                with timed("extract", reader=source):
+                    paragraphs = [p for p in iter_paragraphs(BytesIO(input_bytes), reader=source) if p.strip()]
+        except Exception as e:
+            raise RequestError(400, f"파일 처리 오류: {e}") from e
+        if not paragraphs:
+            raise RequestError(400, "유효한 텍스트가 없습니다.")
+        return paragraphs
+
+    def render(self, input_bytes, settings):
+        """(pptx 바이트, 메타데이터 dict, 결과 캐시 적중 여부)를 반환합니다."""
+        cache_key = deck_key(input_bytes, settings, CODE_VERSION)
+        cached = self.deck_cache.get(cache_key)
+        if cached is not None:
+            return cached + (True,)
+
+        with self._lock:
+            if self._waiting >= self.max_waiting:
+                raise RequestError(503, "대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요.")
+            self._waiting += 1
+        try:
+            self._slots.acquire()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        with self._lock:
+            self._running += 1
+        try:
+            data, meta = self._generate(input_bytes, settings, cache_key)
+            with self._lock:
+                self.completed += 1
+            return data, meta, False
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+            self._slots.release()
+
+    # app_ai.generate_deck과 같은 순서: 의미 단위 분할 → 렌더링 → 저장
+    def _generate(self, input_bytes, settings, cache_key):
+        paragraphs = self._paragraphs(input_bytes, settings["source"])
+        if settings["similarity_threshold"] > 0 or settings["sections"]:
+            self.ready.wait()
+            if self.load_error is not None:
+                raise RuntimeError(f"모델을 불러오지 못했습니다: {self.load_error}")
+        cache_stats = {}
+        slides = ai_core.split_text_into_slides_with_similarity(
+            paragraphs, settings["max_lines"], settings["max_chars"], settings["similarity_threshold"], cache_stats,
+            sentence_splitter=self.sentence_splitter, embed=self._embed, sections=settings["sections"],
+        )
+        ppt = create_ppt(slides, settings["font_size"])
+        if ppt is None:
+            raise RuntimeError("슬라이드 생성 실패")
+        ppt_io = io.BytesIO()
+        with timed("save", slides=len(slides)):
+            ppt.save(ppt_io)
+        # python-pptx 객체 그래프는 서로 참조하고 있어 참조가 사라져도 바로 풀리지 않으므로 저장 직후 회수
+        del ppt
+        gc.collect()
+        meta = {
+            "slide_count": len(slides),
+            "flagged": [i + 1 for i, slide in enumerate(slides) if slide.needs_check],
+            "sections": sum(slide.is_title for slide in slides),
+        }
+        pptx_bytes = ppt_io.getvalue()  # getvalue()는 부를 때마다 버퍼 전체를 복사
+        self.deck_cache.put(cache_key, pptx_bytes, meta)
+        return pptx_bytes, meta
+
+    def stats(self):
+        with self._lock:
+            jobs = {
+                "running": self._running, "waiting": self._waiting, "max_jobs": self.max_jobs,
+                "completed": self.completed, "failed": self.failed,
+            }
+        return {
+            "encoder": self.model_name,
+            "ready": self.ready.is_set(),
+            "load_seconds": self.load_seconds,
+            "jobs": jobs,
+            "batcher": self.batcher.stats(),
+            "deck_cache": {"hits": self.deck_cache.hits, "misses": self.deck_cache.misses},
+            "embedding_cache": {"size": len(self.embedding_cache)},
+            "stages": instrumentation.summary() if instrumentation.is_enabled() else {},
+        }
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    service = None  # make_server()가 지정
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            if not self.service.ready.is_set():
+                self._send_json(503, {"status": "loading"})
+            elif self.service.load_error is not None:
+                self._send_json(503, {"status": "error", "error": str(self.service.load_error)})
+            else:
+                self._send_json(200, {"status": "ok"})
+        elif path == "/stats":
+            self._send_json(200, self.service.stats())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            self._send_json(404, {"error": "not found"})
+            return
+        start = time.perf_counter()
+        try:
+            settings = parse_settings(url.query, self.service.model_name)
+            length = int(self.headers.get("Content-Length") or 0)
+            if length <= 0:
+                raise RequestError(400, "대본 파일을 본문으로 보내세요.")
+            if length > MAX_UPLOAD_BYTES:
+                raise RequestError(413, f"대본 파일은 {MAX_UPLOAD_BYTES // (1024 * 1024)}MB 이하여야 합니다.")
+            data, meta, cached = self.service.render(self.rfile.read(length), settings)
+        except RequestError as e:
+            self._send_json(e.status, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.exception("렌더링 실패: %s", self.path)
+            self._send_json(500, {"error": f"PPT 생성에 실패했습니다. ({e})"})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", PPTX_MIME)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Disposition", 'attachment; filename="paydo_script_ai.pptx"')
+        self.send_header("X-Paydo-Slides", str(meta["slide_count"]))
+        self.send_header("X-Paydo-Flagged", ",".join(map(str, meta["flagged"])))
+        self.send_header("X-Paydo-Cache", "hit" if cached else "miss")
+        self.send_header("X-Paydo-Seconds", f"{time.perf_counter() - start:.3f}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.info("%s %s", self.address_string(), format % args)
+
+
+def make_server(service, host="127.0.0.1", port=DEFAULT_PORT):
+    handler = type("Handler", (RenderHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대본 파일을 받아 PPT를 돌려주는 HTTP 서비스 (app_ai.py와 같은 파이프라인)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--backend", choices=[*BACKENDS, "stub"], default=DEFAULT_BACKEND,
+        help="문장 인코더 (stub: 모델 없이 해시 임베딩, 서비스 자체의 부하 측정용)",
+    )
+    parser.add_argument("--jobs", type=int, default=DEFAULT_MAX_JOBS, help="동시에 처리하는 작업 수")
+    parser.add_argument("--max-waiting", type=int, default=DEFAULT_MAX_WAITING, help="대기 요청 수 상한 (넘으면 503)")
+    parser.add_argument("--batch-sentences", type=int, default=DEFAULT_MAX_BATCH, help="마이크로 배치 하나의 최대 문장 수")
+    parser.add_argument(
+        "--batch-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000,
+        help="첫 인코딩 요청 뒤 다른 작업의 요청을 기다리는 최대 시간 (0이면 이미 도착한 요청만 묶음)",
+    )
+    parser.add_argument(
+        "--cache-dir", default=SERVER_CACHE_DIR, help="임베딩·결과 캐시 폴더 (app_ai.py의 캐시 폴더와 따로 둠)"
+    )
+    parser.add_argument("--metrics", action="store_true", help="단계별 소요 시간 로그와 /stats 집계 켜기")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    if args.metrics:
+        instrumentation.set_enabled(True)
+
+    service = RenderService(
+        args.backend, args.jobs, args.max_waiting, args.batch_sentences, args.batch_wait_ms / 1000, args.cache_dir
+    )
+    server = make_server(service, args.host, args.port)
+    # 모델은 백그라운드에서 불러오고, 그동안 /health는 503 (모델이 필요 없는 요청은 바로 처리)
+    threading.Thread(target=service.warm_up, name="model-warm-up", daemon=True).start()
+    logger.info("http://%s:%d 에서 대기 중 (인코더 %s, 동시 작업 %d)", args.host, args.port, service.model_name, args.jobs)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
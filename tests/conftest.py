@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+# 저장소 루트의 모듈(ppt_core, deck_writer 등)을 그대로 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_width  # noqa: E402
+
+
+def _clear_width_caches():
+    text_width.width_table.cache_clear()
+    text_width.text_width.cache_clear()
+    text_width.wrap_text.cache_clear()
+
+
+@pytest.fixture
+def estimated_widths(monkeypatch):
+    """설치된 글꼴과 무관하게 추정 너비 표로 줄바꿈합니다 (회귀 코퍼스를 만들 때와 같은 조건)."""
+    monkeypatch.setattr(text_width, "_read_font_widths", lambda font_name: {})
+    _clear_width_caches()
+    yield
+    monkeypatch.undo()
+    _clear_width_caches()
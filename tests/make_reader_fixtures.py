@@ -0,0 +1,94 @@
+# readers.py 테스트용 작은 예제 파일(tests/data/readers/) 생성기
+#
+# 텍스트 형식은 손으로 읽을 수 있게 그대로 두고, 바이너리 형식만 여기서 만듭니다.
+#   script.hwpx       구역 두 개(section10이 section2보다 뒤), 표 안 문단, 탭·줄바꿈
+#   section.hwprec    HWP 5.0 BodyText/Section 스트림(압축 전) 레코드: 제어 문자, 표 안 문단, 확장 크기 레코드
+#   script_cp949.txt / script_utf16.txt  BOM 없는 CP949, BOM 있는 UTF-16 (script.txt와 같은 내용)
+#
+# 다시 생성:
+#   python tests/make_reader_fixtures.py
+
+import os
+import zipfile
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "readers")
+
+HP = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+HS = "http://www.hancom.co.kr/hwpml/2011/section"
+
+_HWPTAG_PARA_HEADER = 0x10 + 50
+_HWPTAG_PARA_TEXT = 0x10 + 51
+
+
+def _hwpx_section(paragraphs):
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><hs:sec xmlns:hs="{HS}" xmlns:hp="{HP}">'
+        + "".join(paragraphs)
+        + "</hs:sec>"
+    )
+
+
+def make_hwpx(path):
+    section0 = _hwpx_section([
+        '<hp:p><hp:run><hp:t>첫 문단입니다.</hp:t></hp:run></hp:p>',
+        '<hp:p><hp:run><hp:t>앞<hp:tab/>뒤</hp:t></hp:run><hp:run><hp:t>이어서<hp:lineBreak/>다음 줄</hp:t></hp:run></hp:p>',
+        # 표 안의 문단은 구역 바로 아래가 아니므로 제외
+        '<hp:p><hp:run><hp:tbl><hp:tr><hp:tc><hp:subList><hp:p><hp:run><hp:t>표 안</hp:t></hp:run></hp:p>'
+        '</hp:subList></hp:tc></hp:tr></hp:tbl><hp:t>표 뒤</hp:t></hp:run></hp:p>',
+        '<hp:p><hp:run/></hp:p>',
+    ])
+    section2 = _hwpx_section(['<hp:p><hp:run><hp:t>둘째 구역</hp:t></hp:run></hp:p>'])
+    section10 = _hwpx_section(['<hp:p><hp:run><hp:t>열째 구역</hp:t></hp:run></hp:p>'])
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("mimetype", "application/hwp+zip")
+        package.writestr("Contents/section10.xml", section10)
+        package.writestr("Contents/section0.xml", section0)
+        package.writestr("Contents/section2.xml", section2)
+        package.writestr("Contents/header.xml", "<hh:head xmlns:hh='urn:x'/>")
+
+
+def _record(tag, level, payload):
+    size = len(payload)
+    if size >= 0xFFF:
+        return (tag | level << 10 | 0xFFF << 20).to_bytes(4, "little") + size.to_bytes(4, "little") + payload
+    return (tag | level << 10 | size << 20).to_bytes(4, "little") + payload
+
+
+def _para(text, level=0):
+    return _record(_HWPTAG_PARA_HEADER, level, bytes(22)) + _record(_HWPTAG_PARA_TEXT, level + 1, text.encode("utf-16-le"))
+
+
+def make_hwp_section(path):
+    tab = "\t" + "\x00" * 6 + "\t"  # 탭은 인라인 제어 문자: 8글자(16바이트)
+    table_control = "\x0b" + "tbl " + "\x00" * 2 + "\x0b"  # 확장 제어 문자도 8글자
+    data = b"".join([
+        _para("첫 문단입니다.\r"),
+        _para("앞" + tab + "뒤\n다음 줄\x18하이픈\x1e묶음 빈칸\r"),
+        _para(table_control + "표 뒤\r"),
+        _para("표 안\r", level=2),  # 표 안 문단(수준이 더 깊음)은 제외
+        _para("\r"),
+        _para("긴 문단 " + "가" * 3000 + "\r"),  # 크기가 0xFFF바이트 이상이면 확장 크기 헤더
+    ])
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def make_encoded_texts():
+    with open(os.path.join(DATA_DIR, "script.txt"), encoding="utf-8") as f:
+        text = f.read()
+    with open(os.path.join(DATA_DIR, "script_cp949.txt"), "wb") as f:
+        f.write(text.encode("cp949"))
+    with open(os.path.join(DATA_DIR, "script_utf16.txt"), "wb") as f:
+        f.write(text.encode("utf-16"))
+
+
+def main():
+    os.makedirs(DATA_DIR, exist_ok=True)
+    make_hwpx(os.path.join(DATA_DIR, "script.hwpx"))
+    make_hwp_section(os.path.join(DATA_DIR, "section.hwprec"))
+    make_encoded_texts()
+    print(f"{DATA_DIR}: {', '.join(sorted(os.listdir(DATA_DIR)))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# split_and_group_text 회귀 코퍼스(tests/data/split_corpus.json) 생성기
+#
+# 기준 결과는 baseline 커밋(cf9453d) app.py의 split_and_group_text를 그대로 옮긴 아래 baseline_split로 만듭니다.
+# 줄 수 계산만 user-009 이후의 표시 너비 기준(text_width.count_lines, 글꼴 파일 없이 추정한 너비 표)으로 바꿨고,
+# 빈 슬라이드를 거른 뒤 분할 여부 목록을 뒤에서 잘라 내는 바람에 분할 여부가 한 칸씩 밀리는 동작도 그대로 둡니다.
+#
+# 분할 로직을 일부러 바꾼 경우에만 다시 생성하세요:
+#   python tests/make_split_corpus.py
+
+import json
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_width  # noqa: E402
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "split_corpus.json")
+SETTINGS = [(4, 18), (3, 12), (2, 10), (5, 25), (1, 18)]  # (max_lines, max_chars)
+
+KOREAN_WORDS = [
+    "오늘은", "여러분께", "새로운", "제품을", "소개해", "드리겠습니다", "카메라를", "보면서", "천천히",
+    "말씀해", "주세요", "이번", "장면에서는", "주요", "기능을", "설명합니다", "그리고", "마지막으로",
+    "구독과", "좋아요", "부탁드립니다", "정말", "놀라운", "결과였습니다",
+]
+ENGLISH_WORDS = ["Hello", "world", "this", "is", "a", "quick", "demo", "of", "the", "new", "API", "v2.0", "OK"]
+ENDINGS = [".", "?", "!", ";", ""]
+
+
+def estimated_width_table():
+    """글꼴 파일이 있어도 쓰지 않고, 유니코드 속성으로 추정한 너비 표만 쓰도록 고정합니다 (환경과 무관한 결과)."""
+    text_width._read_font_widths = lambda font_name: {}
+    text_width.width_table.cache_clear()
+    text_width.text_width.cache_clear()
+    text_width.wrap_text.cache_clear()
+
+
+def calculate_text_lines(text, max_chars_per_line):
+    return text_width.count_lines(text, max_chars_per_line)
+
+
+# baseline(cf9453d) app.py의 split_and_group_text (줄 수 계산 함수만 위의 것으로 바뀜)
+def baseline_split(text, max_lines_per_slide, max_chars_per_line_ppt):
+    slides = []
+    split_flags = []
+    lines = text.strip().split('\n')
+
+    for line in lines:
+        line = line.strip()
+
+        if not slides:
+            slides.append(line)
+            split_flags.append(False)
+        elif calculate_text_lines(slides[-1] + "\n" + line, max_chars_per_line_ppt) <= max_lines_per_slide:
+            slides[-1] += "\n" + line
+            split_flags[-1] = False
+        else:
+            slides.append(line)
+            split_flags.append(False)
+
+    final_slides = []
+    final_split_flags = []
+    max_chars_per_segment = 60
+
+    for i, slide_text in enumerate(slides):
+        if calculate_text_lines(slide_text, max_chars_per_line_ppt) > max_lines_per_slide:
+            original_sentence = slide_text.replace('\n', ' ')
+            sub_sentences = re.split(r'(?<=[.?!;])\s+', original_sentence.strip())
+            temp_slide_text = ""
+            temp_slide_lines = 0
+            is_forced_split = False
+            for sub_sentence in sub_sentences:
+                sub_sentence = sub_sentence.strip()
+                sub_sentence_lines = calculate_text_lines(sub_sentence, max_chars_per_line_ppt)
+                if temp_slide_lines + sub_sentence_lines <= max_lines_per_slide:
+                    if temp_slide_text:
+                        temp_slide_text += " "
+                    temp_slide_text += sub_sentence
+                    temp_slide_lines += sub_sentence_lines
+                else:
+                    final_slides.append(temp_slide_text)
+                    final_split_flags.append(is_forced_split)
+                    temp_slide_text = sub_sentence
+                    temp_slide_lines = sub_sentence_lines
+                    is_forced_split = False
+
+            if temp_slide_text:
+                if calculate_text_lines(temp_slide_text, max_chars_per_line_ppt) > max_lines_per_slide:
+                    words = temp_slide_text.split()
+                    segment = ""
+                    for word in words:
+                        if len(segment.replace(" ", "")) + len(word) + (1 if segment else 0) <= max_chars_per_segment:
+                            if segment:
+                                segment += " "
+                            segment += word
+                        else:
+                            final_slides.append(segment)
+                            final_split_flags.append(True)
+                            segment = word
+                            is_forced_split = True
+                    if segment:
+                        final_slides.append(segment)
+                        final_split_flags.append(True)
+                else:
+                    final_slides.append(temp_slide_text)
+                    final_split_flags.append(False)
+        else:
+            final_slides.append(slide_text)
+            final_split_flags.append(False)
+
+    final_slides = [slide for slide in final_slides if slide.strip()]
+    final_split_flags = final_split_flags[:len(final_slides)]
+
+    return final_slides, final_split_flags
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(words) for _ in range(rng.randint(1, 12))) + rng.choice(ENDINGS)
+
+
+def _line(rng):
+    kind = rng.random()
+    if kind < 0.08:
+        return ""  # 문단 사이 빈 줄
+    if kind < 0.15:
+        return "  " + _sentence(rng, KOREAN_WORDS) + "  "  # 앞뒤 공백
+    if kind < 0.25:
+        return "".join(rng.choice(KOREAN_WORDS) for _ in range(rng.randint(4, 15)))  # 띄어쓰기 없는 긴 단어
+    if kind < 0.35:
+        return " ".join(_sentence(rng, ENGLISH_WORDS) for _ in range(rng.randint(1, 4)))
+    if kind < 0.45:
+        # 문장 부호 없이 긴 문단 (단어 묶음 강제 분할 경로)
+        return " ".join(rng.choice(KOREAN_WORDS + ENGLISH_WORDS) for _ in range(rng.randint(20, 60)))
+    return " ".join(_sentence(rng, KOREAN_WORDS) for _ in range(rng.randint(1, 6)))
+
+
+def make_inputs(count=40, seed=2024):
+    rng = random.Random(seed)
+    inputs = []
+    for i in range(count):
+        lines = [_line(rng) for _ in range(rng.randint(1, 15))]
+        if i % 7 == 0:
+            lines = [""] * rng.randint(1, 3) + lines + [""] * rng.randint(1, 3)  # 앞뒤 빈 줄
+        max_lines, max_chars = SETTINGS[i % len(SETTINGS)]
+        inputs.append({"text": "\n".join(lines), "max_lines": max_lines, "max_chars": max_chars})
+    return inputs
+
+
+def main():
+    estimated_width_table()
+    cases = []
+    for case in make_inputs():
+        slides, flags = baseline_split(case["text"], case["max_lines"], case["max_chars"])
+        case["slides"] = [text_width.wrap_paragraphs(slide, case["max_chars"]) for slide in slides]
+        case["needs_check"] = flags
+        cases.append(case)
+    os.makedirs(os.path.dirname(CORPUS_PATH), exist_ok=True)
+    # 한 줄에 한 케이스 (다시 생성했을 때 diff를 케이스 단위로 보기 쉽게)
+    with open(CORPUS_PATH, "w", encoding="utf-8") as f:
+        f.write("[\n" + ",\n".join(json.dumps(case, ensure_ascii=False) for case in cases) + "\n]\n")
+    print(f"{CORPUS_PATH}: {len(cases)}개, 슬라이드 {sum(len(case['slides']) for case in cases)}장")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# ArtifactStore: TTL이 지난 파일 정리와 용량 상한에 따른 LRU 정리
+
+import os
+import time
+
+import pytest
+
+from artifacts import ArtifactStore
+
+
+def _write(store, size):
+    return store.write(lambda f: f.write(b"x" * size))
+
+
+def _age(store, artifact_id, seconds):
+    stamp = time.time() - seconds
+    os.utime(store.path(artifact_id), (stamp, stamp))
+
+
+def test_ttl_expiry(tmp_path):
+    store = ArtifactStore(str(tmp_path), ttl=60, max_bytes=10_000)
+    old = _write(store, 10)
+    fresh = _write(store, 10)
+    _age(store, old, 120)
+    store.sweep()
+    assert not store.exists(old)
+    assert store.exists(fresh)
+    assert store.stats() == {"count": 1, "bytes": 10, "expired": 1, "evicted": 0}
+    with pytest.raises(FileNotFoundError):
+        store.open(old)
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path):
+    store = ArtifactStore(str(tmp_path), ttl=3600, max_bytes=250)
+    first = _write(store, 100)
+    second = _write(store, 100)
+    _age(store, first, 20)
+    _age(store, second, 10)
+    store.open(first).close()  # 열면 최근 사용으로 기록되어 second가 더 오래된 파일이 됨
+    third = _write(store, 100)
+    assert store.exists(first) and store.exists(third)
+    assert not store.exists(second)
+    assert store.stats()["evicted"] == 1
+
+
+def test_new_artifact_is_kept_even_over_budget(tmp_path):
+    store = ArtifactStore(str(tmp_path), ttl=3600, max_bytes=50)
+    old = _write(store, 10)
+    big = _write(store, 100)
+    assert store.exists(big)
+    assert not store.exists(old)
+
+
+def test_failed_write_leaves_no_files(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+
+    def fail(f):
+        f.write(b"partial")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        store.write(fail)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,29 @@
+# batch.output_paths: 입력 파일 이름이 같아도 출력 PPT가 서로 덮어쓰지 않는지 확인
+
+import os
+
+import pytest
+
+from batch import output_paths
+
+
+def test_single_folder_stays_flat(tmp_path):
+    files = [str(tmp_path / "in" / "intro.docx"), str(tmp_path / "in" / "outro.txt")]
+    assert output_paths(files, "out") == {
+        files[0]: os.path.join("out", "intro.pptx"),
+        files[1]: os.path.join("out", "outro.pptx"),
+    }
+
+
+def test_same_name_in_different_folders_is_mirrored(tmp_path):
+    files = [str(tmp_path / "a" / "intro.docx"), str(tmp_path / "b" / "intro.txt")]
+    assert output_paths(files, "out") == {
+        files[0]: os.path.join("out", "a", "intro.pptx"),
+        files[1]: os.path.join("out", "b", "intro.pptx"),
+    }
+
+
+def test_same_stem_in_one_folder_fails(tmp_path):
+    files = [str(tmp_path / "a" / "intro.docx"), str(tmp_path / "a" / "intro.txt")]
+    with pytest.raises(ValueError, match="intro.pptx"):
+        output_paths(files, "out")
@@ -0,0 +1,60 @@
+# DeckCache: 입력·설정·코드 버전이 바뀌면 키가 바뀌는지, 저장·조회와 크기 상한에 따른 LRU 삭제
+
+import os
+
+import deck_cache
+from deck_cache import DeckCache, code_version, deck_key
+
+SETTINGS = {"max_lines": 4, "max_chars": 18, "font_size": 54, "mode": "shapes"}
+
+
+def test_key_changes_with_input_settings_and_version():
+    key = deck_key(b"script", SETTINGS, "v1")
+    assert key == deck_key(b"script", dict(reversed(list(SETTINGS.items()))), "v1")  # 설정 순서는 무관
+    assert key != deck_key(b"script!", SETTINGS, "v1")
+    assert key != deck_key(b"script", {**SETTINGS, "max_chars": 17}, "v1")
+    assert key != deck_key(b"script", {**SETTINGS, "extra": None}, "v1")
+    assert key != deck_key(b"script", SETTINGS, "v2")
+
+
+def test_code_version_follows_file_contents(tmp_path, monkeypatch):
+    monkeypatch.setattr(deck_cache, "_APP_DIR", str(tmp_path))
+    (tmp_path / "core.py").write_text("A = 1\n", encoding="utf-8")
+    (tmp_path / "template.pptx").write_bytes(b"template")
+    version = code_version("core.py", "template.pptx")
+    assert version == code_version("core.py", "template.pptx")
+    assert version != code_version("core.py")
+
+    (tmp_path / "core.py").write_text("A = 2\n", encoding="utf-8")
+    changed = code_version("core.py", "template.pptx")
+    assert changed != version
+    assert deck_key(b"script", SETTINGS, changed) != deck_key(b"script", SETTINGS, version)
+
+
+def test_put_get_and_stats(tmp_path):
+    cache = DeckCache(tmp_path)
+    key = deck_key(b"script", SETTINGS, "v1")
+    assert cache.get(key) is None
+    cache.put(key, b"deck bytes", {"slide_count": 3, "flagged": [2]})
+    assert cache.get(key) == (b"deck bytes", {"slide_count": 3, "flagged": [2]})
+    # 다른 인스턴스(다른 세션·작업자)도 같은 폴더의 결과를 씀
+    f, meta = DeckCache(tmp_path).open(key)
+    with f:
+        assert f.read() == b"deck bytes"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not [name for name in os.listdir(cache.directory) if name.endswith(".tmp")]
+
+
+def test_put_file_and_lru_eviction(tmp_path):
+    cache = DeckCache(tmp_path / "cache", max_bytes=250)
+    source = tmp_path / "deck.pptx"
+    source.write_bytes(b"x" * 100)
+    for i, key in enumerate(["a", "b"]):
+        cache.put_file(key, source, {"slide_count": i})
+        os.utime(os.path.join(cache.directory, f"{key}.pptx"), (1000 + i, 1000 + i))
+    cache.get("a")  # a를 최근에 씀 → b가 가장 오래됨
+    cache.put("c", b"y" * 100, {})
+    assert cache.get("b") is None
+    assert cache.get("a") == (b"x" * 100, {"slide_count": 0})
+    assert cache.get("c") == (b"y" * 100, {})
+    assert sorted(os.listdir(cache.directory)) == ["a.json", "a.pptx", "c.json", "c.pptx"]
@@ -0,0 +1,68 @@
+# deck_writer.write_deck이 create_ppt(...).save()와 같은 덱을 만드는지 확인
+
+import io
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from deck_writer import write_deck
+from ppt_core import create_ppt, split_and_group_text
+
+SCRIPT = "\n".join([
+    "안녕하세요, 오늘 촬영할 대본입니다.",
+    "이번 장면에서는 제품의 주요 기능을 천천히 설명해 주세요. 카메라를 보면서 자연스럽게 웃어 주시면 됩니다!",
+    "",
+    "Hello world, this is a quick demo of the new API v2.0.",
+    " ".join(["띄어쓰기없이아주길게이어지는단어"] * 6),  # 강제 분할 → '확인 필요!' 표시
+    "마지막 인사입니다.",
+])
+
+
+@pytest.fixture(scope="module")
+def slides():
+    return split_and_group_text(SCRIPT * 2, 2, 12)
+
+
+def _create_ppt_bytes(slides):
+    out = io.BytesIO()
+    create_ppt(slides).save(out)
+    return out.getvalue()
+
+
+def _write_deck_bytes(slides, **kwargs):
+    out = io.BytesIO()
+    write_deck(slides, out, **kwargs)
+    return out.getvalue()
+
+
+# 슬라이드마다 도형 글자 목록 (본문, 번호, '확인 필요!', '끝')
+def _slide_texts(data):
+    prs = Presentation(io.BytesIO(data))
+    return [[shape.text_frame.text for shape in slide.shapes if shape.has_text_frame] for slide in prs.slides]
+
+
+def _members(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return [(info.filename, zf.read(info)) for info in zf.infolist()]
+
+
+def test_serial_matches_create_ppt(slides):
+    assert any(slide.needs_check for slide in slides)
+    expected = _create_ppt_bytes(slides)
+    data = _write_deck_bytes(slides)
+    texts = _slide_texts(data)
+    assert texts == _slide_texts(expected)
+    # 본문 상자는 빈 첫 문단 뒤에 줄마다 문단 하나
+    assert [slide_texts[0].split("\n")[1:] for slide_texts in texts] == [list(slide.lines) for slide in slides]
+    assert ["확인 필요!" in slide_texts for slide_texts in texts] == [slide.needs_check for slide in slides]
+    # 항목 순서·이름·내용까지 같음 (항목 시각은 저장한 시각이라 2초 경계를 넘으면 다를 수 있음)
+    assert _members(data) == _members(expected)
+
+
+def test_parallel_matches_serial(slides):
+    # 작업 프로세스에서 만든 슬라이드 XML도 같아야 함
+    serial = _write_deck_bytes(slides)
+    parallel = _write_deck_bytes(slides, workers=2, chunk_size=3)
+    assert _members(parallel) == _members(serial)
+    assert _slide_texts(parallel) == _slide_texts(_create_ppt_bytes(slides))
@@ -0,0 +1,91 @@
+# EmbeddingCache: 적중/미스 통계, 재시작 뒤에도 유지되는 LRU 순서, 다른 프로세스가 쓴 항목 읽기
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from embedding_cache import EmbeddingCache, sentence_key
+from encoders import stub_encode
+
+MODEL = "stub-model"
+
+
+class CountingEncoder:
+    """stub_encode로 인코딩하면서 인코딩한 문장을 기록합니다."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, sentences):
+        self.calls.append(list(sentences))
+        return stub_encode(sentences, dim=8)
+
+
+def _cached(cache, sentences):
+    return [sentence_key(MODEL, sentence) in cache._slots for sentence in sentences]
+
+
+def _encode_in_process(cache_dir, sentences):
+    EmbeddingCache(MODEL, cache_dir, capacity=3).encode(sentences, CountingEncoder())
+
+
+@pytest.fixture
+def encoder():
+    return CountingEncoder()
+
+
+def test_hits_skip_encoding(tmp_path, encoder):
+    cache = EmbeddingCache(MODEL, tmp_path, capacity=10)
+    embeddings, stats = cache.encode(["가", "나", "가"], encoder)
+    assert encoder.calls == [["가", "나"]]
+    assert stats["hits"] == 0 and stats["misses"] == 3 and stats["encoded"] == 2
+    np.testing.assert_allclose(embeddings, stub_encode(["가", "나", "가"], dim=8), rtol=1e-6)
+
+    # 공백·유니코드 표기만 다른 문장도 적중
+    embeddings, stats = cache.encode(["가 ", "나"], encoder)
+    assert len(encoder.calls) == 1
+    assert stats["hits"] == 2 and stats["misses"] == 0
+    np.testing.assert_allclose(embeddings, stub_encode(["가", "나"], dim=8), rtol=1e-6)
+
+
+def test_eviction_order_survives_restart(tmp_path, encoder):
+    cache = EmbeddingCache(MODEL, tmp_path, capacity=3)
+    cache.encode(["a", "b", "c"], encoder)
+    cache.encode(["a"], encoder)  # 적중만 있는 호출: a가 가장 최근
+
+    restarted = EmbeddingCache(MODEL, tmp_path, capacity=3)
+    restarted.encode(["d"], encoder)  # 가장 오래 쓰지 않은 b를 밀어냄
+    assert _cached(EmbeddingCache(MODEL, tmp_path, capacity=3), ["a", "b", "c", "d"]) == [True, False, True, True]
+
+    restarted.encode(["c"], encoder)
+    restarted.encode(["e"], encoder)  # 이제 a가 가장 오래됨
+    assert _cached(EmbeddingCache(MODEL, tmp_path, capacity=3), ["a", "c", "d", "e"]) == [False, True, True, True]
+
+
+def test_instances_share_writes_and_recency(tmp_path, encoder):
+    first = EmbeddingCache(MODEL, tmp_path, capacity=3)
+    second = EmbeddingCache(MODEL, tmp_path, capacity=3)
+    first.encode(["a", "b", "c"], encoder)
+
+    _, stats = second.encode(["a"], encoder)  # first가 쓴 항목을 다시 읽어 적중
+    assert stats["hits"] == 1 and len(encoder.calls) == 1
+
+    first.encode(["d"], encoder)  # second의 a 적중이 반영되어 b가 밀려남
+    assert _cached(second, ["a", "b"]) == [True, True]  # second는 다음 호출 전까지 예전 표를 가짐
+    second.encode(["c"], encoder)
+    assert _cached(second, ["a", "b", "c", "d"]) == [True, False, True, True]
+
+
+def test_other_process_writes_are_picked_up(tmp_path, encoder):
+    cache = EmbeddingCache(MODEL, tmp_path, capacity=3)
+    cache.encode(["a"], encoder)
+
+    process = multiprocessing.get_context("spawn").Process(target=_encode_in_process, args=(str(tmp_path), ["b", "c"]))
+    process.start()
+    process.join(60)
+    assert process.exitcode == 0
+
+    embeddings, stats = cache.encode(["a", "b", "c"], encoder)
+    assert stats["hits"] == 3 and encoder.calls == [["a"]]
+    np.testing.assert_allclose(embeddings, stub_encode(["a", "b", "c"], dim=8), rtol=1e-6)
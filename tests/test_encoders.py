@@ -0,0 +1,97 @@
+# ONNX 인코더: 평균 풀링·L2 정규화가 sentence-transformers(torch)와 같은지 확인
+# (일치도 테스트는 onnxruntime이 없으면 건너뜀)
+
+import importlib.util
+import os
+import types
+
+import numpy as np
+import pytest
+
+import encoders
+from encoders import OnnxEncoder
+
+requires_onnxruntime = pytest.mark.skipif(importlib.util.find_spec("onnxruntime") is None, reason="onnxruntime 없음")
+
+DIMENSION = 8
+PAD_ID = 0
+
+
+class _FakeTokenizer:
+    """단어마다 id 하나, 배치에서 가장 긴 문장에 맞춰 PAD_ID로 채움 (tokenizers.Tokenizer.encode_batch와 같은 모양)."""
+
+    def encode_batch(self, sentences):
+        ids = [[1 + sum(map(ord, word)) % 97 for word in sentence.split()] for sentence in sentences]
+        width = max(map(len, ids))
+        return [
+            types.SimpleNamespace(
+                ids=row + [PAD_ID] * (width - len(row)),
+                attention_mask=[1] * len(row) + [0] * (width - len(row)),
+                type_ids=[0] * width,
+            )
+            for row in ids
+        ]
+
+
+class _FakeSession:
+    """토큰 id별 고정 벡터를 last_hidden_state로 돌려줌. 패딩 위치에는 큰 값을 넣어 마스크가 빠지면 드러나게 함."""
+
+    def __init__(self):
+        self.table = np.random.default_rng(0).standard_normal((100, DIMENSION)).astype(np.float32)
+        self.table[PAD_ID] = 1000.0
+
+    def run(self, output_names, feeds):
+        return [self.table[feeds["input_ids"]]]
+
+
+def _encoder(pooling="mean"):
+    encoder = object.__new__(OnnxEncoder)
+    encoder.pooling = pooling
+    encoder.dimension = DIMENSION
+    encoder.tokenizer = _FakeTokenizer()
+    encoder.session = _FakeSession()
+    encoder.input_names = {"input_ids", "attention_mask", "token_type_ids"}
+    return encoder
+
+
+# sentence-transformers Pooling(mean) + Normalize와 같은 계산 (문장 하나씩, 패딩 없이)
+def _reference(encoder, sentence):
+    encoding = encoder.tokenizer.encode_batch([sentence])[0]
+    hidden = encoder.session.table[encoding.ids]
+    if encoder.pooling == "mean":
+        vector = hidden.mean(axis=0)
+    else:
+        vector = hidden[0]
+    return vector / max(np.linalg.norm(vector), 1e-12)
+
+
+SENTENCES = ["안녕하세요", "오늘 촬영할 대본입니다", "카메라를 보면서 자연스럽게 웃어 주시면 됩니다", "네"]
+
+
+@requires_onnxruntime
+@pytest.mark.parametrize("pooling", ["mean", "cls"])
+def test_pooling_and_normalisation_match_reference(pooling):
+    encoder = _encoder(pooling)
+    # 배치 크기 2: 길이가 다른 문장이 같은 배치에서 패딩되어도 결과는 문장 하나씩 계산한 것과 같아야 함
+    embeddings = encoder.encode(SENTENCES, batch_size=2, normalize_embeddings=True)
+    expected = np.stack([_reference(encoder, sentence) for sentence in SENTENCES])
+    np.testing.assert_allclose(embeddings, expected, rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-5)
+
+
+@requires_onnxruntime
+def test_exported_model_matches_torch():
+    # 실제 모델끼리 비교: torch와 내보낸 ONNX 모델이 모두 로컬에 있을 때만 (내려받거나 내보내지 않음)
+    pytest.importorskip("tokenizers")
+    pytest.importorskip("sentence_transformers")
+    directory = encoders.model_directory()
+    if not os.path.exists(os.path.join(directory, "model.onnx")):
+        pytest.skip("내보낸 ONNX 모델이 없습니다 (python encoders.py export --backend onnx)")
+    cosines, adjacent_error = encoders.check_agreement("onnx", encoders.CHECK_SENTENCES)
+    assert cosines.min() >= encoders.DEFAULT_MIN_COSINE
+    assert adjacent_error < 0.02
+
+
+def test_missing_export_fails_fast(tmp_path):
+    with pytest.raises(FileNotFoundError, match="encoders.py export"):
+        encoders.load_encoder("onnx-int8", export_dir=str(tmp_path))
@@ -0,0 +1,95 @@
+# JobQueue: 진행 상황 보고, 실패 전달, 동시 실행 상한과 대기열, 완료 작업 정리, 프로세스 풀 실행
+
+import math
+import threading
+import time
+
+import pytest
+
+from jobs import DONE, FAILED, QUEUED, RUNNING, JobQueue
+
+
+def _wait(queue, job_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not queue.get(job_id).finished:
+        assert time.monotonic() < deadline, queue.get(job_id)
+        time.sleep(0.005)
+    return queue.get(job_id)
+
+
+def test_progress_is_visible_while_running():
+    queue = JobQueue(max_workers=1)
+    step = threading.Event()
+    resume = threading.Event()
+
+    def render(job, slides):
+        job.report(total=slides, stage="render")
+        for done in range(1, slides + 1):
+            if done == 3:
+                step.set()
+                resume.wait(5)
+            job.report(done=done)
+        job.report(stage="save")
+        return f"{slides}장"
+
+    job_id = queue.submit(render, 5)
+    assert step.wait(5)
+    job = queue.get(job_id)
+    assert (job.status, job.stage, job.done, job.total) == (RUNNING, "render", 2, 5)
+    assert job.fraction == pytest.approx(0.4)
+    resume.set()
+
+    job = _wait(queue, job_id)
+    assert (job.status, job.stage, job.done, job.result, job.error) == (DONE, "save", 5, "5장", None)
+    assert job.submitted_at <= job.started_at <= job.finished_at
+
+
+def test_errors_are_kept_on_the_job():
+    queue = JobQueue(max_workers=1)
+    error = ValueError("지원하지 않는 파일 형식입니다")
+
+    def fail(job):
+        job.report(1, 4, "split")
+        raise error
+
+    job = _wait(queue, queue.submit(fail))
+    assert job.status == FAILED and job.error is error and job.result is None
+    assert (job.stage, job.done, job.total) == ("split", 1, 4)
+    # 실패한 작업 뒤의 작업도 계속 실행
+    assert _wait(queue, queue.submit(lambda job: "ok")).result == "ok"
+
+
+def test_workers_limit_and_queue_depth():
+    queue = JobQueue(max_workers=2)
+    release = threading.Event()
+    job_ids = [queue.submit(lambda job: release.wait(5)) for _ in range(4)]
+    deadline = time.monotonic() + 5
+    while queue.stats()["running"] < 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    assert queue.stats() == {"queued": 2, "running": 2, "max_workers": 2, "finished": 0}
+    assert [queue.get(job_id).status for job_id in job_ids[2:]] == [QUEUED, QUEUED]
+    release.set()
+    for job_id in job_ids:
+        _wait(queue, job_id)
+    assert queue.stats()["finished"] == 4
+
+
+def test_finished_jobs_are_pruned_oldest_first():
+    queue = JobQueue(max_workers=1, max_finished=2)
+    job_ids = []
+    for i in range(4):
+        job_ids.append(queue.submit(lambda job, i=i: i))
+        _wait(queue, job_ids[-1])
+    queue.submit(lambda job: None)  # 제출할 때 정리
+    assert [queue.get(job_id) is not None for job_id in job_ids] == [False, False, True, True]
+    assert queue.get("없는 작업") is None
+
+
+def test_run_in_process():
+    queue = JobQueue(max_workers=1, max_processes=1)
+    try:
+        job = _wait(queue, queue.submit(lambda job: queue.run_in_process(math.factorial, 20)), timeout=60)
+        assert (job.status, job.result) == (DONE, math.factorial(20))
+    finally:
+        queue.process_pool().shutdown()
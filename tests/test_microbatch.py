@@ -0,0 +1,87 @@
+# MicroBatcher: 동시에 들어온 요청을 한 번의 encode_fn 호출로 묶고, 실패는 기다리는 모든 요청에 전달
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from encoders import stub_encode
+from microbatch import MicroBatcher
+
+
+class SlowEncoder:
+    """호출마다 잠시 멈춰, 그동안 다른 요청이 대기열에 쌓이게 합니다."""
+
+    def __init__(self, seconds=0.05, error=None):
+        self.seconds = seconds
+        self.error = error
+        self.calls = []
+
+    def __call__(self, sentences):
+        self.calls.append(list(sentences))
+        time.sleep(self.seconds)
+        if self.error is not None:
+            raise self.error
+        return stub_encode(sentences, dim=8)
+
+
+def _concurrently(batcher, requests):
+    start = threading.Barrier(len(requests))
+
+    def encode(sentences):
+        start.wait()
+        return batcher.encode(sentences)
+
+    with ThreadPoolExecutor(len(requests)) as pool:
+        futures = [pool.submit(encode, sentences) for sentences in requests]
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_concurrent_requests_share_batches():
+    encoder = SlowEncoder()
+    batcher = MicroBatcher(encoder, max_batch=1000, max_wait=0.05)
+    requests = [[f"문장 {i}", f"문장 {i + 1}", "공통 문장"] for i in range(16)]
+    results = _concurrently(batcher, requests)
+
+    for sentences, embeddings in zip(requests, results):
+        np.testing.assert_allclose(embeddings, stub_encode(sentences, dim=8), rtol=1e-6)
+    stats = batcher.stats()
+    assert stats["requests"] == 16 and stats["sentences"] == 48
+    assert stats["batches"] == len(encoder.calls) < 16
+    assert stats["encoded"] < stats["sentences"]  # 같은 배치 안의 겹치는 문장은 한 번만
+    assert all(len(call) == len(set(call)) for call in encoder.calls)
+
+
+def test_max_batch_limits_batch_size():
+    encoder = SlowEncoder(seconds=0.01)
+    batcher = MicroBatcher(encoder, max_batch=4, max_wait=0.05)
+    _concurrently(batcher, [[f"문장 {i}", f"다른 {i}"] for i in range(8)])
+    assert all(len(call) <= 4 for call in encoder.calls)
+    assert sum(len(call) for call in encoder.calls) == 16
+
+
+def test_encoder_error_reaches_every_waiting_request():
+    error = RuntimeError("모델 오류")
+    encoder = SlowEncoder(error=error)
+    batcher = MicroBatcher(encoder, max_batch=1000, max_wait=0.05)
+    results = _concurrently(batcher, [[f"문장 {i}"] for i in range(8)])
+    assert all(result is error for result in results)
+    assert batcher.stats()["batches"] == 0
+
+    # 실패한 뒤에도 배처 스레드는 계속 요청을 처리
+    encoder.error = None
+    np.testing.assert_allclose(batcher.encode(["다시"]), stub_encode(["다시"], dim=8), rtol=1e-6)
+
+
+def test_empty_request_does_not_call_encoder():
+    encoder = SlowEncoder()
+    assert MicroBatcher(encoder).encode([]).shape == (0, 0)
+    assert encoder.calls == []
+
+
+@pytest.mark.parametrize("sentences", [["하나"], ["하나", "하나", "둘"]])
+def test_single_request_keeps_order_and_duplicates(sentences):
+    embeddings = MicroBatcher(SlowEncoder(seconds=0)).encode(sentences)
+    np.testing.assert_allclose(embeddings, stub_encode(sentences, dim=8), rtol=1e-6)
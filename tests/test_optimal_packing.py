@@ -0,0 +1,28 @@
+# 최적 분할 모드: 긴 단어를 자른 단위를 다시 이어 붙일 때 단어 중간에 공백이 생기지 않는지 확인
+
+import random
+
+from ppt_core import _line_units, split_and_group_text_optimal
+
+WORDS = ["가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허", "안녕", "Hello", "끝.", "그리고,", "정말!", "v2.0"]
+
+
+def test_unit_text_keeps_split_word_intact(estimated_widths):
+    units = _line_units("가" * 25 + " 끝. 다음 문장입니다. 셋째 문장.", 3, 10)
+    text, wrapped, kind, separator = units[0]
+    assert text == "가" * 25 + " 끝."
+    assert len(wrapped) == 3 and kind == "line"
+    # 한 줄짜리 묶음으로 잘리면 다음 묶음은 단어 중간부터라 구분자 없이 붙음
+    chunks = _line_units("가" * 25 + " 끝.", 1, 10)
+    assert [separator for *_, separator in chunks] == [" ", "", ""]
+    assert "".join(separator + text for text, *_, separator in chunks).strip() == "가" * 25 + " 끝."
+
+
+def test_slides_keep_text_and_line_limit(estimated_widths):
+    rng = random.Random(7)
+    for _ in range(300):
+        line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 30)))
+        max_lines, max_chars = rng.choice([(1, 10), (2, 10), (3, 12), (4, 18)])
+        slides = split_and_group_text_optimal(line + "\n" + line, max_lines, max_chars)
+        assert all(slide.line_count <= max_lines for slide in slides)
+        assert "".join("".join(slide.lines) for slide in slides).replace(" ", "") == (line * 2).replace(" ", "")
@@ -0,0 +1,113 @@
+# readers.py 형식별 읽기 함수가 tests/data/readers/의 예제 파일에서 기대한 문단을 내보내는지 확인
+# (바이너리 예제는 tests/make_reader_fixtures.py로 만듦)
+
+import importlib.util
+import io
+import os
+
+import pytest
+
+import readers
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "readers")
+
+TXT_PARAGRAPHS = ["안녕하세요, 오늘 촬영할 대본입니다.", "", "두 번째 문단은 조금 더 깁니다.", "마지막 줄"]
+
+
+def _path(name):
+    return os.path.join(DATA_DIR, name)
+
+
+@pytest.mark.parametrize("name, encoding", [
+    ("script.txt", "utf-8"),
+    ("script_cp949.txt", "cp949"),
+    ("script_utf16.txt", "utf-16"),
+])
+def test_txt_encoding_detection(name, encoding):
+    with open(_path(name), "rb") as f:
+        assert readers._detect_encoding(f.read()) == encoding
+    # \r\n 줄 끝은 떼고, 빈 줄도 문단으로 그대로 내보냄
+    assert list(readers.iter_paragraphs(_path(name))) == TXT_PARAGRAPHS
+
+
+def test_utf8_bom_and_cut_multibyte_char():
+    text = "대본".encode("utf-8")
+    assert readers._detect_encoding(b"\xef\xbb\xbf" + text) == "utf-8-sig"
+    # 판별용 앞부분이 글자 중간에서 잘려도 UTF-8로 봄
+    assert readers._detect_encoding(text[:-1]) == "utf-8"
+    assert list(readers.iter_paragraphs_from_txt(io.BytesIO(b"\xef\xbb\xbf" + text + b"\n"))) == ["대본"]
+
+
+def test_sources_read_the_same():
+    with open(_path("script_cp949.txt"), "rb") as f:
+        data = f.read()
+        f.seek(0)
+        from_file = list(readers.iter_paragraphs(f, reader="txt"))
+    assert from_file == list(readers.iter_paragraphs(io.BytesIO(data), reader="txt")) == TXT_PARAGRAPHS
+    assert list(readers.iter_paragraphs(io.BytesIO(b""), reader="txt")) == []
+
+
+def test_markdown_strips_markup():
+    assert list(readers.iter_paragraphs(_path("script.md"))) == [
+        "영상 대본",
+        "",
+        "오늘은 새 제품을 꼭 소개합니다. 자세한 내용은 홈페이지에서 보세요.",
+        "",
+        "첫째, 설치가 쉽습니다.",
+        "둘째, 비싸지 않습니다.",
+        "인용한 말입니다.",
+        "끝낸 일",
+        "",
+        "",  # 코드 블록 울타리는 빈 줄
+        'print("코드")',
+        "",
+        "",  # 구분선도 빈 줄
+        "파일 이름은 snake_case_name 그대로, 굵게 표시는 뗍니다. 그림 설명",
+    ]
+
+
+def test_srt_drops_numbers_timestamps_and_tags():
+    assert list(readers.iter_paragraphs(_path("script.srt"))) == [
+        "안녕하세요, 여러분",
+        "오늘 촬영할 대본입니다.",
+        "마지막 인사",
+        "번호와 시간 줄이 없는 구간",
+    ]
+
+
+def test_hwpx_sections_in_order_top_level_paragraphs_only():
+    assert list(readers.iter_paragraphs(_path("script.hwpx"))) == [
+        "첫 문단입니다.",
+        "앞\t뒤이어서\n다음 줄",
+        "표 뒤",
+        "",
+        "둘째 구역",
+        "열째 구역",  # section10은 section2 뒤 (이름 순서가 아닌 번호 순서)
+    ]
+
+
+def test_hwp_record_parser():
+    with open(_path("section.hwprec"), "rb") as f:
+        paragraphs = list(readers._iter_hwp_section_paragraphs(f.read()))
+    assert paragraphs[:4] == [
+        "첫 문단입니다.",
+        "앞\t뒤\n다음 줄-하이픈 묶음 빈칸",
+        "표 뒤",  # 표 제어 문자(8글자)는 건너뛰고 표 안 문단은 제외
+        "",
+    ]
+    assert paragraphs[4] == "긴 문단 " + "가" * 3000  # 확장 크기 헤더 레코드
+    assert len(paragraphs) == 5
+
+
+@pytest.mark.skipif(importlib.util.find_spec("olefile") is not None, reason="olefile이 설치되어 있음")
+def test_hwp_without_olefile_explains():
+    with pytest.raises(ValueError, match="olefile"):
+        list(readers.iter_paragraphs(io.BytesIO(b""), reader="hwp"))
+
+
+def test_iter_lines_and_reader_lookup():
+    assert list(readers.iter_lines(_path("script.txt"))) == ["안녕하세요, 오늘 촬영할 대본입니다.", "두 번째 문단은 조금 더 깁니다.", "마지막 줄"]
+    assert readers.reader_name("대본.SRT") == "srt"
+    assert readers.reader_name("대본.pdf") is None
+    with pytest.raises(ValueError, match="지원하지 않는"):
+        readers.get_reader(filename="대본.pdf")
@@ -0,0 +1,48 @@
+# create_ppt와 create_ppt_from_template이 같은 글자를 같은 서식으로 그리는지 확인
+# (template.pptx는 테마 글꼴이 맑은 고딕이라, 글꼴을 테마에 맡긴 도형은 실제로 보이는 글꼴로 비교)
+
+import pytest
+
+import ai_core
+import ppt_core
+from ppt_core import create_ppt, create_ppt_from_template, split_and_group_text
+
+
+# 슬라이드마다 문단별 (글자, 보이는 글꼴, 크기, 굵게) 목록 (ppt_core는 서식을 문단 기본값으로 지정)
+def _paragraphs(prs):
+    theme_font = ppt_core._theme_font(prs)
+    return [
+        [
+            (paragraph.text, paragraph.font.name or theme_font, paragraph.font.size, paragraph.font.bold)
+            for shape in slide.shapes if shape.has_text_frame
+            for paragraph in shape.text_frame.paragraphs if paragraph.text  # 빈 문단은 그려지는 글자가 없음
+        ]
+        for slide in prs.slides
+    ]
+
+
+@pytest.fixture(scope="module")
+def slides():
+    text = "안녕하세요, 오늘 촬영할 대본입니다.\n" + " ".join(["띄어쓰기없이아주길게이어지는단어"] * 6) + "\n끝 인사입니다."
+    return split_and_group_text(text, 2, 12)
+
+
+def test_template_mode_matches_shapes_mode(slides):
+    prs = create_ppt(slides)
+    paragraphs = _paragraphs(prs)
+    assert paragraphs == _paragraphs(create_ppt_from_template(slides))
+    # '확인 필요!'와 '끝'은 create_ppt에서 글꼴을 테마에 맡김 (기존 출력 그대로)
+    marks = [paragraph for slide in paragraphs for paragraph in slide if paragraph[0] in ("확인 필요!", "끝")]
+    assert {paragraph[0] for paragraph in marks} == {"확인 필요!", "끝"}
+    assert all(paragraph[1] == ppt_core._default_theme_font() for paragraph in marks)
+    explicit = {
+        paragraph.font.name
+        for slide in prs.slides for shape in slide.shapes if shape.has_text_frame
+        for paragraph in shape.text_frame.paragraphs if paragraph.text in ("확인 필요!", "끝")
+    }
+    assert explicit == {None}
+
+
+def test_ai_core_shares_marker_shapes():
+    assert ai_core.add_end_mark is ppt_core.add_end_mark
+    assert ai_core.add_check_needed_shape is ppt_core.add_check_needed_shape
@@ -0,0 +1,62 @@
+# revise_deck: 이전 덱을 고쳐 쓴 결과가 write_deck으로 처음부터 만든 덱과 같은지 확인
+# (revise_deck은 zipfile 내부 목록을 직접 고쳐 압축된 항목을 옮기므로, zipfile이 바뀌면 여기서 먼저 드러나야 함)
+
+import io
+import zipfile
+
+import pytest
+
+from deck_writer import revise_deck, slide_manifest, write_deck
+from ppt_core import Slide
+
+BASE = [Slide([f"{i}번째 장면입니다", "카메라를 보고 말합니다"], needs_check=i == 3) for i in range(1, 9)]
+EXTRA = Slide(["새로 넣은 장면"])
+
+
+def _with_typo(slides):
+    slides = list(slides)
+    slides[4] = Slide(["5번째 장면이니다", "카메라를 보고 말합니다"])
+    return slides
+
+
+# 이름 → (이전 슬라이드, 새 슬라이드, 새로 만들어야 하는 슬라이드 위치)
+CASES = {
+    "unchanged": (BASE, BASE, []),
+    "insert": (BASE, BASE[:3] + [EXTRA] + BASE[3:], [3]),
+    "delete": (BASE, BASE[:2] + BASE[3:], []),
+    "typo": (BASE, _with_typo(BASE), [4]),
+    # 끝 표시가 옮겨 가므로 이전 마지막 슬라이드도 새로 만듦
+    "append": (BASE, BASE + [EXTRA], [7, 8]),
+    "prepend": (BASE, [EXTRA] + BASE, [0]),
+    # 가장 긴 일치 구간(이전 앞 네 장)만 번호를 고쳐 재사용하고, 앞으로 온 네 장과 새 마지막 슬라이드는 새로 만듦
+    "reorder": (BASE, BASE[4:] + BASE[:4], [0, 1, 2, 3, 7]),
+    "delete_last": (BASE, BASE[:-1], [6]),
+    "empty_to_slides": ([], BASE[:3], [0, 1, 2]),
+    "slides_to_empty": (BASE, [], []),
+}
+
+
+def _deck(slides):
+    out = io.BytesIO()
+    write_deck(slides, out)
+    return out.getvalue()
+
+
+def _members(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.testzip() is None  # 옮겨 쓴 항목의 CRC·크기도 맞아야 함
+        return [(info.filename, zf.read(info)) for info in zf.infolist()]
+
+
+@pytest.mark.parametrize("use_manifest", [True, False], ids=["manifest", "parse"])
+@pytest.mark.parametrize("name", list(CASES))
+def test_revise_matches_write_deck(name, use_manifest):
+    old_slides, new_slides, expected_restamped = CASES[name]
+    out = io.BytesIO()
+    manifest = slide_manifest(old_slides) if use_manifest else None
+    restamped = revise_deck(io.BytesIO(_deck(old_slides)), new_slides, out, manifest=manifest)
+
+    revised, expected = _members(out.getvalue()), _members(_deck(new_slides))
+    assert [member for member, _ in revised] == [member for member, _ in expected]
+    assert revised == expected
+    assert restamped == expected_restamped
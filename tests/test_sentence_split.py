@@ -0,0 +1,69 @@
+# SentenceSplitter: 문단별 메모, 바뀐 문단만 한 번의 kss 호출, LRU 크기 제한 (kss 대신 호출을 기록하는 가짜 모듈)
+
+import re
+import sys
+import types
+
+import pytest
+
+from sentence_split import SentenceSplitter
+
+
+def _split(text):
+    return [sentence for sentence in re.split(r"(?<=[.?!])\s+", text.strip()) if sentence]
+
+
+@pytest.fixture
+def kss_calls(monkeypatch):
+    """kss.split_sentences와 같은 모양(문자열 → 문장 목록, 목록 → 문단별 문장 목록)으로 분할하고 인자를 기록합니다."""
+    calls = []
+
+    def split_sentences(text):
+        calls.append(text)
+        return [_split(paragraph) for paragraph in text] if isinstance(text, list) else _split(text)
+
+    monkeypatch.setitem(sys.modules, "kss", types.SimpleNamespace(split_sentences=split_sentences))
+    return calls
+
+
+def test_batches_missing_paragraphs_once(kss_calls):
+    splitter = SentenceSplitter()
+    paragraphs = ["첫 문장. 둘째 문장!", "셋째 문장?", "첫 문장. 둘째 문장!"]
+    assert splitter.split(paragraphs) == [["첫 문장.", "둘째 문장!"], ["셋째 문장?"], ["첫 문장.", "둘째 문장!"]]
+    assert kss_calls == [["첫 문장. 둘째 문장!", "셋째 문장?"]]  # 중복 문단은 한 번만, 한 번의 목록 호출
+    assert (splitter.hits, splitter.misses) == (0, 2)  # 같은 호출 안의 중복은 적중이 아님
+
+
+def test_memo_skips_kss_for_unchanged_paragraphs(kss_calls):
+    splitter = SentenceSplitter()
+    splitter.split(["가. 나.", "다."])
+    result = splitter.split(["가. 나.", "라. 마.", "다."])
+    assert result == [["가.", "나."], ["라.", "마."], ["다."]]
+    # 바뀐 문단이 하나면 문자열로 넘김 (kss는 원소 하나짜리 목록에 평평한 목록을 돌려주므로)
+    assert kss_calls[1:] == ["라. 마."]
+    assert splitter.split(["다.", "가. 나."]) == [["다."], ["가.", "나."]]
+    assert len(kss_calls) == 2
+    assert (splitter.hits, splitter.misses) == (4, 3)
+
+
+def test_results_are_copies(kss_calls):
+    splitter = SentenceSplitter()
+    splitter.split(["가. 나."])[0].append("바뀐 문장")
+    assert splitter.split(["가. 나."]) == [["가.", "나."]]
+
+
+def test_lru_evicts_least_recently_used(kss_calls):
+    splitter = SentenceSplitter(maxsize=2)
+    splitter.split(["가.", "나."])
+    splitter.split(["가."])  # 가가 가장 최근
+    splitter.split(["다."])  # 나를 밀어냄
+    kss_calls.clear()
+    splitter.split(["가.", "다."])
+    assert kss_calls == []
+    splitter.split(["나."])
+    assert kss_calls == ["나."]
+
+
+def test_empty_input_does_not_import_kss(monkeypatch):
+    monkeypatch.setitem(sys.modules, "kss", None)  # import하면 ImportError
+    assert SentenceSplitter().split([]) == []
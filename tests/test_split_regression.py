@@ -0,0 +1,43 @@
+# split_and_group_text 회귀 테스트: baseline(cf9453d) 분할 결과를 고정한 코퍼스와 비교
+# (코퍼스 생성 방법은 tests/make_split_corpus.py 참고)
+
+import json
+import os
+
+import pytest
+
+from ppt_core import IncrementalSplitter, split_and_group_text
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "split_corpus.json")
+
+with open(CORPUS_PATH, encoding="utf-8") as f:
+    CORPUS = json.load(f)
+
+
+def _as_lists(slides):
+    return [list(slide.lines) for slide in slides], [slide.needs_check for slide in slides]
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[f"case{i}" for i in range(len(CORPUS))])
+def test_matches_baseline(case, estimated_widths):
+    slides = split_and_group_text(case["text"], case["max_lines"], case["max_chars"])
+    assert _as_lists(slides) == (case["slides"], case["needs_check"])
+
+
+@pytest.mark.parametrize("case", CORPUS[:10], ids=[f"case{i}" for i in range(10)])
+def test_incremental_matches_baseline(case, estimated_widths):
+    # 한 줄씩 입력하는 것처럼 갱신해도 마지막 결과는 한 번에 분할한 것과 같아야 함
+    splitter = IncrementalSplitter(case["max_lines"], case["max_chars"])
+    lines = case["text"].split("\n")
+    for end in range(1, len(lines) + 1):
+        slides = splitter.update("\n".join(lines[:end]))
+    assert _as_lists(slides) == (case["slides"], case["needs_check"])
+
+
+def test_flag_shift_after_empty_slide_is_kept(estimated_widths):
+    # baseline은 빈 슬라이드를 거른 뒤 분할 여부 목록을 뒤에서 잘라, 빈 슬라이드 뒤의 플래그가 한 칸씩 앞당겨짐:
+    # 강제 분할된 첫 조각은 False, 강제 분할과 무관한 마지막 슬라이드가 True
+    text = " ".join(["가나다라마바사아자차카타파하"] * 6) + "\n끝 인사입니다."
+    slides = split_and_group_text(text, 1, 10)
+    assert [slide.needs_check for slide in slides] == [False, True, True]
+    assert slides[-1].lines == ("끝 인사입니다.",)
@@ -0,0 +1,89 @@
+# Word 스트리밍 읽기: iter_paragraphs_from_word/iter_lines_from_word가 python-docx 추출과 같은 결과를 내고,
+# 그 줄로 분할(한 번에, 줄 단위 스트리밍, IncrementalSplitter 편집 갱신)해도 전체 분할과 같은지 무작위 문서로 확인
+
+import io
+import random
+
+import docx
+import pytest
+
+from make_split_corpus import make_inputs
+from ppt_core import (
+    IncrementalSplitter,
+    extract_text_from_word,
+    iter_lines_from_word,
+    iter_paragraphs_from_word,
+    iter_split_and_group_text,
+    split_and_group_text,
+)
+
+CASES = make_inputs(count=12, seed=7)
+
+
+def _docx_bytes(paragraphs, rng=None):
+    doc = docx.Document()
+    for i, text in enumerate(paragraphs):
+        paragraph = doc.add_paragraph()
+        # 문단 안에서 run을 여러 개로 나누고, 가끔 줄바꿈·탭을 섞음
+        pieces = text.split(" ")
+        for j, piece in enumerate(pieces):
+            run = paragraph.add_run(piece + (" " if j < len(pieces) - 1 else ""))
+            if rng is not None and rng.random() < 0.05:
+                run.add_break()
+            if rng is not None and rng.random() < 0.03:
+                run.add_tab()
+        if rng is not None and i % 5 == 4:
+            doc.add_table(rows=1, cols=1).cell(0, 0).text = "표 안 문단"  # 본문 바로 아래가 아니므로 제외
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+def _as_lists(slides):
+    return [list(slide.lines) for slide in slides], [slide.needs_check for slide in slides]
+
+
+def test_paragraphs_match_python_docx():
+    data = _docx_bytes(["첫 문단", "", "  앞뒤 공백  ", "줄바꿈 있는 문단", "탭 있는 문단"])
+    doc = docx.Document(io.BytesIO(data))
+    doc.paragraphs[3].runs[0].add_break()
+    doc.paragraphs[4].runs[0].add_tab()
+    out = io.BytesIO()
+    doc.save(out)
+    assert list(iter_paragraphs_from_word(io.BytesIO(out.getvalue()))) == [p.text for p in docx.Document(out).paragraphs]
+
+
+@pytest.mark.parametrize("index", range(len(CASES)))
+def test_streamed_lines_split_like_full_text(index, estimated_widths):
+    case = CASES[index]
+    rng = random.Random(index)
+    data = _docx_bytes(case["text"].split("\n"), rng)
+    text = extract_text_from_word(io.BytesIO(data))
+    lines = list(iter_lines_from_word(io.BytesIO(data)))
+    assert lines == text.split("\n")
+
+    full = _as_lists(split_and_group_text(text, case["max_lines"], case["max_chars"]))
+    streamed = iter_split_and_group_text(iter_lines_from_word(io.BytesIO(data)), case["max_lines"], case["max_chars"])
+    assert _as_lists(list(streamed)) == full
+
+
+@pytest.mark.parametrize("index", range(len(CASES)))
+def test_incremental_edits_match_full_split(index, estimated_widths):
+    case = CASES[index]
+    rng = random.Random(100 + index)
+    lines = list(iter_lines_from_word(io.BytesIO(_docx_bytes(case["text"].split("\n"), rng))))
+    pool = [line for other in CASES for line in other["text"].split("\n")]
+    splitter = IncrementalSplitter(case["max_lines"], case["max_chars"])
+    for _ in range(25):
+        # 대본을 편집하듯 줄을 고치거나 넣거나 지우고, 매번 한 번에 분할한 결과와 비교
+        edit = rng.random()
+        position = rng.randint(0, len(lines))
+        if edit < 0.4 and position < len(lines):
+            lines[position] = rng.choice(pool)
+        elif edit < 0.7 or not lines:
+            lines.insert(position, rng.choice(pool))
+        else:
+            del lines[min(position, len(lines) - 1)]
+        text = "\n".join(lines)
+        slides = splitter.update(text)
+        assert _as_lists(slides) == _as_lists(split_and_group_text(text, case["max_lines"], case["max_chars"]))
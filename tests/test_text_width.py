@@ -0,0 +1,76 @@
+# text_width: 추정 너비 표, 전각 글자, 표시 너비 기준 줄바꿈 (textwrap과 일부러 다른 긴 단어 처리 포함)
+
+import textwrap
+
+import pytest
+
+from text_width import (
+    BODY_FONT,
+    FULL_WIDTH,
+    count_lines,
+    estimate_char_width,
+    text_width,
+    width_table,
+    wrap_paragraphs,
+    wrap_text,
+)
+
+pytestmark = pytest.mark.usefixtures("estimated_widths")
+
+
+@pytest.mark.parametrize("char, width", [
+    ("가", FULL_WIDTH),  # 한글
+    ("漢", FULL_WIDTH),  # 한자
+    ("Ａ", FULL_WIDTH),  # 전각 영문
+    ("😀", FULL_WIDTH),  # 이모지 (BMP 밖)
+    ("★", FULL_WIDTH),  # 기호
+    (" ", 300),
+    ("i", 250),
+    ("a", 520),
+    ("A", 640),
+    ("7", 560),
+    (",", 320),
+    ("\u0301", 0),  # 결합 문자
+    ("\u200b", 0),  # 폭 없는 공백
+])
+def test_char_widths(char, width):
+    assert text_width(char) == width
+
+
+def test_width_table_matches_estimate():
+    table = width_table(BODY_FONT)
+    assert len(table) == 0x10000
+    for char in "가a A7,.!?ＡＢ\u0301":
+        assert table[ord(char)] == estimate_char_width(char)
+    assert table[0xD800] == 0  # 서로게이트 영역
+    assert text_width("Hi 가나") == 640 + 250 + 300 + 2 * FULL_WIDTH
+
+
+def test_wide_chars_fill_by_width():
+    # 한 줄에 한글 4글자 너비: 한글은 4글자, 영문 소문자는 그보다 많이 들어감
+    assert wrap_text("가나다라 마바사아", 4) == ("가나다라", "마바사아")
+    assert wrap_text("가나다 라마", 4) == ("가나다", "라마")  # 공백 포함 4.3칸이라 넘침
+    assert wrap_text("abcdefg hij", 4) == ("abcdefg", "hij")  # 7 × 520 = 3640 ≤ 4000
+    assert wrap_text("漢字 한자", 5) == ("漢字 한자",)
+
+
+def test_long_word_is_broken_by_width():
+    assert wrap_text("가나다라마바사아자", 4) == ("가나다라", "마바사아", "자")
+    # 마지막 조각은 다음 단어와 같은 줄에 이어질 수 있음
+    assert wrap_text("가나다라마 바", 4) == ("가나다라", "마 바")
+
+
+def test_long_word_starts_a_new_line():
+    # textwrap은 앞 단어 뒤의 남은 자리를 긴 단어의 앞부분으로 채우지만,
+    # 여기서는 긴 단어를 다음 줄에서 시작해 단어가 줄 끝에서 잘리지 않게 함 (의도적인 차이)
+    text = "가 나다라마바사아자"
+    assert wrap_text(text, 4) == ("가", "나다라마", "바사아자")
+    assert textwrap.wrap(text, width=4, break_long_words=True) == ["가 나다", "라마바사", "아자"]
+
+
+def test_paragraphs_and_line_count():
+    text = "가나다라 마바사아\n\n짧은 줄"
+    assert wrap_paragraphs(text, 4) == ["가나다라", "마바사아", "", "짧은 줄"]
+    assert count_lines(text, 4) == 4
+    assert count_lines("", 4) == 1
+    assert wrap_text("   ", 4) == ()
@@ -0,0 +1,95 @@
+# topics.py: 두 주제로 된 합성 대본에서 경계 찾기, 블록 유사도·이웃 응집도를 단순 계산과 비교
+
+import numpy as np
+import pytest
+
+from encoders import stub_encode
+from topics import (
+    LSHIndex,
+    _crossing_pair_counts,
+    block_similarities,
+    neighbor_cohesion,
+    section_titles,
+    segment_topics,
+)
+
+TOPICS = {
+    "요리": ["양파를 잘게 썰어 주세요", "냄비에 물을 붓고 끓입니다", "간장과 설탕을 넣고 졸여요", "불을 줄이고 뚜껑을 덮어요"],
+    "여행": ["공항에서 짐을 부칩니다", "호텔 체크인은 오후 세 시예요", "바닷가를 따라 걸어 봅니다", "기념품 가게에 들렀어요"],
+}
+
+
+def _script(counts):
+    """주제별 문장 수만큼 주제 문장을 돌려 쓴 대본 (문장마다 번호를 붙여 모두 다른 문장)."""
+    sentences = []
+    for topic, count in counts:
+        examples = TOPICS[topic]
+        sentences.extend(f"[{topic}] {examples[i % len(examples)]} ({len(sentences) + 1})" for i in range(count))
+    return sentences
+
+
+def stub_topic_encode(sentences, dim=32):
+    """문장의 주제 방향에 문장별 잡음을 더한 정규화 임베딩 (실제 모델 대신)."""
+    directions = {topic: stub_encode([topic], dim)[0] for topic in TOPICS}
+    vectors = np.stack([directions[sentence[1:3]] for sentence in sentences]) + 0.6 * stub_encode(sentences, dim)
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def test_two_topic_script_splits_between_topics():
+    sentences = _script([("요리", 40), ("여행", 35)])
+    embeddings = stub_topic_encode(sentences)
+    starts = segment_topics(embeddings)
+    assert starts == [40]
+    assert section_titles(embeddings, sentences, starts)[0].startswith("[요리]")
+    assert section_titles(embeddings, sentences, starts)[1].startswith("[여행]")
+    # 블록 유사도만으로도 같은 자리
+    assert segment_topics(embeddings, cohesion_weight=0) == [40]
+
+
+def test_three_sections_and_short_scripts():
+    embeddings = stub_topic_encode(_script([("요리", 30), ("여행", 30), ("요리", 30)]))
+    assert segment_topics(embeddings) == [30, 60]
+    assert segment_topics(embeddings[:20]) == []  # 최소 섹션 길이의 두 배보다 짧음
+    assert segment_topics(stub_topic_encode(_script([("요리", 60)]))) == []
+
+
+@pytest.mark.parametrize("n, window", [(2, 8), (30, 4), (75, 8), (40, 50)])
+def test_block_similarities_match_direct_sums(n, window):
+    embeddings = stub_encode([str(i) for i in range(n)], dim=16)
+    expected = []
+    for gap in range(n - 1):
+        left = embeddings[max(0, gap + 1 - window):gap + 1].sum(axis=0)
+        right = embeddings[gap + 1:gap + 1 + window].sum(axis=0)
+        expected.append(left @ right / (np.linalg.norm(left) * np.linalg.norm(right)))
+    np.testing.assert_allclose(block_similarities(embeddings, window), expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("n, horizon", [(10, 3), (25, 60), (40, 7)])
+def test_crossing_pair_counts(n, horizon):
+    expected = [
+        sum(1 for i in range(g + 1) for j in range(g + 1, n) if j - i <= horizon) for g in range(n - 1)
+    ]
+    assert list(_crossing_pair_counts(n, horizon)) == expected
+
+
+def test_neighbor_cohesion_matches_all_pairs():
+    n, horizon = 30, 6
+    embeddings = stub_topic_encode(_script([("요리", 15), ("여행", 15)]))
+    # 모든 문장을 한 버킷에 넣고 probes를 넉넉히 주면 거리 안의 모든 쌍이 후보
+    index = LSHIndex(embeddings, tables=1)
+    index.codes[:] = 0
+    expected = []
+    for g in range(n - 1):
+        pairs = [(i, j) for i in range(g + 1) for j in range(g + 1, n) if j - i <= horizon]
+        expected.append(sum(max(float(embeddings[i] @ embeddings[j]), 0.0) for i, j in pairs) / len(pairs))
+    cohesion = neighbor_cohesion(embeddings, index, horizon, probes=n)
+    np.testing.assert_allclose(cohesion, expected, atol=1e-5)
+    assert np.argmin(cohesion) == 14  # 주제가 바뀌는 틈에서 가장 낮음
+
+
+def test_lsh_pairs_mostly_within_topic():
+    embeddings = stub_topic_encode(_script([("요리", 40), ("여행", 40)]))
+    i, j = LSHIndex(embeddings, seed=1).candidate_pairs(max_distance=80)
+    assert len(i) and np.all(i < j) and np.all(j - i <= 80)
+    same_topic = (i < 40) == (j < 40)
+    assert same_topic.mean() > 0.9
@@ -0,0 +1,168 @@
+# 표시 너비 기반 줄 수 계산
+#
+# 한글·한자·이모지는 한 글자가 한 칸(전각)이지만 영문·숫자·공백은 그보다 좁습니다.
+# 글자 수 대신 글꼴별 글자 너비(1/1000 em 단위) 표로 줄바꿈해, PPT에 실제로 표시되는 줄 수를 계산합니다.
+# max_chars_per_line은 "한 줄에 들어가는 한글 글자 수"로 해석합니다.
+#
+# fontTools가 설치되어 있고 글꼴 파일을 찾으면 글꼴의 실제 advance width로 표를 만들고,
+# 없으면 유니코드 East Asian Width와 일반적인 고딕체 비율로 추정한 표를 사용합니다.
+
+import os
+import unicodedata
+from array import array
+from functools import lru_cache
+
+FULL_WIDTH = 1000  # 한글 한 글자 너비
+
+BODY_FONT = "Noto Color Emoji"
+FOOTER_FONT = "맑은 고딕"
+
+FONT_FILES = {
+    "맑은 고딕": ["malgun.ttf", "MalgunGothic.ttf"],
+    "Noto Color Emoji": ["NotoColorEmoji.ttf"],
+}
+FONT_DIRS = [
+    os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+]
+
+# 고딕체 영문 글자의 대략적인 너비 (글꼴 파일이 없을 때 사용)
+_NARROW_WIDTHS = {" ": 300, "i": 250, "j": 250, "l": 250, "I": 300, "f": 320, "t": 340, "r": 360}
+_PUNCTUATION_WIDTH = 320
+_DIGIT_WIDTH = 560
+_LOWER_WIDTH = 520
+_UPPER_WIDTH = 640
+
+
+# 글꼴 정보 없이 유니코드 속성만으로 추정한 글자 너비
+def estimate_char_width(char):
+    if char in _NARROW_WIDTHS:
+        return _NARROW_WIDTHS[char]
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return FULL_WIDTH
+    if char.isdigit():
+        return _DIGIT_WIDTH
+    if char.isupper():
+        return _UPPER_WIDTH
+    if char.islower():
+        return _LOWER_WIDTH
+    if unicodedata.category(char) == "So":  # 기호·이모지
+        return FULL_WIDTH
+    return _PUNCTUATION_WIDTH
+
+
+def _find_font_file(font_name):
+    file_names = set(FONT_FILES.get(font_name, []))
+    for directory in FONT_DIRS:
+        if not os.path.isdir(directory):
+            continue
+        for root, _, files in os.walk(directory):
+            for file_name in file_names.intersection(files):
+                return os.path.join(root, file_name)
+    return None
+
+
+# 글꼴 파일의 cmap/hmtx에서 실제 글자 너비를 읽음 (fontTools가 없거나 파일이 없으면 빈 dict)
+def _read_font_widths(font_name):
+    path = _find_font_file(font_name)
+    if path is None:
+        return {}
+    try:
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return {}
+    font = TTFont(path, lazy=True)
+    units_per_em = font["head"].unitsPerEm
+    metrics = font["hmtx"].metrics
+    return {
+        code: round(metrics[glyph][0] * FULL_WIDTH / units_per_em)
+        for code, glyph in font.getBestCmap().items()
+        if code < 0x10000 and glyph in metrics
+    }
+
+
+@lru_cache(maxsize=None)
+def width_table(font_name):
+    """BMP 전체(U+0000~U+FFFF)의 글자 너비 조회 배열을 만듭니다 (글꼴당 한 번)."""
+    table = array("H", (estimate_char_width(chr(code)) if not 0xD800 <= code < 0xE000 else 0 for code in range(0x10000)))
+    font_widths = _read_font_widths(FOOTER_FONT) if font_name == BODY_FONT else {}
+    # 본문 글꼴(이모지)에 없는 한글 등은 PowerPoint가 맑은 고딕으로 대체하므로 그 너비를 먼저 깔고 덮어씀
+    font_widths.update(_read_font_widths(font_name))
+    for code, width in font_widths.items():
+        table[code] = width
+    return table
+
+
+@lru_cache(maxsize=65536)
+def text_width(text, font_name=BODY_FONT):
+    """문자열의 표시 너비 (1/1000 em)."""
+    table = width_table(font_name)
+    return sum(table[code] if code < 0x10000 else FULL_WIDTH for code in map(ord, text))
+
+
+def _break_long_word(word, max_width, font_name):
+    table = width_table(font_name)
+    pieces = []
+    start = 0
+    width = 0
+    for i, char in enumerate(word):
+        code = ord(char)
+        char_width = table[code] if code < 0x10000 else FULL_WIDTH
+        if width + char_width > max_width and i > start:
+            pieces.append(word[start:i])
+            start = i
+            width = 0
+        width += char_width
+    pieces.append(word[start:])
+    return pieces
+
+
+@lru_cache(maxsize=16384)
+def wrap_text(text, max_chars_per_line, font_name=BODY_FONT):
+    """textwrap.wrap(text, width=max_chars_per_line, break_long_words=True)처럼 공백 단위로 줄을 나누되,
+    글자 수 대신 표시 너비를 기준으로 합니다. 결과는 메모되므로 튜플로 반환합니다."""
+    max_width = max_chars_per_line * FULL_WIDTH
+    space_width = text_width(" ", font_name)
+    lines = []
+    current = []
+    current_width = 0
+    for word in text.split():
+        word_width = text_width(word, font_name)
+        if current and current_width + space_width + word_width <= max_width:
+            current.append(word)
+            current_width += space_width + word_width
+            continue
+        if current:
+            lines.append(" ".join(current))
+        if word_width <= max_width:
+            current = [word]
+            current_width = word_width
+        else:
+            # 한 줄보다 긴 단어는 글자 단위로 자르고, 마지막 조각은 다음 단어와 이어 붙일 수 있게 남김
+            *full_lines, last = _break_long_word(word, max_width, font_name)
+            lines.extend(full_lines)
+            current = [last]
+            current_width = text_width(last, font_name)
+    if current:
+        lines.append(" ".join(current))
+    return tuple(lines)
+
+
+def wrap_paragraphs(text, max_chars_per_line, font_name=BODY_FONT):
+    """줄바꿈(\\n)으로 나뉜 각 문단을 표시 너비로 줄바꿈한 전체 줄 목록. 빈 문단은 빈 줄 하나가 됩니다."""
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(wrap_text(paragraph, max_chars_per_line, font_name) if paragraph else ("",))
+    return lines
+
+
+def count_lines(text, max_chars_per_line, font_name=BODY_FONT):
+    """wrap_paragraphs(text, ...)의 줄 수."""
+    return sum(len(wrap_text(paragraph, max_chars_per_line, font_name)) if paragraph else 1 for paragraph in text.split("\n"))
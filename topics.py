@@ -0,0 +1,165 @@
+# 긴 대본의 주제 전환 지점 찾기 (TextTiling 방식, CPU와 NumPy만 사용)
+#
+# 정규화된 문장 임베딩 행렬만 받아, 문장 사이 틈마다 "앞뒤가 같은 주제인 정도"를 두 가지로 잽니다.
+#   1) 블록 유사도: 틈 앞 window개 문장 합과 뒤 window개 문장 합의 코사인 (구간별 누적합으로 한 번에 계산)
+#   2) 이웃 응집도: LSH(무작위 초평면) 색인으로 찾은 비슷한 문장 쌍 가운데 틈을 가로지르는 쌍의 비중
+# 두 점수를 합쳐 골짜기가 깊은 틈을 주제 경계로 고릅니다.
+# 모든 문장 쌍의 유사도 행렬(n²)을 만들지 않으므로 메모리는 문장 수에 비례합니다.
+#
+# 사용 예:
+#   starts = segment_topics(embeddings)          # 두 번째 섹션부터의 시작 문장 위치
+#   titles = section_titles(embeddings, sentences, starts)
+
+from bisect import bisect_left
+
+import numpy as np
+
+DEFAULT_WINDOW = 8  # 블록 유사도에서 틈 앞뒤로 보는 문장 수
+DEFAULT_MIN_SECTION_SENTENCES = 12  # 섹션 하나의 최소 문장 수
+DEFAULT_HORIZON = 60  # 이웃 응집도에서 보는 최대 문장 거리
+_CHUNK_SIZE = 1024  # 한 번에 계산하는 틈(또는 문장 쌍) 수: 임시 배열 크기를 일정하게 유지
+
+
+def block_similarities(embeddings, window=DEFAULT_WINDOW):
+    """틈 g(문장 g와 g+1 사이)마다 앞뒤 window개 문장 블록의 코사인 유사도. 길이 n-1."""
+    n, dim = embeddings.shape
+    scores = np.empty(max(n - 1, 0), dtype=np.float32)
+    for first in range(0, n - 1, _CHUNK_SIZE):
+        gaps = np.arange(first, min(n - 1, first + _CHUNK_SIZE))
+        # 이 구간에 필요한 문장들만 float64로 누적합 (전체 누적합을 들고 있지 않고, 큰 값끼리 빼는 오차도 없음)
+        low = max(0, first + 1 - window)
+        high = min(n, gaps[-1] + 1 + window)
+        prefix = np.zeros((high - low + 1, dim))
+        np.cumsum(embeddings[low:high], axis=0, dtype=np.float64, out=prefix[1:])
+        middle = gaps + 1 - low
+        left = prefix[middle] - prefix[np.maximum(gaps + 1 - window, 0) - low]
+        right = prefix[np.minimum(gaps + 1 + window, n) - low] - prefix[middle]
+        norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+        scores[gaps] = np.einsum("ij,ij->i", left, right) / np.maximum(norms, 1e-12)
+    return scores
+
+
+class LSHIndex:
+    """무작위 초평면 LSH 색인. 코사인 유사도가 높은 두 문장일수록 같은 버킷에 들어갈 확률이 높습니다."""
+
+    def __init__(self, embeddings, tables=8, bits=12, seed=0):
+        n, dim = embeddings.shape
+        planes = np.random.default_rng(seed).standard_normal((dim, tables * bits)).astype(embeddings.dtype)
+        self.codes = np.empty((n, tables), dtype=np.int64)  # 표마다 bits개 부호를 정수 하나로
+        weights = np.int64(1) << np.arange(bits, dtype=np.int64)
+        for first in range(0, n, _CHUNK_SIZE):
+            signs = embeddings[first:first + _CHUNK_SIZE] @ planes > 0
+            self.codes[first:first + _CHUNK_SIZE] = (signs.reshape(-1, tables, bits) * weights).sum(axis=2)
+
+    def candidate_pairs(self, max_distance, probes=4):
+        """같은 버킷에 든 문장 쌍 (i < j, j - i <= max_distance). 버킷 안에서는 위치 순으로 뒤의 probes개만 봅니다."""
+        n = len(self.codes)
+        positions = np.arange(n)
+        keys = []
+        for table_codes in self.codes.T:
+            order = np.lexsort((positions, table_codes))  # 버킷별로, 버킷 안에서는 문장 위치 순
+            codes = table_codes[order]
+            for shift in range(1, probes + 1):
+                same = codes[shift:] == codes[:-shift]
+                i = order[:-shift][same]
+                j = order[shift:][same]
+                near = j - i <= max_distance
+                keys.append(i[near] * n + j[near])
+        keys = np.unique(np.concatenate(keys)) if keys else np.zeros(0, dtype=np.int64)
+        return keys // n, keys % n
+
+
+def neighbor_cohesion(embeddings, index, horizon=DEFAULT_HORIZON, probes=4):
+    """틈마다, 그 틈을 가로지르는 (거리 horizon 이내) 후보 쌍의 유사도 합을 가능한 쌍 수로 나눈 값. 길이 n-1."""
+    n = len(embeddings)
+    i, j = index.candidate_pairs(horizon, probes)
+    weights = np.empty(len(i))
+    for first in range(0, len(i), _CHUNK_SIZE):
+        a, b = i[first:first + _CHUNK_SIZE], j[first:first + _CHUNK_SIZE]
+        weights[first:first + _CHUNK_SIZE] = np.einsum("ij,ij->i", embeddings[a], embeddings[b])
+    weights = np.clip(weights, 0.0, None)
+    # 쌍 (i, j)는 틈 i..j-1을 가로지름: 시작에 더하고 끝에서 빼는 차분 배열로 모든 틈을 한 번에 계산
+    crossing = np.cumsum(np.bincount(i, weights, minlength=n) - np.bincount(j, weights, minlength=n))[:n - 1]
+    return crossing / np.maximum(_crossing_pair_counts(n, horizon), 1)
+
+
+# 틈 g를 가로지르며 거리가 horizon 이내인 문장 쌍 (i <= g < j) 의 수
+def _crossing_pair_counts(n, horizon):
+    g = np.arange(n - 1, dtype=np.int64)
+    first = np.maximum(0, g - horizon + 1)  # 틈을 넘어 닿을 수 있는 가장 앞 문장
+    full_last = np.minimum(g, n - 1 - horizon)  # i + horizon이 마지막 문장을 넘지 않는 가장 뒤 문장
+    full = np.maximum(0, full_last - first + 1)
+    # i가 first..full_last면 짝이 될 수 있는 j는 g+1..i+horizon, 그 뒤의 i는 g+1..n-1
+    full_pairs = full * (horizon - g) + (first + full_last) * full // 2
+    clipped = g - np.maximum(first, full_last + 1) + 1
+    return full_pairs + clipped * (n - 1 - g)
+
+
+def _standardize(values):
+    std = values.std()
+    return (values - values.mean()) / std if std > 0 else np.zeros_like(values)
+
+
+# TextTiling 깊이 점수: 틈에서 왼쪽·오른쪽으로 점수가 오르는 동안 올라간 높이의 합
+def depth_scores(scores):
+    n = len(scores)
+    index = np.arange(n)
+    is_peak = np.ones(n, dtype=bool)
+    is_peak[1:] &= scores[1:] >= scores[:-1]
+    is_peak[:-1] &= scores[:-1] >= scores[1:]
+    is_peak[[0, -1]] = True
+    left_peak = np.maximum.accumulate(np.where(is_peak, index, 0))
+    right_peak = np.minimum.accumulate(np.where(is_peak, index, n - 1)[::-1])[::-1]
+    return scores[left_peak] + scores[right_peak] - 2 * scores
+
+
+def segment_topics(
+    embeddings, window=DEFAULT_WINDOW, min_section_sentences=DEFAULT_MIN_SECTION_SENTENCES,
+    horizon=DEFAULT_HORIZON, cohesion_weight=1.0, seed=0,
+):
+    """주제가 바뀌는 문장 위치 목록 (두 번째 섹션부터의 시작 문장, 오름차순). 첫 섹션은 항상 0에서 시작합니다."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    n = len(embeddings)
+    if n < 2 * min_section_sentences:
+        return []
+
+    scores = _standardize(block_similarities(embeddings, window))
+    if cohesion_weight:
+        cohesion = neighbor_cohesion(embeddings, LSHIndex(embeddings, seed=seed), horizon)
+        scores = scores + cohesion_weight * _standardize(cohesion)
+    scores = np.convolve(scores, np.ones(3) / 3, mode="same")  # 잔물결 제거 (TextTiling 평활화)
+
+    depths = depth_scores(scores)
+    valleys = np.flatnonzero(
+        (depths > 0) & (scores <= np.r_[np.inf, scores[:-1]]) & (scores <= np.r_[scores[1:], np.inf])
+    )
+    if not len(valleys):
+        return []
+    # 대부분의 골짜기는 한 주제 안의 잔물결이므로, 평균보다 표준편차 절반 이상 깊은 것만 후보로 삼음
+    cutoff = depths[valleys].mean() + depths[valleys].std() / 2
+
+    # 깊은 골짜기부터, 이미 고른 경계·대본 양끝과 min_section_sentences 이상 떨어진 것만 채택
+    starts = []
+    for gap in valleys[np.argsort(-depths[valleys], kind="stable")]:
+        if depths[gap] <= cutoff:
+            break
+        start = int(gap) + 1
+        if start < min_section_sentences or n - start < min_section_sentences:
+            continue
+        position = bisect_left(starts, start)
+        if position > 0 and start - starts[position - 1] < min_section_sentences:
+            continue
+        if position < len(starts) and starts[position] - start < min_section_sentences:
+            continue
+        starts.insert(position, start)
+    return starts
+
+
+def section_titles(embeddings, sentences, starts):
+    """섹션마다 중심(평균 임베딩)에 가장 가까운 문장을 제목으로 고릅니다. 첫 섹션 포함, 길이 len(starts) + 1."""
+    bounds = [0, *starts, len(sentences)]
+    titles = []
+    for start, end in zip(bounds, bounds[1:]):
+        block = np.asarray(embeddings[start:end], dtype=np.float32)
+        titles.append(sentences[start + int(np.argmax(block @ block.mean(axis=0)))])
+    return titles